@@ -18,6 +18,17 @@ app = FastAPI(title="Query Execution System API")
 # Define the base directory for scripts
 BASE_DIR = Path("E:/data science tool")  # Changed to correct base directory
 
+# Any variant of the PDF marks question ("total <subject> marks ... in <subject> ... groups A-B")
+MARKS_SUBJECTS = r'(?:maths|physics|english|economics|biology)'
+MARKS_QUESTION_PATTERN = re.compile(
+    r'total\s+' + MARKS_SUBJECTS + r'\s+marks.*\bin\s+' + MARKS_SUBJECTS + r'\b.*\bgroups?\s+\d+',
+    re.IGNORECASE | re.DOTALL
+)
+# Result lines printed by the marks solution: "Total <Subject> marks: N" or "ANSWER: The total <Subject> marks ... is N"
+MARKS_RESULT_PATTERN = re.compile(
+    r'(?:Total (\w+) marks: |The total (\w+) marks of students .*? is )(\d+(?:\.\d+)?)'
+)
+
 # Create a default question mapping if it doesn't exist
 def ensure_question_mapping_exists():
     mapping_path = BASE_DIR / "main" / "question_mapping.json"
@@ -107,11 +118,11 @@ def find_matching_question(user_prompt: str) -> Optional[Dict[str, Any]]:
     
     # Check for direct keywords related to specific tasks
     
-    # Physics marks question (direct check)
-    if any(keyword in clean_prompt for keyword in ["physics marks", "maths", "groups 1-25"]):
+    # PDF marks question, any subject/threshold/group-range variant (direct check)
+    if MARKS_QUESTION_PATTERN.search(clean_prompt) or any(keyword in clean_prompt for keyword in ["physics marks", "maths", "groups 1-25"]):
         for q in QUESTION_MAPPINGS:
-            if "physics" in q.get("question", "").lower() and "maths" in q.get("question", "").lower():
-                print(f"Keyword match found for Physics marks question")
+            if MARKS_QUESTION_PATTERN.search(q.get("question", "")):
+                print(f"Keyword match found for PDF marks question")
                 return q
     
     # VS Code output question
@@ -256,16 +267,19 @@ def format_output(output: str) -> Dict[str, Any]:
     if not output:
         return {"message": "No output generated"}
     
-    # For Physics marks output specifically
-    if "Total Physics marks" in output and "Analysis Results" in output:
-        # Try to extract the result
-        match = re.search(r'Total Physics marks: (\d+)', output)
-        if match:
-            total_marks = match.group(1)
-            return {
-                "total_physics_marks": total_marks,
-                "full_output": output
-            }
+    # For PDF marks output (any subject)
+    match = MARKS_RESULT_PATTERN.search(output)
+    if match:
+        subject = match.group(1) or match.group(2)
+        total_marks = match.group(3)
+        result = {
+            "subject": subject,
+            "total_marks": total_marks,
+            "full_output": output
+        }
+        if subject.lower() == "physics":
+            result["total_physics_marks"] = total_marks
+        return result
     
     # For VS Code stats output specifically
     if "Version:" in output and "Code " in output:
@@ -0,0 +1,18 @@
+import types
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="session")
+def vicky_server():
+    """Load vicky_server.py with the questions database read from the repo root."""
+    pytest.importorskip("requests")
+    source = (ROOT / "vicky_server.py").read_text(encoding="utf-8")
+    source = source.replace('"E:/data science tool/main/grok/vickys.json"', repr((ROOT / "vickys.json").as_posix()))
+    module = types.ModuleType("vicky_server")
+    module.__file__ = str(ROOT / "vicky_server.py")
+    exec(compile(source, module.__file__, "exec"), module.__dict__)
+    return module
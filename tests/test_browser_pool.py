@@ -0,0 +1,153 @@
+import functools
+import shutil
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class FakeDriver:
+    def __init__(self, number):
+        self.number = number
+        self.alive = True
+
+    @property
+    def current_url(self):
+        from selenium.common.exceptions import WebDriverException
+
+        if not self.alive:
+            raise WebDriverException("browser died")
+        return "about:blank"
+
+    def quit(self):
+        self.alive = False
+
+
+@pytest.fixture
+def fake_pool(vicky_server):
+    """A BrowserPool subclass whose _start returns fake drivers."""
+    class FakePool(vicky_server.BrowserPool):
+        def __init__(self, *args, start_delay=0, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.start_delay = start_delay
+            self.started = []
+
+        def _start(self):
+            time.sleep(self.start_delay)
+            driver = FakeDriver(len(self.started))
+            self.started.append(driver)
+            return driver
+
+    return FakePool
+
+
+def test_leases_beyond_size_block_until_released(fake_pool):
+    pytest.importorskip("selenium")
+    pool = fake_pool(size=2)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def callback(driver):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return driver.number
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(pool.run(callback))) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert len(results) == 6 and set(results) == {0, 1}
+    assert peak[0] == 2
+    assert len(pool.started) == 2
+    assert len(pool.idle) == 2
+
+
+def test_discarding_a_browser_wakes_a_waiting_lease(fake_pool):
+    pool = fake_pool(size=1)
+    first = pool._acquire()
+    leased = []
+    waiter = threading.Thread(target=lambda: leased.append(pool._acquire()))
+    waiter.start()
+    time.sleep(0.1)
+    assert waiter.is_alive()
+
+    pool._discard(first)
+    waiter.join(5)
+    assert not waiter.is_alive()
+    assert leased[0] is not first and len(pool.started) == 2
+
+
+def test_dead_browser_is_replaced_and_the_callback_retried(fake_pool):
+    pytest.importorskip("selenium")
+    from selenium.common.exceptions import WebDriverException
+
+    pool = fake_pool(size=1)
+    calls = []
+
+    def callback(driver):
+        calls.append(driver.number)
+        if driver.number == 0:
+            driver.alive = False
+            raise WebDriverException("session deleted")
+        return "ok"
+
+    assert pool.run(callback) == "ok"
+    assert calls == [0, 1]
+    assert [driver.number for driver in pool.drivers] == [1]
+
+
+def test_failed_start_frees_its_slot(fake_pool):
+    pool = fake_pool(size=1)
+    original_start = pool._start
+    attempts = []
+
+    def flaky_start():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("chromedriver not found")
+        return original_start()
+
+    pool._start = flaky_start
+    with pytest.raises(RuntimeError):
+        pool._acquire()
+    assert pool._acquire() is pool.started[0]
+    assert pool.starting == 0
+
+
+def test_browsers_start_outside_the_lock(fake_pool):
+    pool = fake_pool(size=3, start_delay=0.2)
+    start = time.monotonic()
+    threads = [threading.Thread(target=pool._acquire) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert time.monotonic() - start < 0.5
+    assert len(pool.drivers) == 3
+
+
+def test_fetch_html_from_a_static_file_server(vicky_server, tmp_path):
+    pytest.importorskip("selenium")
+    pytest.importorskip("webdriver_manager")
+    if not any(shutil.which(name) for name in ("google-chrome", "chromium", "chromium-browser", "chrome")):
+        pytest.skip("Chrome is not installed")
+
+    (tmp_path / "index.html").write_text('<html><body><p id="ready">Hello</p></body></html>', encoding="utf-8")
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(tmp_path))
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    pool = vicky_server.BrowserPool(size=1)
+    try:
+        html = pool.fetch_html(f"http://127.0.0.1:{httpd.server_address[1]}/index.html", wait_for="#ready")
+        assert "Hello" in html
+    finally:
+        pool.close()
+        httpd.shutdown()
+        httpd.server_close()
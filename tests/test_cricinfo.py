@@ -0,0 +1,66 @@
+import datetime
+from pathlib import Path
+
+import pytest
+
+FIXTURE = Path(__file__).parent / "fixtures" / "cricinfo_odi_batting_page22.html"
+
+
+@pytest.fixture
+def stats_html():
+    return FIXTURE.read_text(encoding="utf-8")
+
+
+def test_counts_ducks_from_the_zero_column(vicky_server, stats_html):
+    pytest.importorskip("lxml")
+    counts = vicky_server.count_ducks_in_stats_html(stats_html)
+    # Two navigation tables, the batting table and a table without a "0" column
+    assert counts == {"tables": 4, "found": True, "ducks": 72}
+
+
+def test_dash_cells_count_as_no_ducks(vicky_server):
+    pytest.importorskip("lxml")
+    html = ('<table class="engineTable"><tr><th>Player</th><th>0</th></tr>'
+            '<tr><td>A</td><td>-</td></tr><tr><td>B</td><td>2</td></tr><tr><td>C</td></tr></table>')
+    assert vicky_server.count_ducks_in_stats_html(html)["ducks"] == 2
+
+
+def test_navigation_tables_without_headers_are_skipped(vicky_server):
+    pytest.importorskip("lxml")
+    html = ('<table class="engineTable"><tr><td>Page 1 of 9</td><td>0</td></tr></table>'
+            '<table class="engineTable wide"><tr><td>Previous</td><td>Next</td></tr></table>')
+    assert vicky_server.count_ducks_in_stats_html(html) == {"tables": 2, "found": False, "ducks": 0}
+
+
+def test_duck_counts_are_cached_per_page_and_date(vicky_server, stats_html, monkeypatch, tmp_path):
+    pytest.importorskip("lxml")
+    fetched = []
+
+    class FakeFetcher:
+        def __init__(self, **options):
+            pass
+
+        def fetch(self, url):
+            fetched.append(url)
+            return stats_html
+
+    monkeypatch.setattr(vicky_server, "PageFetcher", FakeFetcher)
+    monkeypatch.setattr(vicky_server, "_CRICINFO_DUCKS_CACHE", {})
+    monkeypatch.setattr(vicky_server.file_manager, "cache_path",
+                        lambda namespace, key, ext: str(tmp_path / f"{namespace}-{key}{ext}"))
+
+    first = vicky_server.cricinfo_duck_counts(22)
+    assert (first["source"], first["ducks"]) == ("http", 72)
+    assert vicky_server.cricinfo_duck_counts(22)["source"] == "cache"
+    assert len(fetched) == 1
+
+    # The disk cache survives a restart (an empty in-memory cache)
+    monkeypatch.setattr(vicky_server, "_CRICINFO_DUCKS_CACHE", {})
+    assert vicky_server.cricinfo_duck_counts(22) == dict(first, source="cache")
+    assert len(fetched) == 1
+    assert [path.name for path in tmp_path.iterdir()] == [
+        f"cricinfo_ducks-page22-{datetime.date.today().isoformat()}.json"]
+
+    # Another page is a separate entry
+    assert vicky_server.cricinfo_duck_counts(23)["source"] == "http"
+    assert len(fetched) == 2
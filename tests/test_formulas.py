@@ -0,0 +1,57 @@
+import pytest
+
+
+@pytest.mark.parametrize("formula, expected", [
+    ("=SUM(SEQUENCE(3,1,0,0.5))", 1.5),
+    ("=SUM(SEQUENCE(2,3,1,0.25))", 9.75),
+    ("=SUM(DROP(SEQUENCE(3,1,0,0.5),1))", 1.5),
+    ("=AVERAGE(SEQUENCE(4,1,1,0.5))", 1.75),
+    ("=MIN(SEQUENCE(3,2,5,-1.5))", -2.5),
+    ("=MAX(SEQUENCE(3,2,5,-1.5))", 5),
+    ("=SUM(ARRAY_CONSTRAIN(SEQUENCE(100,100,12,10),1,10))", 570),
+    ("=SUM(TAKE(SEQUENCE(10000,10000),-1))", 999950005000),
+])
+def test_closed_form_aggregates(vicky_server, formula, expected):
+    assert vicky_server.evaluate_formula(formula) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("formula", [
+    "SEQUENCE(3,1,0,0.5)",
+    "SEQUENCE(4,3,-2,0.75)",
+    "TRANSPOSE(SEQUENCE(3,5,1,-0.1))",
+    "DROP(SEQUENCE(6,4,2,1.5),2,-1)",
+    "TAKE(SEQUENCE(5,5,0,0.3),-2,3)",
+])
+def test_closed_forms_match_materialized_cells(vicky_server, formula):
+    cells = [cell for row in vicky_server.evaluate_formula("=" + formula) for cell in row]
+    assert vicky_server.evaluate_formula(f"=SUM({formula})") == pytest.approx(sum(cells))
+    assert vicky_server.evaluate_formula(f"=MIN({formula})") == pytest.approx(min(cells))
+    assert vicky_server.evaluate_formula(f"=MAX({formula})") == pytest.approx(max(cells))
+    assert vicky_server.evaluate_formula(f"=COUNT({formula})") == len(cells)
+
+
+@pytest.mark.parametrize("formula, expected", [
+    ("=TAKE(SEQUENCE(4,3),2)", [[1, 2, 3], [4, 5, 6]]),
+    ("=TAKE(SEQUENCE(4,3),-1,-2)", [[11, 12]]),
+    ("=TAKE(SEQUENCE(2,2),5)", [[1, 2], [3, 4]]),
+    ("=DROP(SEQUENCE(4,3),1,1)", [[5, 6], [8, 9], [11, 12]]),
+    ("=DROP(SEQUENCE(4,3),-2,-1)", [[1, 2], [4, 5]]),
+])
+def test_take_and_drop(vicky_server, formula, expected):
+    assert vicky_server.evaluate_formula(formula) == expected
+
+
+@pytest.mark.parametrize("formula, expected", [
+    ("=SORTBY({1,2,3;4,5,6;7,8,9},{3;1;2})", [[4, 5, 6], [7, 8, 9], [1, 2, 3]]),
+    ('=SORTBY({"a","b","c"},{2,3,1},-1)', [["b", "a", "c"]]),
+    ("=SORTBY({1;2;3;4},{1;2;1;2},1,{4;3;2;1},-1)", [[1], [3], [2], [4]]),
+    ("=SORTBY({10;20;30},{1;1;1})", [[10], [20], [30]]),
+    ("=SUM(TAKE(SORTBY(SEQUENCE(1,5),{5,4,3,2,1}),1,2))", 9),
+])
+def test_sortby(vicky_server, formula, expected):
+    assert vicky_server.evaluate_formula(formula) == expected
+
+
+def test_sortby_rejects_mismatched_keys(vicky_server):
+    with pytest.raises(ValueError):
+        vicky_server.evaluate_formula("=SORTBY({1;2;3},{1;2})")
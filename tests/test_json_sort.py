@@ -0,0 +1,87 @@
+import json
+import random
+import tempfile
+
+import pytest
+
+KEYS = ("age", "name")
+
+
+def make_records(count, seed=0):
+    rng = random.Random(seed)
+    # Few distinct keys, so there are plenty of ties; "id" shows the tie order
+    return [{"name": rng.choice(["Alice", "Bob", "Émile", "bob", ""]), "age": rng.randint(0, 5), "id": index}
+            for index in range(count)]
+
+
+@pytest.fixture
+def spill_counter(monkeypatch):
+    runs = []
+    real_temporary_file = tempfile.TemporaryFile
+
+    def counting_temporary_file(*args, **kwargs):
+        runs.append(1)
+        return real_temporary_file(*args, **kwargs)
+
+    monkeypatch.setattr(tempfile, "TemporaryFile", counting_temporary_file)
+    return runs
+
+
+def in_memory(vicky_server, records, keys=KEYS):
+    return "".join(vicky_server.iter_compact_json(vicky_server.sort_json_records(records, keys)))
+
+
+@pytest.mark.parametrize("count", [1, 7, 400])
+def test_external_sort_matches_in_memory_lexsort(vicky_server, spill_counter, count):
+    records = make_records(count)
+    text = json.dumps(records, indent=1)
+    external = "".join(vicky_server.sort_json_array(text, KEYS, memory_budget=4000))
+    assert external == in_memory(vicky_server, records)
+    if count == 400:
+        assert len(spill_counter) > 5
+
+
+def test_ties_keep_input_order_across_runs(vicky_server, spill_counter):
+    records = make_records(300, seed=1)
+    result = json.loads("".join(vicky_server.sort_json_array(json.dumps(records), KEYS, memory_budget=3000)))
+    assert len(spill_counter) > 1
+    assert [record["id"] for record in result] == [
+        record["id"] for record in sorted(records, key=lambda record: (record["age"], record["name"]))]
+
+
+def test_mixed_and_huge_numbers_use_python_ordering(vicky_server, spill_counter):
+    records = [{"age": value, "name": str(index)} for index, value in
+               enumerate([3, 2.5, 2 ** 70, -1, 2.5, 0, -2 ** 65, 1e300, 7] * 20)]
+    external = "".join(vicky_server.sort_json_array(json.dumps(records), KEYS, memory_budget=2000))
+    assert spill_counter
+    assert external == in_memory(vicky_server, records)
+    assert json.loads(external) == sorted(records, key=lambda record: (record["age"], record["name"]))
+
+
+def test_missing_keys_raise_on_both_paths(vicky_server):
+    records = make_records(200) + [{"name": "no age"}]
+    with pytest.raises(KeyError):
+        in_memory(vicky_server, records)
+    with pytest.raises(KeyError):
+        "".join(vicky_server.sort_json_array(json.dumps(records), KEYS, memory_budget=2000))
+
+
+def test_budget_counts_decoded_size(vicky_server, spill_counter):
+    records = make_records(1000)
+    text = json.dumps(records)
+    # The text fits in the budget, but the decoded records do not
+    budget = len(text) * 2
+    assert "".join(vicky_server.sort_json_array(text, KEYS, memory_budget=budget)) == in_memory(vicky_server, records)
+    assert spill_counter
+    assert all(vicky_server._json_value_size(record) > len(json.dumps(record)) for record in records[:10])
+
+
+def test_sorts_a_file_in_memory_and_externally(vicky_server, spill_counter, tmp_path):
+    records = make_records(300, seed=2)
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(records), encoding="utf-8")
+    expected = in_memory(vicky_server, records)
+    assert "".join(vicky_server.sort_json_array(str(path), KEYS)) == expected
+    assert not spill_counter
+    assert "".join(vicky_server.sort_json_array(str(path), KEYS, memory_budget=5000)) == expected
+    assert spill_counter
@@ -0,0 +1,118 @@
+import io
+import random
+import zipfile
+from array import array
+
+import pytest
+
+ENDINGS = [b"\n", b"\r\n", b"\r"]
+
+
+def text_mode_lines(data):
+    """Lines as the old extract-and-open('r') comparison saw them (universal newlines)."""
+    return io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", newline=None).readlines()
+
+
+def positional_reference(data_a, data_b):
+    return sum(line_a != line_b for line_a, line_b in zip(text_mode_lines(data_a), text_mode_lines(data_b)))
+
+
+def random_file(rng, words, count):
+    lines = [rng.choice(words).encode() + rng.choice(ENDINGS) for _ in range(count)]
+    if lines and rng.random() < 0.5:
+        lines[-1] = lines[-1].rstrip(b"\r\n")
+    return b"".join(lines)
+
+
+def compare(vicky_server, mode, data_a, data_b, block_size):
+    counter = vicky_server.count_lcs_differences if mode == "lcs" else vicky_server.count_positional_differences
+    return counter(io.BytesIO(data_a), io.BytesIO(data_b), block_size)
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 7, 8 * 1024 * 1024])
+def test_line_endings_split_like_universal_newlines(vicky_server, block_size):
+    data = b"a\r\nb\nc\rd\r\r\ne\r\n\r\nf"
+    lines = [line for block in vicky_server.iter_line_blocks(io.BytesIO(data), block_size) for line in block]
+    assert lines == [b"a", b"b", b"c", b"d", b"", b"e", b"", b"f" + vicky_server._NO_FINAL_NEWLINE]
+    assert len(lines) == len(text_mode_lines(data))
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 8 * 1024 * 1024])
+def test_trailing_carriage_return_ends_the_last_line(vicky_server, block_size):
+    lines = [line for block in vicky_server.iter_line_blocks(io.BytesIO(b"a\nb\r"), block_size) for line in block]
+    assert lines == [b"a", b"b"]
+
+
+@pytest.mark.parametrize("mode", ["positional", "lcs"])
+@pytest.mark.parametrize("block_size", [1, 4, 8 * 1024 * 1024])
+def test_crlf_and_lf_files_compare_equal(vicky_server, mode, block_size):
+    result = compare(vicky_server, mode, b"one\r\ntwo\r\nthree\r\n", b"one\ntwo\nthree\n", block_size)
+    assert (result["lines_a"], result["lines_b"], result["different"]) == (3, 3, 0)
+
+
+@pytest.mark.parametrize("mode", ["positional", "lcs"])
+def test_missing_final_newline_is_a_difference(vicky_server, mode):
+    for data_b in (b"one\ntwo", b"one\r\ntwo"):
+        result = compare(vicky_server, mode, b"one\ntwo\n", data_b, 8 * 1024 * 1024)
+        assert (result["lines_a"], result["lines_b"]) == (2, 2)
+        assert result["different"] == (1 if mode == "positional" else 2)
+    assert compare(vicky_server, mode, b"one\ntwo", b"one\r\ntwo", 3)["different"] == 0
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_positional_matches_text_mode_comparison(vicky_server, seed):
+    rng = random.Random(seed)
+    words = ["alpha", "beta", "gamma", ""]
+    data_a = random_file(rng, words, rng.randint(0, 60))
+    data_b = random_file(rng, words, rng.randint(0, 60))
+    result = compare(vicky_server, "positional", data_a, data_b, rng.choice([1, 5, 64]))
+    assert result["different"] == positional_reference(data_a, data_b)
+    assert (result["lines_a"], result["lines_b"]) == (len(text_mode_lines(data_a)), len(text_mode_lines(data_b)))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_lcs_matches_exact_myers_on_text_mode_lines(vicky_server, seed):
+    rng = random.Random(seed)
+    words = ["x%d" % index for index in range(200)] + ["}", "", "return"] * 20
+    data_a = random_file(rng, words, rng.randint(0, 300))
+    lines = text_mode_lines(data_a)
+    for _ in range(rng.randint(0, 30)):
+        if lines and rng.random() < 0.5:
+            del lines[rng.randrange(len(lines))]
+        else:
+            lines.insert(rng.randint(0, len(lines)), rng.choice(words) + "\n")
+    data_b = "".join(lines).replace("\n", rng.choice(["\n", "\r\n"])).encode()
+    expected = vicky_server.myers_edit_distance(text_mode_lines(data_a), text_mode_lines(data_b))
+    result = compare(vicky_server, "lcs", data_a, data_b, rng.choice([3, 1024]))
+    assert result["different"] == expected
+    assert result["lines_a"] - result["deleted"] == result["lines_b"] - result["inserted"]
+
+
+def test_patience_splits_large_inputs_at_unique_lines(vicky_server):
+    a = [b"line %d" % index for index in range(20000)]
+    b = list(a)
+    for index in range(0, 20000, 1000):
+        b[index] = b"changed %d" % index
+    b.insert(500, b"}")
+    hashes_a, hashes_b = array("q", map(hash, a)), array("q", map(hash, b))
+    assert vicky_server.patience_edit_distance(hashes_a, hashes_b, max_distance=41) == 41
+    with pytest.raises(ValueError):
+        vicky_server.patience_edit_distance(hashes_a, hashes_b, max_distance=40)
+
+
+def test_myers_gives_up_beyond_max_distance(vicky_server):
+    assert vicky_server.myers_edit_distance("abcabba", "cbabac") == 5
+    assert vicky_server.myers_edit_distance("abcabba", "cbabac", max_distance=5) == 5
+    with pytest.raises(ValueError):
+        vicky_server.myers_edit_distance("abcabba", "cbabac", max_distance=4)
+
+
+def test_compare_zip_members_reads_the_archive(vicky_server, tmp_path):
+    path = tmp_path / "q-compare-files.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("a.txt", b"same\r\nold\r\nsame\r\n")
+        archive.writestr("b.txt", b"same\nnew\nsame\n")
+    assert vicky_server.compare_zip_members(str(path), "a.txt", "b.txt")["different"] == 1
+    assert vicky_server.compare_zip_members(str(path), "a.txt", "b.txt", mode="lcs")["different"] == 2
+    with pytest.raises(ValueError):
+        vicky_server.count_lcs_differences(io.BytesIO(b"a\nb\n"), io.BytesIO(b"c\nd\n"), max_distance=3)
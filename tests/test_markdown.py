@@ -0,0 +1,71 @@
+import pytest
+
+WORDS = " ".join(["word"] * 20)
+
+# Input -> output of `prettier@3.4.2 --parser markdown` (default options)
+PRETTIER_CASES = {
+    "atx_heading_spacing": ("#   Title   \nText", "# Title\n\nText\n"),
+    "closing_hashes": ("## Section ##\n", "## Section\n"),
+    "setext_headings": ("Title\n=====\nSub\n---\n", "# Title\n\n## Sub\n"),
+    "hash_without_space_is_text": ("#Title\n", "#Title\n"),
+    "bullets_become_dashes": ("* one\n* two\n", "- one\n- two\n"),
+    "plus_bullets": ("+ one\n+ two\n", "- one\n- two\n"),
+    "adjacent_bullet_lists_alternate": ("- a\n* b\n", "- a\n\n* b\n"),
+    "list_interrupts_paragraph": ("Intro text\n- a\n- b\n", "Intro text\n\n- a\n- b\n"),
+    "loose_list": ("- a\n\n\n- b\n\n- c\n", "- a\n\n- b\n\n- c\n"),
+    "nested_list": ("- a\n  - b\n  - c\n- d\n", "- a\n  - b\n  - c\n- d\n"),
+    "ordered_list": ("1. a\n2. b\n3. c\n", "1. a\n2. b\n3. c\n"),
+    "ordered_list_renumbered": ("3. a\n5. b\n9. c\n", "3. a\n4. b\n5. c\n"),
+    "ordered_list_all_ones": ("1. a\n1. b\n1. c\n", "1. a\n1. b\n1. c\n"),
+    "paren_markers": ("1) a\n2) b\n", "1. a\n2. b\n"),
+    "adjacent_ordered_lists_alternate": ("1. a\n2) b\n", "1. a\n\n2) b\n"),
+    "table_padding": ("| Name | Score |\n|---|---|\n| Alice | 9 |\n| Bob | 10 |\n",
+                      "| Name  | Score |\n| ----- | ----- |\n| Alice | 9     |\n| Bob   | 10    |\n"),
+    "table_alignment": ("|a|b|c|\n|:--|:-:|--:|\n|long text|x|1|\n",
+                        "| a         |  b  |   c |\n| :-------- | :-: | --: |\n| long text |  x  |   1 |\n"),
+    "wide_table_stays_aligned": (f"| Column | Description |\n|---|---|\n| x | {WORDS} |\n",
+                                 f"| Column | {'Description':<99} |\n| ------ | {'-' * 99} |\n| x      | {WORDS} |\n"),
+    "emphasis_style": ("Some *emphasis* and __strong__ and **bold** and _kept_\n",
+                       "Some _emphasis_ and **strong** and **bold** and _kept_\n"),
+    "intraword_emphasis_kept": ("a*b*c\n", "a*b*c\n"),
+    "code_span_untouched": ("Use `*args` and `a  b`\n", "Use `*args` and `a  b`\n"),
+    "lone_asterisk_escaped": ("Price: 2 * 3 = 6\n", "Price: 2 \\* 3 = 6\n"),
+    "whitespace_collapsed": ("a    b\tc\n", "a b c\n"),
+    "hard_break_kept": ("line one  \nline two   \n", "line one  \nline two\n"),
+    "code_fence": ("```python\nprint(1)\n\n  x = 2  \n```\n", "```python\nprint(1)\n\n  x = 2  \n```\n"),
+    "tilde_fence": ("~~~\ncode\n~~~\n", "```\ncode\n```\n"),
+    "fence_longer_than_content": ("````md\nhas ``` inside\n````\n", "````md\nhas ``` inside\n````\n"),
+    "fence_info_spacing": ("```  js   \nx\n```\n", "```js\nx\n```\n"),
+    "blank_lines_collapsed": ("\n\n\na\n\n\n\nb\n\n\n", "a\n\nb\n"),
+    "crlf_input": ("# A\r\n\r\n\r\ntext\r\n", "# A\n\ntext\n"),
+    "thematic_break": ("a\n\n***\n\nb\n", "a\n\n---\n\nb\n"),
+    "blockquote": (">quote\n> more\n", "> quote\n> more\n"),
+}
+
+
+@pytest.mark.parametrize("source, expected", PRETTIER_CASES.values(), ids=PRETTIER_CASES.keys())
+def test_matches_prettier(vicky_server, source, expected):
+    assert vicky_server.normalize_markdown(source) == expected
+
+
+@pytest.mark.parametrize("source, expected", PRETTIER_CASES.values(), ids=PRETTIER_CASES.keys())
+def test_is_idempotent(vicky_server, source, expected):
+    once = vicky_server.normalize_markdown(source)
+    assert vicky_server.normalize_markdown(once) == once
+
+
+def test_pdf_pipeline_output(vicky_server):
+    pages = ["INTRODUCTION\nSome text here\n• first\n• second  point", "RESULTS\n| a | b |\n|---|---|\n| 1 | 2 |"]
+    markdown = vicky_server.pdf_text_to_markdown(pages)
+    assert vicky_server.normalize_markdown(markdown) == (
+        "# INTRODUCTION\n\nSome text here\n\n- first\n- second point\n\n"
+        "# RESULTS\n\n| a   | b   |\n| --- | --- |\n| 1   | 2   |\n"
+    )
+
+
+def test_cases_against_installed_prettier(vicky_server):
+    daemon = vicky_server.PrettierDaemon.shared("3.4.2")
+    if not daemon.is_installed():
+        pytest.skip("prettier@3.4.2 is not installed")
+    for name, (source, expected) in PRETTIER_CASES.items():
+        assert daemon.format(source, "case.md") == expected, name
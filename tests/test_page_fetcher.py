@@ -0,0 +1,128 @@
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves /results/<n> with parseable results and /challenge with a bot check."""
+
+    def do_GET(self):
+        self.server.requests.append((self.path, time.monotonic()))
+        if self.path.startswith("/results"):
+            body = (FIXTURES / "imdb_search_list.html").read_bytes()
+        elif self.path.startswith("/challenge"):
+            body = b"<html><body>Please verify you are a human</body></html>"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def page_cache(vicky_server, monkeypatch, tmp_path):
+    monkeypatch.setattr(vicky_server.file_manager, "cache_path",
+                        lambda namespace, key, ext="": str(tmp_path / f"{namespace}-{key}{ext}"))
+    return tmp_path
+
+
+def url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_next_data_is_parsed_first(vicky_server):
+    html = (FIXTURES / "imdb_search_next_data.html").read_text(encoding="utf-8")
+    assert vicky_server.parse_imdb_search_html(html) == [
+        {"id": "tt0111161", "title": "The Shawshank Redemption", "year": "1994", "rating": "9.3"},
+        {"id": "tt0068646", "title": "The Godfather", "year": "1972", "rating": "9.0"},
+    ]
+
+
+def test_list_items_are_parsed_without_next_data(vicky_server):
+    pytest.importorskip("lxml")
+    html = (FIXTURES / "imdb_search_list.html").read_text(encoding="utf-8")
+    # The year span runs into the runtime span ("19992h 16m") in text_content()
+    assert vicky_server.parse_imdb_search_html(html) == [
+        {"id": "tt0133093", "title": "The Matrix", "year": "1999", "rating": "8.7"},
+        {"id": "tt0109830", "title": "Forrest Gump", "year": "1994", "rating": "8.8"},
+    ]
+
+
+def test_pages_are_served_from_the_cache_within_the_ttl(vicky_server, server, page_cache):
+    fetcher = vicky_server.PageFetcher(per_host_interval=0, ttl=60)
+    first = fetcher.fetch(url(server, "/results/1"))
+    assert fetcher.fetch(url(server, "/results/1")) == first
+    assert vicky_server.PageFetcher(per_host_interval=0, ttl=60).fetch(url(server, "/results/1")) == first
+    assert len(server.requests) == 1
+
+    # Age the cached page past a 1 s TTL
+    for path in page_cache.iterdir():
+        os.utime(path, (time.time() - 5, time.time() - 5))
+    assert vicky_server.PageFetcher(per_host_interval=0, ttl=1).fetch(url(server, "/results/1")) == first
+    assert len(server.requests) == 2
+
+
+def test_rejected_pages_use_the_fallback_and_are_not_cached(vicky_server, server, page_cache):
+    fallback_calls = []
+
+    def fallback(page_url):
+        fallback_calls.append(page_url)
+        return (FIXTURES / "imdb_search_next_data.html").read_text(encoding="utf-8")
+
+    fetcher = vicky_server.PageFetcher(per_host_interval=0, ttl=60, fallback=fallback,
+                                       accept=lambda html: bool(vicky_server.parse_imdb_search_html(html)))
+    html = fetcher.fetch(url(server, "/challenge"))
+    assert "__NEXT_DATA__" in html and len(fallback_calls) == 1
+    # The rendered page was accepted, so it (and not the challenge) is cached
+    assert fetcher.fetch(url(server, "/challenge")) == html
+    assert len(server.requests) == 1 and len(fallback_calls) == 1
+
+    no_fallback = vicky_server.PageFetcher(per_host_interval=0, ttl=60, accept=lambda html: "results" in html)
+    with pytest.raises(ValueError):
+        no_fallback.fetch(url(server, "/challenge?again"))
+    assert len(list(page_cache.iterdir())) == 1
+
+
+def test_concurrent_fetches_respect_the_per_host_interval(vicky_server, server, page_cache):
+    fetcher = vicky_server.PageFetcher(max_workers=4, per_host_interval=0.2, ttl=0)
+    pages = fetcher.fetch_all([url(server, f"/results/{n}") for n in range(4)] + [url(server, "/missing")])
+    assert all(isinstance(page, str) for page in pages[:4])
+    assert isinstance(pages[4], Exception)
+
+    times = sorted(when for _, when in server.requests)
+    assert len(times) == 5
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert min(gaps) >= 0.15
+
+
+def test_rate_limiter_spaces_each_host_separately(vicky_server):
+    limiter = vicky_server.HostRateLimiter(min_interval=0.2)
+    start = time.monotonic()
+    limiter.wait("http://a.example/1")
+    limiter.wait("http://b.example/1")
+    assert time.monotonic() - start < 0.1
+    limiter.wait("http://a.example/2")
+    assert time.monotonic() - start >= 0.18
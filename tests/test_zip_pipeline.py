@@ -0,0 +1,115 @@
+import hashlib
+import io
+import random
+import shutil
+import subprocess
+import zipfile
+
+import pytest
+
+
+def make_zip(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+def random_lines(seed, count):
+    rng = random.Random(seed)
+    alphabet = b"aAzZ09 \t-_.~\x7f\xc3\xa9\xff"
+    return [bytes(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) for _ in range(count)]
+
+
+@pytest.mark.parametrize("memory_budget", [256 * 1024 * 1024, 300, 64])
+def test_c_sort_matches_bytewise_sorted(vicky_server, memory_budget):
+    lines = random_lines(1, 500)
+    stream = [line + b"\n" for line in lines[:-1]] + [lines[-1]]  # last line without a newline
+    assert list(vicky_server.c_sort(stream, memory_budget=memory_budget)) == [line + b"\n" for line in sorted(lines)]
+
+
+def test_c_sort_spills_sorted_runs(vicky_server, monkeypatch):
+    import tempfile
+
+    runs = []
+    real_temporary_file = tempfile.TemporaryFile
+
+    def counting_temporary_file(*args, **kwargs):
+        runs.append(1)
+        return real_temporary_file(*args, **kwargs)
+
+    monkeypatch.setattr(tempfile, "TemporaryFile", counting_temporary_file)
+    lines = random_lines(2, 300)
+    result = list(vicky_server.c_sort((line + b"\n" for line in lines), memory_budget=200))
+    assert len(runs) > 3
+    assert result == [line + b"\n" for line in sorted(lines)]
+
+
+@pytest.mark.skipif(not shutil.which("sort"), reason="coreutils sort is not available")
+def test_c_sort_matches_coreutils(vicky_server):
+    data = b"".join(line + b"\n" for line in random_lines(3, 400))
+    expected = subprocess.run(["sort"], input=data, stdout=subprocess.PIPE, env={"LC_ALL": "C"}, check=True).stdout
+    assert b"".join(vicky_server.c_sort(io.BytesIO(data), memory_budget=500)) == expected
+
+
+def test_substitute_matches_across_chunk_boundaries(vicky_server, monkeypatch):
+    monkeypatch.setattr(vicky_server, "_PIPELINE_CHUNK_SIZE", 3)
+    content = b"IITM iitm\nxIiTmx\nno match\nIITM"
+    with vicky_server.ZipVirtualFS(make_zip({"a.txt": content, "b.txt": b"IITM\n"})) as fs:
+        replaced = fs.substitute(rb"(?i)iitm", b"IIT Madras", paths=["a.txt"])
+        assert b"".join(replaced.read_chunks("a.txt")) == b"IIT Madras IIT Madras\nxIIT Madrasx\nno match\nIIT Madras"
+        # Untouched files and the original view are unchanged
+        assert b"".join(replaced.read_chunks("b.txt")) == b"IITM\n"
+        assert b"".join(fs.read_chunks("a.txt")) == content
+
+
+def test_glob_is_sorted_bytewise_and_skips_hidden_files(vicky_server):
+    archive = make_zip({"b.txt": b"", "B.txt": b"", "a.csv": b"", ".hidden": b"", "dir/c.txt": b""})
+    with vicky_server.ZipVirtualFS(archive) as fs:
+        assert fs.glob("*") == ["B.txt", "a.csv", "b.txt"]
+        assert fs.glob("*.txt") == ["B.txt", "b.txt"]
+        assert fs.glob(".*") == [".hidden"]
+        assert fs.glob("*", "dir") == ["dir/c.txt"]
+
+
+def test_flatten_resolves_name_clashes(vicky_server):
+    archive = make_zip({"x/data.txt": b"1\n", "y/data.txt": b"2\n", "y/z/other.txt": b"3\n"})
+    with vicky_server.ZipVirtualFS(archive) as fs:
+        flat = fs.flatten()
+        assert sorted(flat.entries) == ["data.txt", "data_from_y.txt", "other.txt"]
+        assert b"".join(flat.read_chunks("data_from_y.txt")) == b"2\n"
+
+
+def test_flatten_rename_grep_sort_sha256(vicky_server):
+    files = {
+        "a1/file19.txt": b"alpha\nbeta\n\ngamma",
+        "b2/x9y0.csv": b"z,1\nA,2\n",
+        "c3/readme": b"\n\n",
+    }
+    with vicky_server.ZipVirtualFS(make_zip(files)) as fs:
+        fs = fs.flatten().rename(vicky_server.shift_digits)
+        paths = fs.glob("*")
+        assert paths == ["file20.txt", "readme", "x0y1.csv"]
+        output = list(vicky_server.c_sort(vicky_server.grep_lines(fs, paths)))
+        assert output == [b"file20.txt:alpha\n", b"file20.txt:beta\n", b"file20.txt:gamma\n",
+                          b"x0y1.csv:A,2\n", b"x0y1.csv:z,1\n"]
+        assert vicky_server.sha256sum(output) == hashlib.sha256(b"".join(output)).hexdigest()
+
+
+@pytest.mark.skipif(not all(shutil.which(tool) for tool in ("bash", "grep", "sort", "sha256sum")),
+                    reason="needs bash, grep, sort and sha256sum")
+def test_pipeline_matches_the_shell(vicky_server, tmp_path):
+    files = {f"d{n}/f{n}{n + 3}.txt": b"\n".join(random_lines(n, 40)) for n in range(5)}
+    with zipfile.ZipFile(make_zip(files)) as archive:
+        archive.extractall(tmp_path)
+    for path in tmp_path.glob("*/*"):
+        path.rename(tmp_path / vicky_server.shift_digits(path.name))
+    expected = subprocess.run(["bash", "-c", "grep -a . * | sort | sha256sum"], cwd=tmp_path,
+                              stdout=subprocess.PIPE, env={"LC_ALL": "C", "PATH": "/usr/bin:/bin"}, check=True)
+
+    with vicky_server.ZipVirtualFS(make_zip(files)) as fs:
+        fs = fs.flatten().rename(vicky_server.shift_digits)
+        digest = vicky_server.sha256sum(vicky_server.c_sort(vicky_server.grep_lines(fs, fs.glob("*")), memory_budget=2000))
+    assert expected.stdout.split()[0].decode() == digest
@@ -200,6 +200,8 @@ class FileManager:
         self.ga_folders = ["GA1", "GA2", "GA3", "GA4", "GA5"]
         self.temp_dirs = []  # Track created temporary directories for cleanup
         self.file_cache = {}  # Cache for previously resolved files
+        self.hash_cache = {}  # Full content hashes keyed by (path, size, mtime)
+        self.cache_directory = os.path.join(tempfile.gettempdir(), "vicky_cache")  # Persistent derived data
         self.supported_extensions = {
             'image': ['.png', '.jpg', '.jpeg', '.webp', '.gif', '.bmp'],
             'document': ['.pdf', '.docx', '.txt', '.md'],
@@ -967,6 +969,427 @@ class FileManager:
             print(f"Error calculating content signature: {str(e)}")
             return None
 
+    def content_hash(self, path, chunk_size=1024 * 1024):
+        """
+        Calculate a full SHA-256 hash of file content for use as a cache key.
+
+        Unlike _calculate_content_signature this reads the whole file, so two
+        files only share a key when their bytes are identical. The result is
+        memoized on (path, size, mtime) so repeated lookups are free.
+
+        Args:
+            path (str): Path to the file
+            chunk_size (int): Number of bytes to read per block
+
+        Returns:
+            str: Hex digest of the file content, or None if unreadable
+        """
+        if not path or not os.path.isfile(path):
+            return None
+
+        import hashlib
+
+        file_stat = os.stat(path)
+        memo_key = (os.path.abspath(path), file_stat.st_size, file_stat.st_mtime)
+        if memo_key in self.hash_cache:
+            return self.hash_cache[memo_key]
+
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(chunk_size), b''):
+                sha256.update(block)
+
+        digest = sha256.hexdigest()
+        self.hash_cache[memo_key] = digest
+        return digest
+
+    def cache_path(self, namespace, key, extension=""):
+        """
+        Build the path of a persistent cache artifact (e.g. a Parquet table or
+        a JSON index) derived from a file's content hash.
+
+        Args:
+            namespace (str): Cache namespace, usually the solution it belongs to
+            key (str): Cache key, usually the content_hash of the source file
+            extension (str): File extension of the artifact
+
+        Returns:
+            str: Path inside the cache directory (parent directory is created)
+        """
+        cache_dir = os.path.join(self.cache_directory, namespace)
+        os.makedirs(cache_dir, exist_ok=True)
+        return os.path.join(cache_dir, f"{key}{extension}")
+
+# Shared decoded-image store (used by the GA2/GA5 image solutions)
+_IMAGE_STORE = None
+
+
+class ImageStore:
+    """
+    Decode-once cache of image pixels keyed by file content hash.
+
+    Pixel buffers live in an LRU with a byte budget and are handed out as
+    read-only NumPy views, so callers never copy or re-decode the same image.
+    Buffers can also be published to shared memory so process-pool workers
+    attach to them by name instead of receiving pickled pixel data.
+    """
+
+    def __init__(self, max_bytes=512 * 1024 * 1024):
+        from collections import OrderedDict
+        import threading
+
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.entries = OrderedDict()  # content hash -> (read-only array, mode)
+        self.shared_blocks = {}  # content hash -> SharedMemory
+        self.lock = threading.RLock()
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide store, creating it on first use."""
+        import atexit
+
+        global _IMAGE_STORE
+        if _IMAGE_STORE is None:
+            _IMAGE_STORE = cls()
+            # Shared-memory blocks outlive the process unless they are unlinked
+            atexit.register(_IMAGE_STORE.clear)
+        return _IMAGE_STORE
+
+    def get_array(self, image_path):
+        """
+        Get the decoded pixels of an image.
+
+        Modes other than L/RGB/RGBA (palette, LA, CMYK, ...) are expanded to
+        RGBA once at decode time.
+
+        Returns:
+            tuple: (read-only ndarray of shape (H, W[, C]), PIL mode string)
+        """
+        import numpy as np
+        from PIL import Image
+
+        content_hash = file_manager.content_hash(image_path)
+        with self.lock:
+            if content_hash in self.entries:
+                self.entries.move_to_end(content_hash)
+                return self.entries[content_hash]
+
+        # Decode outside the lock; a concurrent decode of the same image just loses the race
+        with Image.open(image_path) as img:
+            print(f"Decoding image: {img.format}, {img.size}, {img.mode}")
+            if img.mode not in ('L', 'RGB', 'RGBA'):
+                img = img.convert('RGBA')
+            pixels = np.array(img)
+            mode = img.mode
+        pixels.flags.writeable = False
+
+        with self.lock:
+            if content_hash in self.entries:
+                self.entries.move_to_end(content_hash)
+                return self.entries[content_hash]
+            self.entries[content_hash] = (pixels, mode)
+            self.current_bytes += pixels.nbytes
+            while self.current_bytes > self.max_bytes and len(self.entries) > 1:
+                evicted_hash, (evicted, _) = self.entries.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+                self._release_shared(evicted_hash)
+        return pixels, mode
+
+    def get_image(self, image_path):
+        """Get a PIL image backed by the cached pixels."""
+        from PIL import Image
+
+        pixels, mode = self.get_array(image_path)
+        return Image.fromarray(pixels)
+
+    def share(self, image_path):
+        """
+        Publish an image's pixels in shared memory.
+
+        Returns:
+            dict: Picklable descriptor for ImageStore.attach()
+        """
+        from multiprocessing import shared_memory
+        import numpy as np
+
+        pixels, mode = self.get_array(image_path)
+        content_hash = file_manager.content_hash(image_path)
+        with self.lock:
+            if content_hash not in self.shared_blocks:
+                block = shared_memory.SharedMemory(create=True, size=max(pixels.nbytes, 1))
+                np.ndarray(pixels.shape, dtype=pixels.dtype, buffer=block.buf)[...] = pixels
+                self.shared_blocks[content_hash] = block
+            name = self.shared_blocks[content_hash].name
+        return {
+            "name": name,
+            "shape": pixels.shape,
+            "dtype": pixels.dtype.str,
+            "mode": mode
+        }
+
+    @staticmethod
+    def attach(descriptor):
+        """
+        Attach to pixels published with share(), typically in a worker process.
+
+        Returns:
+            tuple: (SharedMemory handle to keep alive and close(), read-only ndarray)
+        """
+        from multiprocessing import shared_memory
+        import numpy as np
+
+        try:
+            block = shared_memory.SharedMemory(name=descriptor["name"], track=False)
+        except TypeError:
+            # Python < 3.13 has no track flag
+            block = shared_memory.SharedMemory(name=descriptor["name"])
+        pixels = np.ndarray(descriptor["shape"], dtype=np.dtype(descriptor["dtype"]), buffer=block.buf)
+        pixels.flags.writeable = False
+        return block, pixels
+
+    def _release_shared(self, content_hash):
+        block = self.shared_blocks.pop(content_hash, None)
+        if block is not None:
+            block.close()
+            block.unlink()
+
+    def clear(self):
+        """Drop all cached pixels and unlink shared-memory blocks (also run at exit)."""
+        with self.lock:
+            for content_hash in list(self.shared_blocks):
+                self._release_shared(content_hash)
+            self.entries.clear()
+            self.current_bytes = 0
+
+
+# Persistent prettier formatter (used by the Markdown solutions)
+_PRETTIER_DAEMONS = {}
+_PRETTIER_TIMEOUT = 30  # seconds, the budget the old `npx prettier` call had
+
+_PRETTIER_DAEMON_SCRIPT = r"""
+const crypto = require('crypto');
+const prettier = require('prettier');
+const readline = require('readline');
+const lines = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+let queue = Promise.resolve();
+lines.on('line', (line) => {
+  queue = queue.then(async () => {
+    let reply;
+    try {
+      const request = JSON.parse(line);
+      const output = await prettier.format(request.text, { filepath: request.filepath });
+      reply = request.digest
+        ? { ok: true, sha256: crypto.createHash('sha256').update(output, 'utf8').digest('hex') }
+        : { ok: true, output };
+    } catch (e) {
+      reply = { ok: false, error: String((e && e.message) || e) };
+    }
+    process.stdout.write(JSON.stringify(reply) + '\n');
+  });
+});
+"""
+
+
+class PrettierDaemon:
+    """
+    A long-lived node process that formats text with a pinned prettier version.
+
+    prettier is installed once into the cache directory and loaded once by
+    the daemon; each request is a JSON line on stdin and the formatted text
+    comes back as a JSON line on stdout. This replaces one `npx prettier`
+    cold start (node boot plus npm resolution) per call.
+
+    A reply that takes longer than `timeout` seconds kills the daemon (the
+    next request starts a fresh one), so a hung node process cannot block
+    later requests. Requests install prettier within the same budget; call
+    warm() ahead of time to allow a slower first install.
+    """
+
+    def __init__(self, version="3.4.2", timeout=_PRETTIER_TIMEOUT):
+        import threading
+
+        self.version = version
+        self.timeout = timeout
+        self.install_dir = file_manager.cache_path("prettier", version)
+        self.process = None
+        self.replies = None  # lines read from the daemon's stdout by a reader thread
+        self.install_failed = False
+        self.lock = threading.Lock()
+        self.digest_cache = {}  # (sha256 of input, filepath) -> sha256 of output
+
+    @classmethod
+    def shared(cls, version="3.4.2"):
+        """Return the process-wide daemon for a prettier version."""
+        if version not in _PRETTIER_DAEMONS:
+            _PRETTIER_DAEMONS[version] = cls(version)
+        return _PRETTIER_DAEMONS[version]
+
+    def is_installed(self):
+        """Check whether node and this prettier version are available without installing anything."""
+        import shutil
+
+        return (shutil.which('node') is not None and
+                os.path.exists(os.path.join(self.install_dir, 'node_modules', 'prettier', 'package.json')))
+
+    def install(self, timeout=_PRETTIER_TIMEOUT):
+        """Install the pinned prettier version into the cache directory (one-time)."""
+        import subprocess
+        import shutil
+
+        if self.is_installed():
+            return True
+        # Run the resolved path so Windows picks up npm.cmd
+        npm = shutil.which('npm')
+        if self.install_failed or npm is None:
+            return False
+
+        os.makedirs(self.install_dir, exist_ok=True)
+        print(f"Installing prettier@{self.version} into {self.install_dir}")
+        try:
+            result = subprocess.run(
+                [npm, 'install', '--no-audit', '--no-fund', '--prefix', self.install_dir, f'prettier@{self.version}'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                encoding='utf-8',
+                errors='replace',
+                timeout=timeout
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"prettier install failed: {str(e)}")
+            self.install_failed = True
+            return False
+        if result.returncode != 0:
+            print(f"prettier install failed: {result.stderr.strip()}")
+        # Don't retry a failed (e.g. offline) install on every request
+        self.install_failed = not self.is_installed()
+        return not self.install_failed
+
+    def warm(self, install_timeout=300):
+        """
+        Install prettier (allowing a slow first download) and start the
+        daemon ahead of the first request.
+
+        Returns:
+            bool: Whether the daemon is ready
+        """
+        self.install_failed = False
+        if not self.install(timeout=install_timeout):
+            return False
+        with self.lock:
+            if self.process is None or self.process.poll() is not None:
+                self._start()
+        return True
+
+    def _start(self):
+        import queue
+        import subprocess
+        import threading
+
+        self.process = subprocess.Popen(
+            ['node', '-e', _PRETTIER_DAEMON_SCRIPT],
+            cwd=self.install_dir,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+
+        # A thread reads the replies so a request can wait with a deadline
+        # (select() does not work on pipes on Windows); each process gets its
+        # own queue, so a late reply from a killed daemon is never misread
+        def read_replies(stdout, replies):
+            for line in iter(stdout.readline, b''):
+                replies.put(line)
+            replies.put(b'')
+
+        self.replies = queue.Queue()
+        threading.Thread(target=read_replies, args=(self.process.stdout, self.replies), daemon=True).start()
+
+    def _kill(self):
+        try:
+            self.process.kill()
+            self.process.wait(timeout=5)
+        except Exception:
+            pass
+        self.process = None
+
+    def _request(self, payload):
+        import queue
+
+        if not self.install():
+            raise RuntimeError(f"prettier@{self.version} is not available")
+
+        request = (json.dumps(payload) + "\n").encode('utf-8')
+        with self.lock:
+            for attempt in range(2):
+                if self.process is None or self.process.poll() is not None:
+                    self._start()
+                try:
+                    self.process.stdin.write(request)
+                    self.process.stdin.flush()
+                    line = self.replies.get(timeout=self.timeout)
+                except (BrokenPipeError, OSError):
+                    line = b''
+                except queue.Empty:
+                    self._kill()
+                    raise RuntimeError(f"prettier daemon did not answer within {self.timeout}s; restarting it")
+                if line:
+                    break
+                # The daemon died (e.g. killed between requests); restart it once
+                self.close()
+            else:
+                raise RuntimeError("prettier daemon exited unexpectedly")
+
+        reply = json.loads(line)
+        if not reply["ok"]:
+            raise RuntimeError(f"prettier failed: {reply['error']}")
+        return reply
+
+    def format(self, text, filepath="README.md"):
+        """
+        Format text exactly as `prettier <filepath>` would.
+
+        Args:
+            text (str): Source text
+            filepath (str): Name used only to infer the parser (e.g. .md, .json)
+
+        Returns:
+            str: Formatted text
+
+        Raises:
+            RuntimeError: If prettier is unavailable or rejects the input
+        """
+        return self._request({"text": text, "filepath": filepath})["output"]
+
+    def sha256(self, text, filepath="README.md"):
+        """
+        SHA-256 of the formatted text, i.e. `prettier <filepath> | sha256sum`.
+
+        The digest is computed in the daemon, so only the hash crosses the
+        pipe, and results are memoized by the SHA-256 of the input text.
+
+        Raises:
+            RuntimeError: If prettier is unavailable or rejects the input
+        """
+        import hashlib
+
+        cache_key = (hashlib.sha256(text.encode('utf-8')).hexdigest(), filepath)
+        if cache_key not in self.digest_cache:
+            reply = self._request({"text": text, "filepath": filepath, "digest": True})
+            self.digest_cache[cache_key] = reply["sha256"]
+        return self.digest_cache[cache_key]
+
+    def close(self):
+        """Stop the daemon process."""
+        if self.process is not None:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=5)
+            except Exception:
+                self.process.kill()
+            self.process = None
+
+
 # GA1 Solutions
 
 def ga1_first_solution(query=None):
@@ -1127,12 +1550,9 @@ def ga1_second_solution(query=None):
 
 def ga1_third_solution(query=None):
     # E://data science tool//GA1//third.py
-    import subprocess
     import re
     import os
     import hashlib
-    import tempfile
-    import shutil
 
     question3='''Let's make sure you know how to use npx and prettier.
 
@@ -1179,62 +1599,18 @@ def ga1_third_solution(query=None):
                 print(f"Error: File not found at {file_path}")
                 return "File not found error. Make sure the file exists."
             
-            # Create a temporary copy named exactly README.md if needed
-            temp_dir = None
-            temp_file = None
-            file_to_process = file_path
-            
-            # If filename is not README.md, create a properly named copy
-            if os.path.basename(file_path).lower() != "readme.md":
-                temp_dir = tempfile.mkdtemp()
-                temp_file = os.path.join(temp_dir, "README.md")
-                print(f"Creating temporary README.md at {temp_file}")
-                shutil.copy2(file_path, temp_file)
-                file_to_process = temp_file
+            # newline='' keeps CRLFs so prettier sees the exact file content
+            with open(file_path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+                content = f.read()
 
             try:
-                # Try to run the actual command
-                print(f"Running: npx -y prettier@3.4.2 {file_to_process} | sha256sum")
-                result = subprocess.run(
-                    f"npx -y prettier@3.4.2 {file_to_process} | sha256sum",
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=30  # Give more time for npx installation
-                )
-                
-                # Clean up temp files if created
-                if temp_dir:
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-                
-                if result.returncode == 0 and result.stdout:
-                    # Extract just the hash (first part before space)
-                    hash_value = result.stdout.strip().split(' ')[0]
-                    return hash_value
-                else:
-                    print(f"Command failed with: {result.stderr}")
-                    # Fall back to manual hash calculation
+                # Same digest as `npx -y prettier@3.4.2 README.md | sha256sum`, from the warm formatter
+                return PrettierDaemon.shared("3.4.2").sha256(content, "README.md")
             except Exception as e:
-                print(f"Error running command: {str(e)}")
-                # Continue with manual calculation
-                if temp_dir:
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-            
-            # Manual calculation as a fallback
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+                print(f"Prettier formatter unavailable: {str(e)}")
             
-            # Apply basic prettification rules
-            # Remove trailing whitespace from each line
-            content = re.sub(r'[ \t]+$', '', content, flags=re.MULTILINE)
-            # Ensure file ends with a newline
-            if not content.endswith('\n'):
-                content += '\n'
-            # Replace multiple blank lines with single blank lines
-            content = re.sub(r'\n{3,}', '\n\n', content)
-            
-            # Calculate SHA256 hash
-            hash_obj = hashlib.sha256(content.encode('utf-8'))
+            # Fall back to prettier's Markdown rules implemented in Python
+            hash_obj = hashlib.sha256(normalize_markdown(content).encode('utf-8'))
             hash_value = hash_obj.hexdigest()
             
             # For the default file, we know the expected output
@@ -1255,6 +1631,431 @@ def ga1_third_solution(query=None):
     print(f"Hash result: {result}")
     return result
 
+# Spreadsheet formula engine (used by ga1_fourth_solution and ga1_fifth_solution)
+_FORMULA_TOKEN = re.compile(r'\s*(?:(\d+(?:\.\d*)?(?:[eE][-+]?\d+)?|\.\d+)|([A-Za-z_][A-Za-z0-9_.]*)|("(?:[^"]|"")*")|(<>|<=|>=|[-+*/^&(){},;=<>]))')
+
+
+class AffineGrid:
+    """
+    A lazily evaluated rows x cols array whose cells are
+    base + i * row_step + j * col_step.
+
+    SEQUENCE produces one, and slicing (ARRAY_CONSTRAIN, TAKE, DROP),
+    TRANSPOSE and scalar + - * keep it affine, so SUM/AVERAGE/MIN/MAX/COUNT
+    are closed forms in exact integer arithmetic, and even a 10000 x 10000
+    SEQUENCE is never materialized. to_array() builds the NumPy array when
+    a function needs real cells (e.g. SORTBY).
+    """
+
+    def __init__(self, rows, cols, base, row_step, col_step):
+        self.rows = rows
+        self.cols = cols
+        self.base = base
+        self.row_step = row_step
+        self.col_step = col_step
+
+    @property
+    def shape(self):
+        return (self.rows, self.cols)
+
+    def cell(self, i, j):
+        return self.base + i * self.row_step + j * self.col_step
+
+    def window(self, row_start, col_start, rows, cols):
+        """Sub-grid of `rows` x `cols` cells starting at (row_start, col_start)."""
+        return AffineGrid(rows, cols, self.cell(row_start, col_start), self.row_step, self.col_step)
+
+    def transpose(self):
+        return AffineGrid(self.cols, self.rows, self.base, self.col_step, self.row_step)
+
+    def scale(self, factor):
+        return AffineGrid(self.rows, self.cols, self.base * factor, self.row_step * factor, self.col_step * factor)
+
+    def shift(self, offset):
+        return AffineGrid(self.rows, self.cols, self.base + offset, self.row_step, self.col_step)
+
+    def count(self):
+        return self.rows * self.cols
+
+    def sum(self):
+        rows, cols = self.rows, self.cols
+        # Halve the integer triangular numbers first; the steps may be floats
+        return (rows * cols * self.base
+                + cols * (rows * (rows - 1) // 2) * self.row_step
+                + rows * (cols * (cols - 1) // 2) * self.col_step)
+
+    def min(self):
+        return self.base + min(0, (self.rows - 1) * self.row_step) + min(0, (self.cols - 1) * self.col_step)
+
+    def max(self):
+        return self.base + max(0, (self.rows - 1) * self.row_step) + max(0, (self.cols - 1) * self.col_step)
+
+    def to_array(self):
+        import numpy as np
+
+        return (self.base
+                + np.arange(self.rows).reshape(-1, 1) * self.row_step
+                + np.arange(self.cols).reshape(1, -1) * self.col_step)
+
+
+def parse_formula(formula):
+    """
+    Parse a spreadsheet formula into an expression tree.
+
+    Nodes are tuples: ('number', value), ('string', text), ('array', rows),
+    ('call', NAME, args), ('unary', op, operand) and ('binary', op, left, right).
+    Array literals use "," between columns and ";" between rows.
+
+    Raises:
+        ValueError: On a syntax error
+    """
+    text = formula.strip()
+    if text.startswith('='):
+        text = text[1:]
+
+    tokens = []
+    position = 0
+    while position < len(text):
+        if text[position:].strip() == '':
+            break
+        match = _FORMULA_TOKEN.match(text, position)
+        if not match:
+            raise ValueError(f"Unexpected character at {position}: {text[position:position + 10]!r}")
+        number, name, string, symbol = match.groups()
+        if number is not None:
+            value = float(number)
+            tokens.append(('number', int(value) if value.is_integer() and 'e' not in number.lower() else value))
+        elif name is not None:
+            tokens.append(('name', name.upper()))
+        elif string is not None:
+            tokens.append(('string', string[1:-1].replace('""', '"')))
+        else:
+            tokens.append(('symbol', symbol))
+        position = match.end()
+
+    index = 0
+
+    def peek():
+        return tokens[index] if index < len(tokens) else (None, None)
+
+    def expect(symbol):
+        nonlocal index
+        if peek() != ('symbol', symbol):
+            raise ValueError(f"Expected {symbol!r} in formula")
+        index += 1
+
+    precedence = {'=': 1, '<>': 1, '<': 1, '>': 1, '<=': 1, '>=': 1, '&': 2,
+                  '+': 3, '-': 3, '*': 4, '/': 4, '^': 5}
+
+    def expression(min_precedence=1):
+        nonlocal index
+        left = unary()
+        while True:
+            kind, value = peek()
+            if kind != 'symbol' or value not in precedence or precedence[value] < min_precedence:
+                return left
+            index += 1
+            # ^ is left-associative in spreadsheets, like every other operator
+            right = expression(precedence[value] + 1)
+            left = ('binary', value, left, right)
+
+    def unary():
+        nonlocal index
+        kind, value = peek()
+        if kind == 'symbol' and value in ('-', '+'):
+            index += 1
+            return ('unary', value, unary())
+        return primary()
+
+    def primary():
+        nonlocal index
+        kind, value = peek()
+        index += 1
+        if kind in ('number', 'string'):
+            return (kind, value)
+        if kind == 'name':
+            if peek() != ('symbol', '('):
+                if value in ('TRUE', 'FALSE'):
+                    return ('number', int(value == 'TRUE'))
+                raise ValueError(f"Cell references are not supported: {value}")
+            index += 1
+            args = []
+            if peek() != ('symbol', ')'):
+                args.append(expression())
+                while peek() == ('symbol', ','):
+                    index += 1
+                    args.append(expression())
+            expect(')')
+            return ('call', value, args)
+        if (kind, value) == ('symbol', '('):
+            node = expression()
+            expect(')')
+            return node
+        if (kind, value) == ('symbol', '{'):
+            rows = [[]]
+            while True:
+                sign = 1
+                while peek() in (('symbol', '-'), ('symbol', '+')):
+                    sign = -sign if peek()[1] == '-' else sign
+                    index += 1
+                item_kind, item = peek()
+                if item_kind not in ('number', 'string'):
+                    raise ValueError("Array literals may only contain constants")
+                index += 1
+                rows[-1].append(item * sign if item_kind == 'number' else item)
+                separator = peek()
+                index += 1
+                if separator == ('symbol', ','):
+                    continue
+                if separator == ('symbol', ';'):
+                    rows.append([])
+                    continue
+                if separator == ('symbol', '}'):
+                    return ('array', rows)
+                raise ValueError("Unterminated array literal")
+        raise ValueError(f"Unexpected token {value!r}")
+
+    tree = expression()
+    if index != len(tokens):
+        raise ValueError(f"Unexpected trailing input at token {tokens[index][1]!r}")
+    return tree
+
+
+def _formula_array(value):
+    """Materialize a formula value as a 2-D NumPy array."""
+    import numpy as np
+
+    if isinstance(value, AffineGrid):
+        return value.to_array()
+    if isinstance(value, np.ndarray):
+        return value if value.ndim == 2 else value.reshape(1, -1)
+    return np.array([[value]])
+
+
+def _formula_scalar(value):
+    import numpy as np
+
+    if isinstance(value, (AffineGrid, np.ndarray)):
+        array = _formula_array(value)
+        return array[0, 0].item()
+    return value
+
+
+def _formula_window(value, row_start, col_start, rows, cols):
+    if isinstance(value, AffineGrid):
+        return value.window(row_start, col_start, rows, cols)
+    return _formula_array(value)[row_start:row_start + rows, col_start:col_start + cols]
+
+
+def _formula_shape(value):
+    import numpy as np
+
+    if isinstance(value, AffineGrid):
+        return value.shape
+    if isinstance(value, np.ndarray):
+        return _formula_array(value).shape
+    return (1, 1)
+
+
+def _formula_take(value, rows=None, cols=None):
+    total_rows, total_cols = _formula_shape(value)
+    rows = total_rows if rows is None else int(rows)
+    cols = total_cols if cols is None else int(cols)
+    row_count, col_count = min(abs(rows), total_rows), min(abs(cols), total_cols)
+    return _formula_window(value,
+                           total_rows - row_count if rows < 0 else 0,
+                           total_cols - col_count if cols < 0 else 0,
+                           row_count, col_count)
+
+
+def _formula_drop(value, rows=0, cols=0):
+    total_rows, total_cols = _formula_shape(value)
+    rows, cols = int(rows), int(cols)
+    row_count, col_count = max(total_rows - abs(rows), 0), max(total_cols - abs(cols), 0)
+    return _formula_window(value, rows if rows > 0 else 0, cols if cols > 0 else 0, row_count, col_count)
+
+
+def _formula_sequence(rows, cols=1, start=1, step=1):
+    rows, cols = int(rows), int(cols)
+    return AffineGrid(rows, cols, start, cols * step, step)
+
+
+def _formula_array_constrain(value, rows, cols):
+    total_rows, total_cols = _formula_shape(value)
+    return _formula_window(value, 0, 0, min(int(rows), total_rows), min(int(cols), total_cols))
+
+
+def _formula_sortby(value, *by_and_orders):
+    """
+    Excel SORTBY: stable sort of rows (column-shaped keys) or of columns
+    (row-shaped keys) by one or more key arrays, each with an optional
+    1 (ascending) / -1 (descending) order.
+    """
+    import numpy as np
+
+    array = _formula_array(value)
+    keys = []
+    arguments = list(by_and_orders)
+    while arguments:
+        by = _formula_array(arguments.pop(0))
+        order = 1
+        if arguments and not isinstance(arguments[0], (AffineGrid, np.ndarray)):
+            order = arguments.pop(0)
+        keys.append((by, order))
+
+    # A row-shaped key reorders columns, a column-shaped key reorders rows
+    by_columns = keys[0][0].shape[0] == 1 and keys[0][0].shape[1] > 1
+    axis_length = array.shape[1] if by_columns else array.shape[0]
+    if any(by.size != axis_length for by, _ in keys):
+        raise ValueError("SORTBY key arrays must match the size of the sorted array (#VALUE!)")
+    sort_keys = []
+    for by, order in reversed(keys):
+        flat = by.ravel()
+        sort_keys.append(-flat if order == -1 else flat)
+    permutation = np.lexsort(sort_keys) if len(sort_keys) > 1 else np.argsort(sort_keys[0], kind='stable')
+    return array[:, permutation] if by_columns else array[permutation, :]
+
+
+def _formula_sort(value, sort_index=1, order=1, by_col=0):
+    import numpy as np
+
+    array = _formula_array(value)
+    if by_col:
+        key = array[int(sort_index) - 1, :]
+        permutation = np.argsort(-key if order == -1 else key, kind='stable')
+        return array[:, permutation]
+    key = array[:, int(sort_index) - 1]
+    permutation = np.argsort(-key if order == -1 else key, kind='stable')
+    return array[permutation, :]
+
+
+def _formula_aggregate(closed_form, array_function):
+    """Build SUM/MIN/... over any number of scalar or array arguments."""
+    def aggregate(*values):
+        parts = []
+        for value in values:
+            if isinstance(value, AffineGrid):
+                parts.append(getattr(value, closed_form)())
+            elif closed_form == 'count' and not hasattr(value, 'shape'):
+                parts.append(1)
+            else:
+                result = array_function(_formula_array(value))
+                parts.append(result.item() if hasattr(result, 'item') else result)
+        if closed_form in ('sum', 'count'):
+            return sum(parts)
+        return min(parts) if closed_form == 'min' else max(parts)
+    return aggregate
+
+
+def _formula_average(*values):
+    total = _FORMULA_FUNCTIONS['SUM'](*values)
+    count = _FORMULA_FUNCTIONS['COUNT'](*values)
+    return total / count
+
+
+_FORMULA_FUNCTIONS = {
+    'SUM': _formula_aggregate('sum', lambda array: array.sum()),
+    'MIN': _formula_aggregate('min', lambda array: array.min()),
+    'MAX': _formula_aggregate('max', lambda array: array.max()),
+    'COUNT': _formula_aggregate('count', lambda array: array.size),
+    'AVERAGE': _formula_average,
+    'SEQUENCE': _formula_sequence,
+    'ARRAY_CONSTRAIN': _formula_array_constrain,
+    'TAKE': _formula_take,
+    'DROP': _formula_drop,
+    'SORTBY': _formula_sortby,
+    'SORT': _formula_sort,
+    'TRANSPOSE': lambda value: value.transpose() if isinstance(value, AffineGrid) else _formula_array(value).T,
+}
+
+
+def _evaluate_formula_node(node):
+    import numpy as np
+
+    kind = node[0]
+    if kind in ('number', 'string'):
+        return node[1]
+    if kind == 'array':
+        return np.array(node[1])
+    if kind == 'call':
+        name, args = node[1], node[2]
+        if name not in _FORMULA_FUNCTIONS:
+            raise ValueError(f"Unsupported function: {name}")
+        return _FORMULA_FUNCTIONS[name](*(_evaluate_formula_node(arg) for arg in args))
+    if kind == 'unary':
+        operand = _evaluate_formula_node(node[2])
+        if node[1] == '+':
+            return operand
+        return operand.scale(-1) if isinstance(operand, AffineGrid) else -operand
+
+    operator_symbol = node[1]
+    left, right = _evaluate_formula_node(node[2]), _evaluate_formula_node(node[3])
+    # Scalar arithmetic keeps a SEQUENCE affine
+    if isinstance(left, AffineGrid) != isinstance(right, AffineGrid):
+        grid, scalar = (left, right) if isinstance(left, AffineGrid) else (right, left)
+        if not hasattr(scalar, 'shape'):
+            if operator_symbol == '+':
+                return grid.shift(scalar)
+            if operator_symbol == '*':
+                return grid.scale(scalar)
+            if operator_symbol == '-':
+                return grid.shift(-scalar) if grid is left else grid.scale(-1).shift(scalar)
+    if operator_symbol == '&':
+        return f"{_formula_scalar(left)}{_formula_scalar(right)}"
+    if isinstance(left, AffineGrid) or isinstance(right, AffineGrid) or hasattr(left, 'shape') or hasattr(right, 'shape'):
+        left, right = _formula_array(left), _formula_array(right)
+    operations = {
+        '+': lambda a, b: a + b, '-': lambda a, b: a - b, '*': lambda a, b: a * b,
+        '/': lambda a, b: a / b, '^': lambda a, b: a ** b,
+        '=': lambda a, b: a == b, '<>': lambda a, b: a != b, '<': lambda a, b: a < b,
+        '>': lambda a, b: a > b, '<=': lambda a, b: a <= b, '>=': lambda a, b: a >= b,
+    }
+    return operations[operator_symbol](left, right)
+
+
+def evaluate_formula(formula):
+    """
+    Evaluate a Google Sheets / Excel formula such as
+    =SUM(ARRAY_CONSTRAIN(SEQUENCE(100, 100, 12, 10), 1, 10)).
+
+    Supports SEQUENCE, ARRAY_CONSTRAIN, TAKE, DROP, SORTBY, SORT, TRANSPOSE,
+    SUM, AVERAGE, MIN, MAX, COUNT, array literals and arithmetic.
+
+    Returns:
+        int, float or str for scalar results; a list of rows for arrays
+    """
+    import numpy as np
+
+    value = _evaluate_formula_node(parse_formula(formula))
+    if isinstance(value, (AffineGrid, np.ndarray)):
+        return _formula_array(value).tolist()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def extract_formula(text):
+    """Find the first "=FUNCTION(...)" formula in free text, with balanced parentheses."""
+    match = re.search(r'=\s*[A-Za-z_][A-Za-z0-9_.]*\s*\(', text or '')
+    if not match:
+        return None
+    depth = 0
+    in_string = False
+    for position in range(match.start(), len(text)):
+        char = text[position]
+        if char == '"':
+            in_string = not in_string
+        elif not in_string and char == '(':
+            depth += 1
+        elif not in_string and char == ')':
+            depth -= 1
+            if depth == 0:
+                return text[match.start():position + 1]
+    return None
+
+
 def ga1_fourth_solution(query=None):
     """Calculate result of Google Sheets SEQUENCE and ARRAY_CONSTRAIN formula"""
     import re
@@ -1292,43 +2093,18 @@ def ga1_fourth_solution(query=None):
     
     print(f"Using parameters: SEQUENCE({rows}, {cols}, {start}, {step}) constrained to {array_rows}x{array_cols}")
     
-    # Limit calculations to only what's needed
-    actual_rows = min(rows, array_rows)
-    actual_cols = min(cols, array_cols)
-    
-    # Calculate the actual result based on the formula
-    result = 0
-    values = []
-    
-    # For large arrays, use math formula rather than iteration for first row
-    if actual_rows == 1 and actual_cols > 100:
-        first_value = start
-        last_value = start + (actual_cols - 1) * step
-        count = actual_cols
-        result = (first_value + last_value) * count // 2
-        print(f"Calculated sum of large array using formula: {result}")
-    else:
-        # Calculate cell by cell for smaller arrays or multiple rows
-        for r in range(actual_rows):
-            row_values = []
-            for c in range(actual_cols):
-                # In SEQUENCE, values increase row by row
-                # Formula: start + (r * cols + c) * step
-                value = start + (r * cols + c) * step
-                result += value
-                row_values.append(value)
-                
-                # For large arrays, only print a few values
-                if len(row_values) <= 10 or c >= actual_cols - 5:
-                    print(f"Cell [{r},{c}] = {value}")
-                elif len(row_values) == 11:
-                    print("... more values ...")
-            
-            values.append(row_values)
-            
-            # For large arrays, only print a few rows
-            if r >= 5 and r < actual_rows - 5 and len(values) == 6:
-                print("... more rows ...")
+    # Evaluate the formula as written in the query; the extracted parameters
+    # rebuild the standard formula when the query has none (or it can't be parsed)
+    formula = extract_formula(query)
+    default_formula = f"=SUM(ARRAY_CONSTRAIN(SEQUENCE({rows}, {cols}, {start}, {step}), {array_rows}, {array_cols}))"
+    try:
+        if not formula:
+            raise ValueError("no formula in query")
+        print(f"Evaluating: {formula}")
+        result = evaluate_formula(formula)
+    except (ValueError, TypeError, IndexError) as e:
+        print(f"Using {default_formula} ({str(e)})")
+        result = evaluate_formula(default_formula)
     
     print(f"\nFinal sum: {result}")
     return result
@@ -1398,20 +2174,18 @@ def ga1_fifth_solution(query=None):
         values = values[:min_len]
         keys = keys[:min_len]
     
-    # Create pairs and sort them by the keys
-    pairs = list(zip(keys, values))
-    sorted_pairs = sorted(pairs)
-    
-    # Extract the sorted values
-    sorted_values = [v for k, v in sorted_pairs]
-    print(f"Sorted values: {sorted_values}")
-    
-    # Take the specified elements and sum them
-    take_count = take_rows * take_cols
-    elements_to_sum = sorted_values[:take_count]
-    print(f"Taking first {take_count} elements: {elements_to_sum}")
-    
-    result = sum(elements_to_sum)
+    # Evaluate the formula as written in the query, or rebuild it from the parameters
+    formula = extract_formula(query)
+    default_formula = (f"=SUM(TAKE(SORTBY({{{','.join(map(str, values))}}}, "
+                       f"{{{','.join(map(str, keys))}}}), {take_rows}, {take_cols}))")
+    try:
+        if not formula:
+            raise ValueError("no formula in query")
+        print(f"Evaluating: {formula}")
+        result = evaluate_formula(formula)
+    except (ValueError, TypeError, IndexError) as e:
+        print(f"Using {default_formula} ({str(e)})")
+        result = evaluate_formula(default_formula)
     print(f"Sum of taken elements: {result}")
     return result
 
@@ -1448,6 +2222,116 @@ The hidden input value is: h4ck3r_m4n
 """
     return hidden_input_value
 
+# Calendar arithmetic for weekday counts (used by ga1_seventh_solution)
+_WEEKDAY_NAMES = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+
+def _as_date(value):
+    import datetime
+
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(str(value))
+
+
+def count_weekday(start, end, weekday):
+    """
+    Count the days in [start, end] (inclusive) that fall on a given weekday.
+
+    date.fromordinal(1) is a Monday, so ordinal o falls on weekday (o - 1) % 7
+    and the days with weekday w up to ordinal n number (n - 1 - w) // 7 + 1.
+    The count is the difference of that formula at both ends: O(1) for any
+    range, however many centuries it spans.
+
+    Args:
+        start (date or str): First day of the range
+        end (date or str): Last day of the range
+        weekday (int or str): 0 = Monday ... 6 = Sunday, or the day's name
+
+    Returns:
+        int: Number of matching days (0 if end is before start)
+    """
+    if isinstance(weekday, str):
+        weekday = _WEEKDAY_NAMES.index(weekday.lower())
+    first, last = _as_date(start).toordinal(), _as_date(end).toordinal()
+    if last < first:
+        return 0
+
+    def up_to(ordinal):
+        return (ordinal - 1 - weekday) // 7 + 1
+
+    return up_to(last) - up_to(first - 1)
+
+
+class BusinessCalendar:
+    """
+    A week mask plus a holiday list, for counting days in date ranges.
+
+    Mirrors numpy.busday_count, but with inclusive end dates as the course
+    questions use them. Single ranges are counted arithmetically with
+    count_weekday; count_many hands whole arrays of ranges to
+    numpy.busday_count, so thousands of ranges take one vectorized call.
+    """
+
+    def __init__(self, weekmask='1111100', holidays=()):
+        """
+        Args:
+            weekmask (str or iterable): Seven '0'/'1' characters starting on
+                Monday, seven booleans, or an iterable of day names
+            holidays (iterable): Dates (date or ISO string) never counted
+        """
+        if isinstance(weekmask, str) and len(weekmask) == 7 and set(weekmask) <= {'0', '1'}:
+            mask = [flag == '1' for flag in weekmask]
+        else:
+            weekmask = list(weekmask)
+            if all(isinstance(day, str) for day in weekmask):
+                names = {day.lower() for day in weekmask}
+                mask = [name in names for name in _WEEKDAY_NAMES]
+            else:
+                mask = [bool(flag) for flag in weekmask]
+        if len(mask) != 7:
+            raise ValueError("weekmask must describe seven days")
+        self.weekmask = tuple(mask)
+        # Only holidays on counted weekdays can change a count
+        self.holidays = sorted({day for day in map(_as_date, holidays) if self.weekmask[day.weekday()]})
+
+    def count(self, start, end):
+        """Number of counted days in [start, end], holidays excluded."""
+        import bisect
+
+        start, end = _as_date(start), _as_date(end)
+        if end < start:
+            return 0
+        total = sum(count_weekday(start, end, weekday) for weekday in range(7) if self.weekmask[weekday])
+        holidays = bisect.bisect_right(self.holidays, end) - bisect.bisect_left(self.holidays, start)
+        return total - holidays
+
+    def count_many(self, starts, ends):
+        """
+        Count many ranges at once.
+
+        Args:
+            starts (sequence): First days (dates, ISO strings or datetime64)
+            ends (sequence): Last days, inclusive, same length as starts
+
+        Returns:
+            numpy.ndarray: int64 counts, 0 where an end is before its start
+        """
+        import numpy as np
+
+        begin = np.asarray(starts, dtype='datetime64[D]')
+        stop = np.asarray(ends, dtype='datetime64[D]') + np.timedelta64(1, 'D')
+        if not any(self.weekmask):
+            return np.zeros(np.broadcast(begin, stop).shape, dtype=np.int64)
+        calendar = np.busdaycalendar(weekmask=[int(flag) for flag in self.weekmask],
+                                     holidays=np.array(self.holidays, dtype='datetime64[D]'))
+        counts = np.busday_count(begin, stop, busdaycal=calendar)
+        # busday_count returns negative counts for reversed ranges
+        return np.maximum(counts, 0).astype(np.int64)
+
+
 def ga1_seventh_solution(query=None):
     """Calculate the number of specific weekdays in a date range"""
     import datetime
@@ -1455,8 +2339,9 @@ def ga1_seventh_solution(query=None):
 
     # Default parameters
     target_days = ['wednesday']
-    start_date_str = '1981-03-03'
-    end_date_str = '2012-12-30'
+    date_ranges = [('1981-03-03', '2012-12-30')]
+    holidays = []
+    business_days = False
     
     # Try to extract custom parameters from query
     if query:
@@ -1464,9 +2349,8 @@ def ga1_seventh_solution(query=None):
         query_lower = query.lower()
         
         # Extract weekday(s) from query
-        all_days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
         found_days = []
-        for day in all_days:
+        for day in _WEEKDAY_NAMES:
             if day in query_lower:
                 found_days.append(day)
                 print(f"Found day in query: {day}")
@@ -1474,80 +2358,197 @@ def ga1_seventh_solution(query=None):
         if found_days:
             target_days = found_days
             print(f"Using custom days: {', '.join(target_days)}")
-        
-        # Extract date range from query
-        date_range_match = re.search(r'(\d{4}-\d{1,2}-\d{1,2})\s+to\s+(\d{4}-\d{1,2}-\d{1,2})', query)
-        if date_range_match:
-            extracted_start = date_range_match.group(1)
-            extracted_end = date_range_match.group(2)
-            
+        elif re.search(r'\b(?:business|working|work)\s+days?\b', query_lower):
+            business_days = True
+            target_days = _WEEKDAY_NAMES[:5]
+            print("Counting business days (Monday to Friday)")
+        
+        # Holidays listed after "excluding"/"except" are never counted
+        holiday_match = re.search(
+            r'(?:excluding|except)(?:\s+(?:the\s+)?holidays?)?[:\s]+((?:\d{4}-\d{1,2}-\d{1,2}(?:\s*,\s*|\s+and\s+|\s*)?)+)',
+            query_lower)
+        holiday_text = holiday_match.group(1) if holiday_match else ''
+        for holiday in re.findall(r'\d{4}-\d{1,2}-\d{1,2}', holiday_text):
+            try:
+                holidays.append(datetime.datetime.strptime(holiday, "%Y-%m-%d").date())
+            except ValueError:
+                print(f"Ignoring invalid holiday: {holiday}")
+        if holidays:
+            print(f"Excluding {len(holidays)} holiday(s)")
+        
+        # Extract date range(s) from query
+        extracted_ranges = []
+        for extracted_start, extracted_end in re.findall(
+                r'(\d{4}-\d{1,2}-\d{1,2})\s+to\s+(\d{4}-\d{1,2}-\d{1,2})', query):
             # Format dates consistently (ensure 2-digit months and days)
             try:
                 start_date = datetime.datetime.strptime(extracted_start, "%Y-%m-%d")
                 end_date = datetime.datetime.strptime(extracted_end, "%Y-%m-%d")
-                
-                start_date_str = start_date.strftime("%Y-%m-%d")
-                end_date_str = end_date.strftime("%Y-%m-%d")
-                
-                print(f"Using custom date range: {start_date_str} to {end_date_str}")
+                extracted_ranges.append((start_date.date().isoformat(), end_date.date().isoformat()))
             except ValueError:
-                print(f"Error parsing dates. Using default range.")
+                print(f"Error parsing dates {extracted_start} to {extracted_end}. Skipping range.")
+        
+        if extracted_ranges:
+            date_ranges = extracted_ranges
+            print(f"Using custom date range(s): {', '.join(f'{s} to {e}' for s, e in date_ranges)}")
     
-    print(f"Calculating {', '.join(target_days)} between {start_date_str} and {end_date_str}")
+    print(f"Calculating {', '.join(target_days)} across {len(date_ranges)} date range(s)")
     
-    def count_specific_days_in_range(days_of_week, start_date_str, end_date_str):
-        """Count occurrences of specific weekdays between two dates"""
-        try:
-            start_date = datetime.datetime.strptime(start_date_str, "%Y-%m-%d").date()
-            end_date = datetime.datetime.strptime(end_date_str, "%Y-%m-%d").date()
-        except ValueError:
-            print(f"Error: Invalid date format. Using default dates.")
-            start_date = datetime.date(1981, 3, 3)
-            end_date = datetime.date(2012, 12, 30)
-        
-        # Map day names to weekday numbers (0 = Monday, 6 = Sunday)
-        day_map = {
-            "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3, 
-            "friday": 4, "saturday": 5, "sunday": 6
+    starts = [start for start, _ in date_ranges]
+    ends = [end for _, end in date_ranges]
+    if business_days:
+        calendar = BusinessCalendar('1111100', holidays)
+        day_counts = {'business day': calendar.count_many(starts, ends)}
+    else:
+        day_counts = {
+            day: BusinessCalendar([day], holidays).count_many(starts, ends)
+            for day in target_days
         }
-        
-        # Count days for each weekday
-        counts = {}
-        for day in days_of_week:
-            target_weekday = day_map[day.lower()]
-            
-            # Find the first occurrence of the target day
-            current_date = start_date
-            while current_date.weekday() != target_weekday:
-                current_date += datetime.timedelta(days=1)
-                
-            # Count occurrences by adding 7 days each time
-            day_count = 0
-            check_date = current_date
-            while check_date <= end_date:
-                day_count += 1
-                check_date += datetime.timedelta(days=7)
-                
-            counts[day] = day_count
-            
-        return counts, start_date, end_date
-    
-    # Count all specified days in the date range
-    day_counts, start, end = count_specific_days_in_range(target_days, start_date_str, end_date_str)
     
     # Format the result
-    if len(day_counts) == 1:
-        day = target_days[0]
-        result = f"Number of {day.capitalize()}s between {start} and {end}: {day_counts[day]}"
-    else:
-        result = f"Date range: {start} to {end}\n"
-        total = 0
-        for day, count in day_counts.items():
-            result += f"{day.capitalize()}s: {count}\n"
-            total += count
-        result += f"Total of all requested days: {total}"
-    
-    return result
+    results = []
+    for index, (start, end) in enumerate(date_ranges):
+        if len(day_counts) == 1:
+            day, counts = next(iter(day_counts.items()))
+            results.append(f"Number of {day.capitalize()}s between {start} and {end}: {counts[index]}")
+        else:
+            result = f"Date range: {start} to {end}\n"
+            total = 0
+            for day, counts in day_counts.items():
+                result += f"{day.capitalize()}s: {counts[index]}\n"
+                total += int(counts[index])
+            result += f"Total of all requested days: {total}"
+            results.append(result)
+    
+    return "\n\n".join(results) if len(day_counts) > 1 else "\n".join(results)
+
+
+# Streaming CSV tables inside ZIP archives (used by ga1_eighth_solution)
+_ZIP_TABLE_CACHE = {}
+
+_ZIP_TABLE_AGGREGATES = {
+    'sum': 'sum',
+    'total': 'sum',
+    'average': 'mean',
+    'mean': 'mean',
+    'max': 'max',
+    'maximum': 'max',
+    'min': 'min',
+    'minimum': 'min',
+    'count': 'count'
+}
+
+
+class ZipTableIndex:
+    """
+    Column-oriented index of the CSV members of a ZIP archive.
+
+    Each CSV member is decoded once, straight from the zip stream, with
+    pyarrow's block-wise CSV reader and spilled batch by batch to a Parquet
+    file. The member's column names and row count are recorded in a JSON
+    index. Both are keyed by the archive's content hash, so later lookups
+    and aggregates read only the columns they need instead of rescanning
+    the CSV.
+
+    All columns are kept as strings (like csv.DictReader); aggregates cast
+    to numbers on demand.
+    """
+
+    def __init__(self, zip_path):
+        import zipfile
+
+        self.zip_path = zip_path
+        self.content_hash = file_manager.content_hash(zip_path)
+        self.columns_cache = {}  # (member, column) -> pyarrow ChunkedArray
+
+        index_path = file_manager.cache_path("zip_tables", self.content_hash, ".json")
+        if os.path.exists(index_path):
+            with open(index_path, 'r', encoding='utf-8') as f:
+                self.members = json.load(f)
+            if all(os.path.exists(info["parquet"]) for info in self.members.values()):
+                print(f"Loaded ZIP table index from {index_path}")
+                return
+
+        self.members = {}
+        with zipfile.ZipFile(zip_path, 'r') as z:
+            csv_members = [name for name in z.namelist() if name.lower().endswith('.csv')]
+            for number, member in enumerate(csv_members):
+                self.members[member] = self._spill_member(z, member, number)
+
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(self.members, f)
+
+    def _spill_member(self, z, member, number):
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        import pyarrow.parquet as pq
+
+        parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+
+        # Read the header once so every column can be decoded as a string
+        with z.open(member) as f:
+            column_names = pa_csv.open_csv(f, parse_options=parse_options).schema.names
+
+        parquet_path = file_manager.cache_path("zip_tables", f"{self.content_hash}-{number}", ".parquet")
+        convert_options = pa_csv.ConvertOptions(column_types={name: pa.string() for name in column_names})
+        row_count = 0
+        with z.open(member) as f:
+            reader = pa_csv.open_csv(f, parse_options=parse_options, convert_options=convert_options)
+            with pq.ParquetWriter(parquet_path, reader.schema) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+                    row_count += batch.num_rows
+
+        print(f"Indexed {member}: {row_count} rows, {len(column_names)} columns")
+        return {"columns": column_names, "rows": row_count, "parquet": parquet_path}
+
+    @classmethod
+    def for_archive(cls, zip_path):
+        """Load (or reuse) the index for a ZIP archive, cached by content hash."""
+        content_hash = file_manager.content_hash(zip_path)
+        if content_hash not in _ZIP_TABLE_CACHE:
+            _ZIP_TABLE_CACHE[content_hash] = cls(zip_path)
+        return _ZIP_TABLE_CACHE[content_hash]
+
+    def column(self, member, column):
+        """
+        Get one column of a member as a pyarrow ChunkedArray of strings.
+
+        Raises:
+            KeyError: If the member or column does not exist
+        """
+        import pyarrow.parquet as pq
+
+        info = self.members[member]
+        if column not in info["columns"]:
+            raise KeyError(column)
+        if (member, column) not in self.columns_cache:
+            table = pq.read_table(info["parquet"], columns=[column], memory_map=True)
+            self.columns_cache[(member, column)] = table.column(column)
+        return self.columns_cache[(member, column)]
+
+    def value(self, member, column, row):
+        """Get the string value at a row (negative rows count from the end)."""
+        return self.column(member, column)[row].as_py()
+
+    def aggregate(self, member, column, operation):
+        """
+        Aggregate the non-blank cells of a column: 'sum', 'mean', 'min',
+        'max' (numeric) or 'count'.
+
+        Returns:
+            float or int: Aggregate value, or None for an empty column
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        # Blank cells are missing values, as in a spreadsheet
+        values = pc.utf8_trim_whitespace(self.column(member, column))
+        values = pc.filter(values, pc.not_equal(values, ''))
+        if operation == 'count':
+            return len(values)
+        return getattr(pc, operation)(pc.cast(values, pa.float64())).as_py()
+
 
 def ga1_eighth_solution(query=None):
     """Extract value from CSV file in a ZIP archive with support for custom file paths"""
@@ -1570,6 +2571,7 @@ def ga1_eighth_solution(query=None):
     zip_file_path=zip_path
     target_column = "answer"
     row_index = 0  # Default to first row
+    aggregate = None
     
     # Try to extract custom file path from query
     if query:
@@ -1599,6 +2601,13 @@ def ga1_eighth_solution(query=None):
                 target_column = extracted
                 print(f"Looking for column: {target_column}")
         
+        # Aggregates such as "sum of the value column" are answered from the column index
+        aggregate_match = re.search(r'\b(sum|total|average|mean|max(?:imum)?|min(?:imum)?|count)\s+of\s+(?:the\s+)?["\']?(\w+)["\']?\s+column', query, re.IGNORECASE)
+        if aggregate_match:
+            aggregate = _ZIP_TABLE_AGGREGATES[aggregate_match.group(1).lower()]
+            target_column = aggregate_match.group(2)
+            print(f"Computing {aggregate} of column: {target_column}")
+        
         # Check for row specification
         row_match = re.search(r'row\s+(\d+)', query, re.IGNORECASE)
         if row_match:
@@ -1612,7 +2621,37 @@ def ga1_eighth_solution(query=None):
             if not os.path.exists(zip_path):
                 print(f"Error: ZIP file not found at {zip_path}")
                 return "Error: File not found"
-                
+
+            try:
+                index = ZipTableIndex.for_archive(zip_path)
+            except ImportError:
+                print("pyarrow not available, streaming the CSV with the csv module")
+                index = None
+
+            if index is not None:
+                csv_files = list(index.members)
+                if not csv_files:
+                    print("Error: No CSV files found in the ZIP archive")
+                    return "Error: No CSV files in archive"
+
+                target_file = next((f for f in csv_files if f.lower() == "extract.csv"), csv_files[0])
+                info = index.members[target_file]
+                print(f"Processing CSV file: {target_file} ({info['rows']} rows)")
+
+                if column_name not in info["columns"]:
+                    available_columns = ', '.join(info["columns"])
+                    return f"Error: Column '{column_name}' not found. Available columns: {available_columns}"
+                if aggregate:
+                    return index.aggregate(target_file, column_name, aggregate)
+                if not info["rows"]:
+                    return f"Error: CSV file has no data rows"
+                if row_idx >= info["rows"]:
+                    print(f"Warning: Row {row_idx} not found, using last row instead")
+                    row_idx = -1
+                value = index.value(target_file, column_name, row_idx)
+                print(f"Found value '{value}' in column '{column_name}' at row {row_idx}")
+                return value
+
             with zipfile.ZipFile(zip_path, 'r') as z:
                 file_list = z.namelist()
                 if not file_list:
@@ -1642,6 +2681,15 @@ def ga1_eighth_solution(query=None):
                         available_columns = ', '.join(header)
                         return f"Error: Column '{column_name}' not found. Available columns: {available_columns}"
                     
+                    if aggregate:
+                        numbers = [float(row[column_name]) for row in reader if row[column_name].strip()]
+                        if aggregate == 'count':
+                            return len(numbers)
+                        if not numbers:
+                            return None
+                        return {'sum': sum, 'min': min, 'max': max,
+                                'mean': lambda values: sum(values) / len(values)}[aggregate](numbers)
+                    
                     # Extract the value from specified row
                     rows = []
                     for i, row in enumerate(reader):
@@ -1668,6 +2716,13 @@ def ga1_eighth_solution(query=None):
     result = extract_csv_value(zip_file_path)
     
     # Format the final output
+    if aggregate and isinstance(result, str) and result.startswith("Error:"):
+        print(result)
+        return result
+    if result is not None and aggregate:
+        final_output = f"The {aggregate} of the {target_column} column in extract.csv is {result}"
+        print(final_output)
+        return final_output
     if result:
         final_output = f"The answer from extract.csv is {result}"
         print(final_output)
@@ -1675,8 +2730,244 @@ def ga1_eighth_solution(query=None):
     else:
         return "Could not extract value from the CSV file"
 
+# Columnar JSON array sorting (used by ga1_ninth_solution)
+_JSON_SORT_MEMORY_BUDGET = 256 * 1024 * 1024  # bytes of decoded records held at once
+# Decoded small objects take about 8x their JSON text, plus the sort's key columns
+_JSON_DECODED_EXPANSION = 10
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def load_json_fast(text):
+    """Parse JSON with orjson when it is installed, else with the json module."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(text)
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        # orjson rejects some valid input (e.g. integers beyond 64 bits)
+        return json.loads(text)
+
+
+def iter_json_array(stream, chunk_size=1024 * 1024):
+    """
+    Yield the elements of a top-level JSON array read from a text stream.
+
+    Elements are decoded one at a time with JSONDecoder.raw_decode over a
+    sliding buffer, so memory holds one chunk plus one element no matter
+    how long the array is.
+
+    Yields:
+        tuple: (element, length of its JSON text)
+
+    Raises:
+        ValueError: If the stream does not hold a JSON array
+    """
+    decoder = json.JSONDecoder()
+    buffer = stream.read(chunk_size).lstrip()
+    if not buffer.startswith('['):
+        raise ValueError("Expected a JSON array")
+    position = 1
+    expect_element = True
+    eof = False
+
+    while True:
+        # Skip whitespace and separators, keeping enough buffered to decode
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n':
+                position += 1
+            if position < len(buffer) or eof:
+                break
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buffer, position = buffer[position:] + chunk, 0
+        if position >= len(buffer):
+            raise ValueError("Unterminated JSON array")
+        if buffer[position] == ']':
+            return
+        if not expect_element:
+            if buffer[position] != ',':
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {buffer[position]!r}")
+            position += 1
+            expect_element = True
+            continue
+
+        try:
+            element, end = decoder.raw_decode(buffer, position)
+            # A scalar that reaches the end of the buffer may continue in the next chunk
+            complete = end < len(buffer) or eof
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            complete = False
+        if not complete:
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        yield element, end - position
+        position = end
+        expect_element = False
+        if position > chunk_size:
+            buffer, position = buffer[position:], 0
+
+
+def _json_value_size(value):
+    """Approximate bytes a decoded JSON value occupies (sys.getsizeof, recursively)."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        return size + sum(sys.getsizeof(key) + _json_value_size(item) for key, item in value.items())
+    if isinstance(value, list):
+        return size + sum(_json_value_size(item) for item in value)
+    return size
+
+
+def _sort_key_array(values):
+    """A NumPy array that orders like the Python values, or None if they don't fit one."""
+    import numpy as np
+
+    kinds = {type(value) for value in values}
+    if kinds <= {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            return None
+    if kinds <= {int, float}:
+        if any(isinstance(value, int) and abs(value) > 2 ** 53 for value in values):
+            return None
+        return np.array(values, dtype=np.float64)
+    if kinds <= {str}:
+        # NumPy strings drop trailing NULs, which would change the order
+        if any(value.endswith('\x00') for value in values):
+            return None
+        return np.array(values, dtype=str)
+    return None
+
+
+def sort_json_records(records, keys):
+    """
+    Stable multi-key sort of a list of JSON objects.
+
+    The key fields are pulled out into one NumPy column per key and ordered
+    with np.lexsort; the records themselves are only reordered by index.
+    Columns NumPy cannot compare as Python would (mixed types, huge
+    integers) fall back to sorted() with a tuple key, which orders the same.
+
+    Args:
+        records (list): Decoded JSON objects
+        keys (sequence): Field names, most significant first
+
+    Returns:
+        list: The records in sorted order
+
+    Raises:
+        KeyError: If a record lacks one of the keys
+    """
+    import numpy as np
+
+    if len(records) < 2:
+        return list(records)
+    columns = [_sort_key_array([record[key] for record in records]) for key in keys]
+    if any(column is None for column in columns):
+        return sorted(records, key=lambda record: tuple(record[key] for key in keys))
+    # lexsort treats its last key as the primary one
+    order = np.lexsort(columns[::-1])
+    return [records[index] for index in order.tolist()]
+
+
+def iter_compact_json(records, batch_size=10000):
+    """
+    Serialize a sequence of JSON values as a compact array (no spaces),
+    piece by piece.
+
+    Records are encoded batch_size at a time, one C-encoder call per batch,
+    with the batch's brackets stripped.
+    """
+    import itertools
+
+    yield '['
+    records = iter(records)
+    separator = ''
+    while True:
+        batch = list(itertools.islice(records, batch_size))
+        if not batch:
+            break
+        yield separator + _JSON_ENCODER.encode(batch)[1:-1]
+        separator = ','
+    yield ']'
+
+
+def sort_json_array(source, keys, memory_budget=_JSON_SORT_MEMORY_BUDGET):
+    """
+    Sort a JSON array of objects by `keys` and stream the result compactly.
+
+    memory_budget bounds the decoded records, which take several times the
+    size of their JSON text. Input whose text, times _JSON_DECODED_EXPANSION,
+    fits in the budget is parsed in one go (load_json_fast) and sorted with
+    sort_json_records. Larger input is read element by element, sorted in
+    runs of at most memory_budget bytes of decoded records (measured with
+    sys.getsizeof) that are spilled to temporary files as JSON lines, and
+    merged with heapq.merge. Runs are merged in input order, so the sort
+    stays stable.
+
+    Args:
+        source (str): JSON text, or the path of a JSON file
+        keys (sequence): Field names, most significant first
+        memory_budget (int): Approximate bytes of decoded records held in memory
+
+    Yields:
+        str: Pieces of the compact JSON output
+    """
+    import io
+
+    if isinstance(source, str) and not source.lstrip().startswith('[') and os.path.isfile(source):
+        if os.path.getsize(source) * _JSON_DECODED_EXPANSION <= memory_budget:
+            with open(source, 'rb') as f:
+                source = f.read()
+        else:
+            with open(source, 'r', encoding='utf-8') as stream:
+                yield from _external_json_sort(stream, keys, memory_budget)
+            return
+    if len(source) * _JSON_DECODED_EXPANSION <= memory_budget:
+        data = load_json_fast(source)
+        if not isinstance(data, list):
+            raise ValueError("Expected a JSON array")
+        yield from iter_compact_json(sort_json_records(data, keys))
+        return
+    if isinstance(source, bytes):
+        source = source.decode('utf-8')
+    yield from _external_json_sort(io.StringIO(source), keys, memory_budget)
+
+
+def _external_json_sort(stream, keys, memory_budget):
+    import heapq
+    import tempfile
+
+    runs = []
+    buffer = []
+    buffered = 0
+    try:
+        for record, _ in iter_json_array(stream):
+            buffer.append(record)
+            buffered += _json_value_size(record) + 8  # plus its slot in the buffer
+            if buffered > memory_budget:
+                run = tempfile.TemporaryFile('w+', encoding='utf-8')
+                run.writelines(_JSON_ENCODER.encode(record) + '\n' for record in sort_json_records(buffer, keys))
+                run.seek(0)
+                runs.append(run)
+                buffer = []
+                buffered = 0
+        sources = [(json.loads(line) for line in run) for run in runs]
+        sources.append(iter(sort_json_records(buffer, keys)))
+        merged = heapq.merge(*sources, key=lambda record: tuple(record[key] for key in keys))
+        yield from iter_compact_json(merged)
+    finally:
+        for run in runs:
+            run.close()
+
+
 def ga1_ninth_solution(query=None):
-    import json  # Import json inside the function
     question9='''Let's make sure you know how to use JSON. Sort this JSON array of objects by the value of the age field. In case of a tie, sort by the name field. Paste the resulting JSON below without any spaces or newlines.
 
 # [{"name":"Alice","age":0},{"name":"Bob","age":16},{"name":"Charlie","age":23},{"name":"David","age":32},{"name":"Emma","age":95},{"name":"Frank","age":25},{"name":"Grace","age":36},{"name":"Henry","age":71},{"name":"Ivy","age":15},{"name":"Jack","age":55},{"name":"Karen","age":9},{"name":"Liam","age":53},{"name":"Mary","age":43},{"name":"Nora","age":11},{"name":"Oscar","age":40},{"name":"Paul","age":73}]'''
@@ -1703,46 +2994,443 @@ def ga1_ninth_solution(query=None):
         {"name":"Paul","age":73}
     ]
     
-    # Try to extract JSON data from query if provided
-    data = default_json
+    # Try to extract JSON data (and sort fields) from query if provided
+    source = None
+    sort_keys = ["age", "name"]
     if query:
+        primary_match = re.search(r'sort\b.*?\bby the value of the (\w+) field', query, re.IGNORECASE)
+        tie_match = re.search(r'tie,?\s+sort by the (\w+) field', query, re.IGNORECASE)
+        if primary_match:
+            sort_keys = [primary_match.group(1)] + ([tie_match.group(1)] if tie_match else [])
+            print(f"Sorting by: {', '.join(sort_keys)}")
         try:
             # Look for JSON array in the query
             json_match = re.search(r'\[.*\]', query, re.DOTALL)
             if json_match:
-                json_str = json_match.group(0)
-                try:
-                    data = json.loads(json_str)
-                    print(f"Extracted custom JSON data with {len(data)} items")
-                except json.JSONDecodeError:
-                    print("Found JSON-like content but couldn't parse it. Using default data.")
+                source = json_match.group(0)
+            else:
+                # Large arrays are uploaded as .json files instead
+                file_info = file_manager.detect_file_from_query(query)
+                if (file_info.get("exists") and not file_info.get("is_remote")
+                        and str(file_info.get("path", "")).lower().endswith('.json')):
+                    source = file_info["path"]
+                    print(f"Sorting JSON file: {source}")
         except Exception as e:
             print(f"Error extracting JSON from query: {str(e)}")
     
-    def sort_json_objects(data_list):
-        return sorted(data_list, key=lambda obj: (obj["age"], obj["name"]))
-    
-    # Sort the data
-    sorted_data = sort_json_objects(data)
-    
-    # Return the compressed JSON
-    result = json.dumps(sorted_data, separators=(",",":"))
-    print(result)
+    # Sort the data and stream out the compressed JSON
+    try:
+        if source is None:
+            raise ValueError("No JSON array in query")
+        result = ''.join(sort_json_array(source, sort_keys))
+        print(f"Sorted custom JSON data ({len(result)} characters)")
+    except (ValueError, KeyError, TypeError) as e:
+        if source is not None:
+            print(f"Found JSON-like content but couldn't sort it ({e}). Using default data.")
+        result = ''.join(iter_compact_json(sort_json_records(default_json, ["age", "name"])))
+    print(result[:1000])
     return result
 
+# Page-compatible JSON hashing (used by ga1_tenth_solution)
+#
+# tools-in-data-science.pages.dev/jsonhash hashes
+# sha256(UTF-8 of JSON.stringify(JSON.parse(input))). The helpers below
+# reproduce JSON.stringify exactly: compact output, integer-like keys
+# first in numeric order, ECMAScript number formatting and escaped lone
+# surrogates. The fixtures were recorded from the same expression in
+# Node.js and are checked before the pure-Python hash is trusted.
+_JSONHASH_FIXTURES = [
+    ('{"name":"Alice","age":30}',
+     '3e27ab4b2ff7ecc99794f49efa5a4c84d4787c8276411afc666a9a0ef72fb9b8'),
+    ('{"b":"1","a":"2","10":"x","2":"y","01":"z","-1":"w","4294967294":"m","4294967295":"n"}',
+     'c982fbfd3d4e754460487c88275b7c6d55d5da93a293eb78b87e364d5ed63c4b'),
+    ('{"k":"café € 😀","ctl":"\\u0001\\t\\n\\u007f\\u2028","q":"\\"\\\\/"}',
+     '48db3be32eae33e3d11b7ff9a7981cdd16896ae046b0824576bc96d8932f8868'),
+    ('{"lone":"\\ud800x","n":[1,1.0,-0.0,0.1,1e21,1e20,123456789012345678901234,1e-7,0.000001,1.5e300,2.5e-10,12345678901234567890,9007199254740993]}',
+     '0c264268611e32efd99b34ffcf013aa6950ade68de47e43436fd6ed891734ef2'),
+    ('{"dup":"first","x":1,"dup":"second"}',
+     'c499206fc3da9e3ebcb2c5cb3ff0c4d9214c59fc7c4cebe6d4f0049f64c0d2e0'),
+    ('[true,false,null,{"z":{}},[]]',
+     '4df6472c0289653f706e9240bd288fa88f1d471b8c36379e8bae6d72fe10a8b9'),
+    ('{ "spaced" : [ 1 , 2 ] ,\n "nested" : { "b" : 2 , "1" : 1 } }',
+     '815a0a48c1cc8d223284b6bfd11f00c0c9ed4293a5877c8294bb8db1a58bb0c6'),
+]
+_JSONHASH_VERIFIED = {}
+_JS_ARRAY_INDEX_KEY = re.compile(r'0|[1-9][0-9]{0,9}')
+_LONE_SURROGATE = re.compile('[\ud800-\udfff]')
+
+
+def _js_number(value):
+    """Format a number as ECMAScript's Number::toString does."""
+    import math
+
+    if isinstance(value, int):
+        if abs(value) <= 2 ** 53:
+            return str(value)
+        value = float(value)  # JSON.parse keeps a double only
+    if not math.isfinite(value):
+        return 'null'
+    if value == 0:
+        return '0'
+    sign = '-' if value < 0 else ''
+    mantissa, _, exponent = repr(abs(value)).partition('e')
+    whole, _, fraction = mantissa.partition('.')
+    raw = whole + fraction
+    leading_zeros = len(raw) - len(raw.lstrip('0'))
+    digits = raw.strip('0')
+    # value == 0.<digits> * 10**point, as in the ECMAScript algorithm
+    point = len(whole) + int(exponent or 0) - leading_zeros
+    k = len(digits)
+    if k <= point <= 21:
+        text = digits + '0' * (point - k)
+    elif 0 < point <= 21:
+        text = digits[:point] + '.' + digits[point:]
+    elif -6 < point <= 0:
+        text = '0.' + '0' * -point + digits
+    else:
+        e = point - 1
+        text = digits[0] + ('.' + digits[1:] if k > 1 else '') + 'e' + ('+' if e > 0 else '-') + str(abs(e))
+    return sign + text
+
+
+def _js_property_order(obj):
+    """Items of a dict in the order a JavaScript object enumerates them."""
+    index_keys = []
+    other_keys = []
+    for key in obj:
+        if _JS_ARRAY_INDEX_KEY.fullmatch(key) and int(key) < 2 ** 32 - 1:
+            index_keys.append(key)
+        else:
+            other_keys.append(key)
+    index_keys.sort(key=int)
+    return [(key, obj[key]) for key in index_keys + other_keys]
+
+
+def _js_string(value):
+    encoded = json.dumps(value, ensure_ascii=False)
+    return _LONE_SURROGATE.sub(lambda match: '\\u%04x' % ord(match.group(0)), encoded)
+
+
+def iter_js_json(value):
+    """Yield the text of JSON.stringify(value) in pieces (no full string is built)."""
+    if isinstance(value, dict):
+        yield '{'
+        for index, (key, item) in enumerate(_js_property_order(value)):
+            yield (',' if index else '') + _js_string(key) + ':'
+            yield from iter_js_json(item)
+        yield '}'
+    elif isinstance(value, list):
+        yield '['
+        for index, item in enumerate(value):
+            if index:
+                yield ','
+            yield from iter_js_json(item)
+        yield ']'
+    elif isinstance(value, str):
+        yield _js_string(value)
+    elif value is True:
+        yield 'true'
+    elif value is False:
+        yield 'false'
+    elif value is None:
+        yield 'null'
+    else:
+        yield _js_number(value)
+
+
+def jsonhash(data, chunk_size=64 * 1024):
+    """
+    Hash data the way the jsonhash page does, without a browser.
+
+    Args:
+        data: JSON text (str) to parse first, or an already decoded value
+        chunk_size (int): Characters serialized before each hash update
+
+    Returns:
+        str: Hex SHA-256 digest
+
+    Raises:
+        ValueError: If the text is not valid JSON for JSON.parse
+    """
+    import hashlib
+
+    if isinstance(data, str):
+        def reject_constant(name):
+            raise ValueError(f"JSON.parse does not accept {name}")
+
+        data = json.loads(data, parse_constant=reject_constant)
+    digest = hashlib.sha256()
+    pending = []
+    pending_size = 0
+    for piece in iter_js_json(data):
+        pending.append(piece)
+        pending_size += len(piece)
+        if pending_size >= chunk_size:
+            digest.update(''.join(pending).encode('utf-8'))
+            pending = []
+            pending_size = 0
+    digest.update(''.join(pending).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def jsonhash_verified():
+    """True if jsonhash reproduces every recorded fixture (checked once)."""
+    if 'ok' not in _JSONHASH_VERIFIED:
+        _JSONHASH_VERIFIED['ok'] = all(jsonhash(text) == expected for text, expected in _JSONHASH_FIXTURES)
+    return _JSONHASH_VERIFIED['ok']
+
+
+def iter_key_value_pairs(stream):
+    """
+    Stream (key, value) pairs from key=value lines, skipping blank lines,
+    comments and lines without "=". Keys and values are stripped.
+    """
+    for line in stream:
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        yield key.strip(), value.strip()
+
+
+# Pooled headless browsers (used by ga1_tenth/eleventh_solution and ga4_first/second_solution)
+_BROWSER_POOLS = {}
+_BROWSER_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+]
+_JSONHASH_URL = "https://tools-in-data-science.pages.dev/jsonhash"
+_TDS_GA1_URL = "https://exam.sanand.workers.dev/tds-2025-01-ga1#hq-use-devtools"
+_CRICINFO_STATS_URL = "https://stats.espncricinfo.com/ci/engine/stats/index.html?class=2;page={page};template=results;type=batting"
+_IMDB_SEARCH_URL = "https://www.imdb.com/search/title/?title_type=feature&user_rating={lower},{upper}&sort=user_rating,desc"
+
+
+class BrowserPool:
+    """
+    A pool of warm headless Chrome instances leased out one request at a time.
+
+    Starting Chrome (and resolving its driver) costs seconds, so browsers are
+    created on first demand, up to `size`, and handed back to the pool after
+    each lease instead of quitting. A browser that has died is discarded and
+    replaced on the next lease. Pages load with the "eager" strategy (return
+    at DOMContentLoaded) and images and fonts are blocked, since the
+    solutions only read the DOM.
+
+    The URLs the solutions visit are module constants (_JSONHASH_URL,
+    _CRICINFO_STATS_URL, ...), so tests can point them at a local static
+    file server.
+    """
+
+    def __init__(self, size=2, headless=True, block_resources=True, user_agent=None,
+                 user_data_dir=None, page_load_timeout=30):
+        """
+        Args:
+            size (int): Maximum number of browsers kept alive
+            headless (bool): Run Chrome without a window
+            block_resources (bool): Block images and fonts
+            user_agent (str, optional): User-Agent header to send
+            user_data_dir (str, optional): Chrome profile to reuse (a profile
+                can only be open in one browser, so this forces size 1)
+            page_load_timeout (int): Seconds before driver.get() gives up
+        """
+        import threading
+
+        self.size = 1 if user_data_dir else size
+        self.headless = headless
+        self.block_resources = block_resources
+        self.user_agent = user_agent
+        self.user_data_dir = user_data_dir
+        self.page_load_timeout = page_load_timeout
+        self.idle = []  # returned browsers, most recently used last
+        self.drivers = []  # every live browser, idle or leased
+        self.starting = 0  # slots reserved by browsers still starting up
+        # Notified whenever a browser is returned or a slot frees up
+        self.available = threading.Condition()
+
+    @classmethod
+    def shared(cls, **options):
+        """Return the process-wide pool for a set of browser options."""
+        import atexit
+
+        key = tuple(sorted(options.items()))
+        if key not in _BROWSER_POOLS:
+            _BROWSER_POOLS[key] = cls(**options)
+            atexit.register(_BROWSER_POOLS[key].close)
+        return _BROWSER_POOLS[key]
+
+    def _start(self):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("--log-level=3")
+        options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        options.page_load_strategy = 'eager'
+        if self.user_agent:
+            options.add_argument(f"--user-agent={self.user_agent}")
+        if self.user_data_dir:
+            options.add_argument(f"user-data-dir={self.user_data_dir}")
+        if self.block_resources:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        driver.set_page_load_timeout(self.page_load_timeout)
+        if self.block_resources:
+            # Fonts have no content setting; block them (and stray images) at the network level
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BROWSER_BLOCKED_URLS})
+        return driver
+
+    def _launch(self):
+        """Start a browser in a slot already reserved in self.starting."""
+        try:
+            driver = self._start()
+        except BaseException:
+            with self.available:
+                self.starting -= 1
+                self.available.notify()
+            raise
+        with self.available:
+            self.starting -= 1
+            self.drivers.append(driver)
+        return driver
+
+    def _acquire(self):
+        with self.available:
+            # Wait until a browser comes back or a slot frees up (a discarded
+            # or failed browser releases its slot)
+            while not self.idle and len(self.drivers) + self.starting >= self.size:
+                self.available.wait()
+            if self.idle:
+                return self.idle.pop()
+            self.starting += 1
+        # Chrome takes seconds to start; don't hold the lock meanwhile
+        return self._launch()
+
+    def _release(self, driver):
+        with self.available:
+            if driver in self.drivers:
+                self.idle.append(driver)
+                self.available.notify()
+                return
+        # The pool was closed while the browser was leased
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _discard(self, driver):
+        with self.available:
+            if driver in self.drivers:
+                self.drivers.remove(driver)
+            self.available.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def warm(self, count=None):
+        """Start browsers ahead of the first request (defaults to the pool size)."""
+        count = min(self.size, count or self.size)
+        while True:
+            with self.available:
+                if len(self.drivers) + self.starting >= count:
+                    return
+                self.starting += 1
+            self._release(self._launch())
+
+    def run(self, callback):
+        """
+        Lease a browser, call callback(driver) and return its result.
+
+        The browser goes back to the pool afterwards; if it turns out to have
+        died, it is discarded and the callback is retried once on a fresh one.
+        """
+        from selenium.common.exceptions import WebDriverException
+
+        for attempt in range(2):
+            driver = self._acquire()
+            try:
+                result = callback(driver)
+            except WebDriverException:
+                try:
+                    driver.current_url
+                except WebDriverException:
+                    self._discard(driver)
+                    if attempt == 0:
+                        continue
+                    raise
+                self._release(driver)
+                raise
+            except BaseException:
+                self._release(driver)
+                raise
+            self._release(driver)
+            return result
+
+    def load(self, driver, url, wait_for=None, timeout=15):
+        """
+        Navigate a leased driver to url and wait until the page is usable.
+
+        Waits for the DOM to be ready and, if given, for a CSS selector to be
+        present, instead of sleeping a fixed time.
+
+        Raises:
+            selenium.common.exceptions.TimeoutException: If the wait times out
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        driver.get(url)
+        wait = WebDriverWait(driver, timeout)
+        wait.until(lambda d: d.execute_script("return document.readyState") != "loading")
+        if wait_for:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_for)))
+
+    def fetch_html(self, url, wait_for=None, timeout=15):
+        """
+        Return the rendered HTML (the live DOM after scripts ran) of a page.
+
+        Args:
+            url (str): Page to load
+            wait_for (str, optional): CSS selector that must be present first
+            timeout (int): Seconds to wait for the DOM and the selector
+
+        Returns:
+            str: document.documentElement.outerHTML
+        """
+        def render(driver):
+            self.load(driver, url, wait_for, timeout)
+            return driver.execute_script("return document.documentElement.outerHTML")
+
+        return self.run(render)
+
+    def close(self):
+        """Quit every browser in the pool."""
+        with self.available:
+            drivers, self.drivers = self.drivers, []
+            self.idle = []
+            self.available.notify_all()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
 def ga1_tenth_solution(query=None):
-    import sys
-    import json
-    import requests
     import os
     import re  # Added for regex pattern matching
-    import time
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.chrome.options import Options
-    from webdriver_manager.chrome import ChromeDriverManager
-    from contextlib import contextmanager
     
     print(f"Processing multi-cursor JSON solution with query: {query[:100] if query else 'None'}...")
     
@@ -1779,166 +3467,117 @@ def ga1_tenth_solution(query=None):
         print(f"Error: File not found at {filename}")
         return f"Error: File not found at {filename}. Please check the file path or upload the file."
 
-    def convert_file(filename):
-        """Convert key=value pairs from file into a JSON object"""
-        data = {}
-        with open(filename, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    data[key.strip()] = value.strip()
-        return data
-
     def get_json_hash_using_web_interface(json_data):
-        """Get hash by simulating manual entry on the website"""
-
-        @contextmanager
-        def suppress_stdout_stderr():
-            """Context manager to suppress stdout and stderr."""
-            old_stdout, old_stderr = sys.stdout, sys.stderr
-            null = open(os.devnull, "w")
-            try:
-                sys.stdout, sys.stderr = null, null
-                yield
-            finally:
-                sys.stdout, sys.stderr = old_stdout, old_stderr
-                null.close()
-
-        json_str = json.dumps(json_data, separators=(',', ':'))
-        print(f"Generated JSON: {json_str[:100]}..." if len(json_str) > 100 else json_str)
-
-        # Setup Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--log-level=3")
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        """Get hash from the jsonhash page in a pooled browser"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        json_str = json.dumps(json_data, separators=(',', ':'), ensure_ascii=False)
+        pool = BrowserPool.shared()
+
+        def compute_hash(driver):
+            pool.load(driver, _JSONHASH_URL, wait_for="textarea[name='json']")
+            textarea = driver.find_element(By.CSS_SELECTOR, "textarea[name='json']")
+            # Setting the value directly is much faster than send_keys for large JSON
+            driver.execute_script("arguments[0].value = arguments[1];", textarea, json_str)
+            driver.find_element(By.CSS_SELECTOR, "button.btn-success").click()
+            # Wait for the result field to be filled instead of sleeping
+            WebDriverWait(driver, 10).until(
+                lambda d: d.find_element(By.ID, "result").get_attribute("value"))
+            return driver.find_element(By.ID, "result").get_attribute("value")
 
         try:
-            with suppress_stdout_stderr():
-                driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-                driver.get("https://tools-in-data-science.pages.dev/jsonhash")
-                # Find the textarea and input the JSON data
-                textarea = driver.find_element(By.CSS_SELECTOR, "textarea[name='json']")
-                textarea.clear()
-                textarea.send_keys(json_str)
-                # Click the hash button
-                hash_button = driver.find_element(By.CSS_SELECTOR, "button.btn-success")
-                hash_button.click()
-                # Wait for result to load
-                time.sleep(2)
-                # Retrieve the result from the result field
-                hash_result = driver.find_element(By.ID, "result").get_attribute("value")
-                driver.quit()
-            return hash_result
+            return pool.run(compute_hash)
         except Exception as e:
             print(f"Error using web interface: {e}")
             return f"Error using web interface: {str(e)}"
 
-    # Convert the file content into a dictionary
+    # Convert the file content into a dictionary, one line at a time
     print(f"Processing file: {filename}")
     try:
-        data = convert_file(filename)
+        with open(filename, 'r', encoding='utf-8') as f:
+            data = dict(iter_key_value_pairs(f))
         print(f"Extracted {len(data)} key-value pairs from file")
     except Exception as e:
         print(f"Error converting file: {e}")
         return f"Error converting file: {str(e)}"
     
-    # Get hash using the web interface
-    hash_result = get_json_hash_using_web_interface(data)
+    # Hash in Python when it reproduces the page's recorded results
+    if jsonhash_verified():
+        hash_result = jsonhash(data)
+    else:
+        print("Pure-Python jsonhash failed its fixtures; using the web interface")
+        hash_result = get_json_hash_using_web_interface(data)
     print(f"Hash result: {hash_result}")
     return hash_result
 
 def ga1_eleventh_solution(query=None):
     """Find sum of data-value attributes for divs with class 'foo'"""
-    from selenium import webdriver
+    from selenium.common.exceptions import TimeoutException
     from selenium.webdriver.common.by import By
-    from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
     import os
-    import time
     
     print("Starting CSS selector challenge solution...")
     
-    # Setup Chrome options for headless operation
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--log-level=3")
-    
     # Use the authenticated Chrome profile
     user_data_dir = "E:\\data science tool\\chrome_profile"
     if os.path.exists(user_data_dir):
-        chrome_options.add_argument(f"user-data-dir={user_data_dir}")
+        pool = BrowserPool.shared(user_data_dir=user_data_dir)
         print(f"Using saved Chrome profile from: {user_data_dir}")
     else:
+        pool = BrowserPool.shared()
         print(f"Warning: Chrome profile not found at {user_data_dir}")
     
-    try:
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.set_page_load_timeout(30)  # Increase timeout for slow connections
-        
-        # Navigate to the challenge page
-        url = "https://exam.sanand.workers.dev/tds-2025-01-ga1#hq-use-devtools"
-        print(f"Navigating to: {url}")
-        driver.get(url)
+    def read_data_values(driver):
+        """Load the challenge page and return the data-value of every div.foo (None on a login page)"""
+        print(f"Navigating to: {_TDS_GA1_URL}")
+        pool.load(driver, _TDS_GA1_URL)
         
-        # Wait longer for page load
-        time.sleep(5)
+        # The hidden element is rendered by the page's scripts; wait for it rather than sleeping
+        try:
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.foo")))
+        except TimeoutException:
+            pass
         
         # Check if we're on a login page
         page_source = driver.page_source.lower()
         if "login" in driver.title.lower() or "sign in" in page_source or "login" in page_source:
-            print("Login page detected. Authentication failed.")
-            driver.quit()
-            # Fall back to solution 2
-            return direct_api_solution()
-        
-        # Use CSS selector to find div elements with class 'foo'
-        elements = driver.find_elements(By.CSS_SELECTOR, "div.foo")
-        count = len(elements)
-        print(f"Found {count} div elements with class 'foo'")
-        
-        if count == 0:
-            # Try looking in shadow DOM or hidden elements
-            print("No elements found - trying additional strategies...")
-            # Execute JS to find all matching elements regardless of visibility
-            js_result = driver.execute_script("""
-                return Array.from(document.querySelectorAll('div.foo')).map(el => 
-                    parseInt(el.getAttribute('data-value') || 0)
-                ).reduce((a, b) => a + b, 0);
-            """)
-            
-            if js_result is not None:
-                print(f"Found with JavaScript: sum = {js_result}")
-                driver.quit()
-                return f"Sum of data-value attributes: {js_result}"
-        
-        # Calculate sum of data-value attributes
-        total_sum = 0
-        for element in elements:
-            data_value = element.get_attribute("data-value")
-            if data_value:
-                try:
-                    total_sum += int(data_value)
-                    print(f"Found element with data-value: {data_value}")
-                except ValueError:
-                    print(f"Non-integer data-value: {data_value}")
+            return None
         
-        print(f"Final sum: {total_sum}")
-        return f"Sum of data-value attributes: {total_sum}"
+        # One script call instead of a WebDriver round trip per element
+        return driver.execute_script("""
+            return Array.from(document.querySelectorAll('div.foo'))
+                .map(el => el.getAttribute('data-value'));
+        """)
     
+    try:
+        data_values = pool.run(read_data_values)
     except Exception as e:
         print(f"Error in headless solution: {e}")
         # Fall back to solution 2
         return direct_api_solution()
     
-    finally:
-        if 'driver' in locals():
-            driver.quit()
+    if data_values is None:
+        print("Login page detected. Authentication failed.")
+        # Fall back to solution 2
+        return direct_api_solution()
+    
+    print(f"Found {len(data_values)} div elements with class 'foo'")
+    
+    # Calculate sum of data-value attributes
+    total_sum = 0
+    for data_value in data_values:
+        if data_value:
+            try:
+                total_sum += int(data_value)
+                print(f"Found element with data-value: {data_value}")
+            except ValueError:
+                print(f"Non-integer data-value: {data_value}")
+    
+    print(f"Final sum: {total_sum}")
+    return f"Sum of data-value attributes: {total_sum}"
 
 def direct_api_solution():
     """Fallback solution using direct API calls"""
@@ -1983,6 +3622,150 @@ def direct_api_solution():
         return "Sum of data-value attributes: 242"  # Known answer
 
 
+# Encoding-aware streaming aggregation (used by ga1_twelfth_solution)
+_ENCODING_PROBE_SIZE = 64 * 1024
+
+
+def detect_text_encoding(sample):
+    """
+    Guess the encoding of a text file from its first bytes.
+
+    A byte-order mark decides directly. Otherwise NUL bytes concentrated
+    in the odd (even) positions indicate BOM-less UTF-16-LE (-BE), a strict
+    UTF-8 decode of the sample (allowing a sequence cut off at the end)
+    indicates UTF-8, and anything else is treated as CP-1252, or Latin-1
+    when the sample uses bytes CP-1252 leaves undefined.
+
+    Args:
+        sample (bytes): Leading bytes of the file
+
+    Returns:
+        str: Python codec name
+    """
+    import codecs
+
+    for bom, encoding in ((codecs.BOM_UTF32_LE, 'utf-32'), (codecs.BOM_UTF32_BE, 'utf-32'),
+                          (codecs.BOM_UTF8, 'utf-8-sig'),
+                          (codecs.BOM_UTF16_LE, 'utf-16'), (codecs.BOM_UTF16_BE, 'utf-16')):
+        if sample.startswith(bom):
+            return encoding
+
+    if len(sample) >= 2:
+        half = len(sample) // 2
+        odd_zeros = sample[1::2].count(0)
+        even_zeros = sample[0::2].count(0)
+        if odd_zeros > 0.3 * half and even_zeros < 0.05 * half:
+            return 'utf-16-le'
+        if even_zeros > 0.3 * half and odd_zeros < 0.05 * half:
+            return 'utf-16-be'
+
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    if any(byte in sample for byte in (0x81, 0x8D, 0x8F, 0x90, 0x9D)):
+        return 'latin-1'
+    return 'cp1252'
+
+
+def iter_decoded_lines(stream, encoding, initial=b'', chunk_size=1024 * 1024):
+    """
+    Decode a binary stream incrementally and yield lines with their endings.
+
+    Only one chunk plus a partial line is held in memory, so this works on
+    zip member streams of any size. Multi-byte sequences and BOMs split
+    across chunks are handled by the incremental decoder.
+
+    Args:
+        stream: Binary file-like object (e.g. ZipFile.open())
+        encoding (str): Codec name
+        initial (bytes): Bytes already read from the stream (e.g. by a probe)
+        chunk_size (int): Bytes read per step
+
+    Yields:
+        str: Lines including their line terminators
+    """
+    import codecs
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ''
+    chunk = initial or stream.read(chunk_size)
+    while True:
+        final = not chunk
+        # Split on \n only (like open(..., newline='')): \r\n stays intact
+        # for csv, and characters such as U+2028 stay inside their field
+        *lines, pending = (pending + decoder.decode(chunk, final=final)).split('\n')
+        for line in lines:
+            yield line + '\n'
+        if final:
+            if pending:
+                yield pending
+            break
+        chunk = stream.read(chunk_size)
+
+
+def sum_symbol_values(zip_path, symbols, file_configs=None, members=None):
+    """
+    Sum the value column of rows whose first column is one of `symbols`,
+    across the text members of a ZIP archive.
+
+    Members are decoded straight from the zip stream; nothing is extracted
+    to disk and memory stays bounded by the read chunk size.
+
+    Args:
+        zip_path (str): Path to the ZIP archive
+        symbols (iterable): Symbols to match against the first column
+        file_configs (dict, optional): member name -> {"encoding", "delimiter"};
+            missing entries are detected with detect_text_encoding and by
+            sniffing the first line for tabs
+        members (list, optional): Members to read (defaults to all .csv/.txt)
+
+    Returns:
+        dict: total, matches, invalid_values and per-member encodings
+    """
+    import csv
+    import itertools
+    import zipfile
+
+    symbol_set = frozenset(symbols)
+    file_configs = file_configs or {}
+    result = {"total": 0.0, "matches": 0, "invalid_values": 0, "encodings": {}}
+
+    with zipfile.ZipFile(zip_path, 'r') as z:
+        if members is None:
+            members = [name for name in z.namelist() if name.lower().endswith(('.csv', '.txt'))]
+        available = set(z.namelist())
+
+        for member in members:
+            if member not in available:
+                print(f"Warning: File {member} not found in ZIP")
+                continue
+            config = file_configs.get(member, {})
+            with z.open(member) as stream:
+                probe = stream.read(_ENCODING_PROBE_SIZE)
+                encoding = config.get("encoding") or detect_text_encoding(probe)
+                lines = iter_decoded_lines(stream, encoding, initial=probe)
+
+                delimiter = config.get("delimiter")
+                if delimiter is None:
+                    first_line = next(lines, '')
+                    delimiter = '\t' if '\t' in first_line else ','
+                    lines = itertools.chain([first_line], lines)
+
+                print(f"Processing {member} with {encoding} encoding")
+                result["encodings"][member] = encoding
+                for row in csv.reader(lines, delimiter=delimiter):
+                    if len(row) >= 2 and row[0] in symbol_set:
+                        try:
+                            result["total"] += float(row[1].strip())
+                            result["matches"] += 1
+                        except ValueError:
+                            result["invalid_values"] += 1
+
+    return result
+
+
 def ga1_twelfth_solution(query=None):
     """
     Process files in q-unicode-data.zip with different encodings and sum values 
@@ -1994,17 +3777,14 @@ def ga1_twelfth_solution(query=None):
     Returns:
         str: Sum of values associated with the target symbols
     """
-    import os
     import re
-    import zipfile
-    import csv
-    import io
-    import codecs
-    import tempfile
-    import shutil
     
-    # Target symbols to search for
+    # Target symbols to search for, e.g. "where the symbol matches œ OR Ž OR Ÿ across"
     target_symbols = ["œ", "Ž", "Ÿ"]
+    if query:
+        symbols_match = re.search(r'symbol\s+matches\s+(.+?)\s+across', query, re.IGNORECASE)
+        if symbols_match:
+            target_symbols = [symbol.strip() for symbol in re.split(r'\s+OR\s+', symbols_match.group(1)) if symbol.strip()]
     print(f"Looking for symbols: {', '.join(target_symbols)}")
     
     # Define file encoding configurations
@@ -2050,66 +3830,14 @@ def ga1_twelfth_solution(query=None):
     
     print(f"Opening ZIP file: {zip_file_path}")
     
-    # Process the ZIP file
-    total_sum = 0
-    temp_dir = tempfile.mkdtemp()
-    
+    # Stream and decode each file straight from the archive
     try:
-        # Extract files to temporary directory
-        with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
-            print(f"Extracted files to temporary directory")
-        
-        # Process each file with its specific encoding
-        for filename, config in file_configs.items():
-            file_path = os.path.join(temp_dir, filename)
-            
-            if not os.path.exists(file_path):
-                print(f"Warning: File {filename} not found in ZIP")
-                continue
-                
-            print(f"Processing {filename} with {config['encoding']} encoding")
-            
-            # Special handling for UTF-16
-            if config["encoding"].lower() == "utf-16":
-                with open(file_path, 'rb') as f:
-                    # Check for BOM and skip if present
-                    content = f.read()
-                    if content.startswith(codecs.BOM_UTF16_LE):
-                        content = content[2:]
-                    
-                    # Decode and process
-                    text = content.decode('utf-16')
-                    reader = csv.reader(io.StringIO(text), delimiter=config["delimiter"])
-                    
-                    for row in reader:
-                        if len(row) >= 2 and row[0] in target_symbols:
-                            try:
-                                value = float(row[1].strip())
-                                total_sum += value
-                                print(f"Found symbol {row[0]} with value {value}")
-                            except ValueError:
-                                print(f"Invalid value format: {row[1]}")
-            else:
-                # Regular handling for other encodings
-                with open(file_path, 'r', encoding=config["encoding"]) as f:
-                    reader = csv.reader(f, delimiter=config["delimiter"])
-                    
-                    for row in reader:
-                        if len(row) >= 2 and row[0] in target_symbols:
-                            try:
-                                value = float(row[1].strip())
-                                total_sum += value
-                                print(f"Found symbol {row[0]} with value {value}")
-                            except ValueError:
-                                print(f"Invalid value format: {row[1]}")
-    
+        totals = sum_symbol_values(zip_file_path, target_symbols, file_configs, members=list(file_configs))
     except Exception as e:
         return f"Error processing ZIP file: {str(e)}"
-    
-    finally:
-        # Clean up temporary directory
-        shutil.rmtree(temp_dir)
+
+    total_sum = totals["total"]
+    print(f"Matched {totals['matches']} rows ({totals['invalid_values']} invalid values)")
     
     # Return the total sum as an integer if it's a whole number
     if total_sum.is_integer():
@@ -2118,7 +3846,11 @@ def ga1_twelfth_solution(query=None):
         result = total_sum
         
     print(f"Total sum: {result}")
-    return f"The sum of values associated with symbols œ, Ž, and Ÿ is {result}"
+    if len(target_symbols) > 2:
+        symbol_list = ", ".join(target_symbols[:-1]) + ", and " + target_symbols[-1]
+    else:
+        symbol_list = " and ".join(target_symbols)
+    return f"The sum of values associated with symbols {symbol_list} is {result}"
 
 def ga1_thirteenth_solution(query=None):
     """
@@ -2240,6 +3972,229 @@ def ga1_thirteenth_solution(query=None):
         print(f"Error creating GitHub repository: {str(e)}")
         print(traceback.format_exc())
         return f"Error: {str(e)}"
+
+
+# In-memory shell pipelines over ZIP archives (used by ga1_fourteenth/sixteenth_solution)
+_PIPELINE_CHUNK_SIZE = 1024 * 1024
+
+
+class ZipVirtualFS:
+    """
+    A read-only, in-memory view of the files in a ZIP archive.
+
+    Paths map to archive members plus a chain of line transforms, so shell
+    steps such as `sed -i`, `mv` and `rename` become new views instead of
+    writes: nothing is extracted and file contents are only read (streamed
+    from the archive) when a pipeline consumes them.
+    """
+
+    def __init__(self, zip_path, entries=None, archive=None):
+        import zipfile
+
+        self.zip_path = zip_path
+        self.archive = archive or zipfile.ZipFile(zip_path, 'r')
+        if entries is None:
+            entries = {
+                info.filename: (info.filename, ())
+                for info in self.archive.infolist() if not info.is_dir()
+            }
+        self.entries = entries  # virtual path -> (member name, line transforms)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.archive.close()
+
+    def _derive(self, entries):
+        return ZipVirtualFS(self.zip_path, entries, self.archive)
+
+    def glob(self, pattern='*', directory=''):
+        """
+        Expand a shell glob in one directory, as bash would with LC_ALL=C.
+
+        Only regular files are returned, hidden files need a pattern that
+        starts with ".", and names are sorted bytewise.
+        """
+        import fnmatch
+
+        prefix = directory.rstrip('/') + '/' if directory else ''
+        names = []
+        for path in self.entries:
+            if not path.startswith(prefix) or '/' in path[len(prefix):]:
+                continue
+            name = path[len(prefix):]
+            if name.startswith('.') and not pattern.startswith('.'):
+                continue
+            if fnmatch.fnmatchcase(name, pattern):
+                names.append(path)
+        return sorted(names, key=lambda name: name.encode('utf-8'))
+
+    def substitute(self, pattern, replacement, paths=None):
+        """
+        Apply a byte regex substitution to every line, like `sed -i 's/.../.../g'`.
+
+        Args:
+            pattern (bytes or compiled pattern): Regex (matches never span lines)
+            replacement (bytes): Replacement, may use group references
+            paths (iterable, optional): Files to rewrite (defaults to all)
+        """
+        regex = re.compile(pattern) if isinstance(pattern, bytes) else pattern
+
+        def transform(lines):
+            return (regex.sub(replacement, line) for line in lines)
+
+        targets = set(self.entries if paths is None else paths)
+        return self._derive({
+            path: (member, transforms + (transform,)) if path in targets else (member, transforms)
+            for path, (member, transforms) in self.entries.items()
+        })
+
+    def flatten(self):
+        """
+        Move every file into the top-level directory.
+
+        A name that is already taken becomes "<base>_from_<parent><ext>".
+        """
+        entries = {}
+        for path, entry in self.entries.items():
+            name = path.rsplit('/', 1)[-1]
+            if name in entries:
+                parent = path.rsplit('/', 2)[-2] if path.count('/') else ''
+                base, ext = os.path.splitext(name)
+                name = f"{base}_from_{parent}{ext}"
+            entries[name] = entry
+        return self._derive(entries)
+
+    def rename(self, mapping):
+        """
+        Rename files by a dict {old path: new path} or a function of the file
+        name (applied to the last path component).
+        """
+        entries = {}
+        for path, entry in self.entries.items():
+            if callable(mapping):
+                directory, _, name = path.rpartition('/')
+                new_path = (directory + '/' if directory else '') + mapping(name)
+            else:
+                new_path = mapping.get(path, path)
+            entries[new_path] = entry
+        return self._derive(entries)
+
+    def read_chunks(self, path, chunk_size=_PIPELINE_CHUNK_SIZE):
+        """Stream a file's (transformed) content as byte chunks."""
+        member, transforms = self.entries[path]
+        if not transforms:
+            with self.archive.open(member) as stream:
+                yield from iter(lambda: stream.read(chunk_size), b'')
+            return
+        yield from self.read_lines(path)
+
+    def read_lines(self, path):
+        """Stream a file's (transformed) content line by line, newlines kept."""
+        member, transforms = self.entries[path]
+        with self.archive.open(member) as stream:
+            lines = iter_byte_lines(iter(lambda: stream.read(_PIPELINE_CHUNK_SIZE), b''))
+            for transform in transforms:
+                lines = transform(lines)
+            yield from lines
+
+
+def shift_digits(name, step=1):
+    """Replace every digit in a name with the digit `step` later (9 -> 0 for step 1)."""
+    return name.translate(str.maketrans('0123456789', ''.join(str((d + step) % 10) for d in range(10))))
+
+
+def iter_byte_lines(chunks):
+    """Split a stream of byte chunks into lines, each keeping its b'\\n'."""
+    pending = b''
+    for chunk in chunks:
+        *lines, pending = (pending + chunk).split(b'\n')
+        for line in lines:
+            yield line + b'\n'
+    if pending:
+        yield pending
+
+
+def cat_files(fs, paths):
+    """`cat paths...`: the files' bytes, concatenated."""
+    for path in paths:
+        yield from fs.read_chunks(path)
+
+
+def grep_lines(fs, paths, pattern=rb'.'):
+    """
+    `grep pattern paths...`: matching lines, prefixed with "path:" when more
+    than one file is searched. A last line without a newline gets one, as
+    grep prints it.
+    """
+    regex = re.compile(pattern)
+    show_names = len(paths) > 1
+    for path in paths:
+        prefix = path.encode('utf-8') + b':' if show_names else b''
+        for line in fs.read_lines(path):
+            content = line[:-1] if line.endswith(b'\n') else line
+            if regex.search(content):
+                yield prefix + content + b'\n'
+
+
+def c_sort(lines, memory_budget=256 * 1024 * 1024):
+    """
+    `LC_ALL=C sort`: order lines bytewise, ignoring their newline.
+
+    Lines are sorted in memory while they fit in memory_budget; beyond that,
+    sorted runs are spilled to temporary files and merged with heapq.merge,
+    so input of any size is sorted in bounded memory.
+
+    Yields:
+        bytes: Sorted lines, each ending in b'\\n'
+    """
+    import heapq
+    import tempfile
+
+    runs = []
+    buffer = []
+    buffered_bytes = 0
+    for line in lines:
+        content = line[:-1] if line.endswith(b'\n') else line
+        buffer.append(content)
+        buffered_bytes += len(content) + 48  # bytes object overhead
+        if buffered_bytes > memory_budget:
+            buffer.sort()
+            run = tempfile.TemporaryFile()
+            run.writelines(content + b'\n' for content in buffer)
+            run.seek(0)
+            runs.append(run)
+            buffer = []
+            buffered_bytes = 0
+
+    buffer.sort()
+    if not runs:
+        for content in buffer:
+            yield content + b'\n'
+        return
+
+    try:
+        sources = [(content + b'\n' for content in buffer)] + runs
+        yield from heapq.merge(*sources, key=lambda line: line[:-1])
+    finally:
+        for run in runs:
+            run.close()
+
+
+def sha256sum(chunks):
+    """`sha256sum`: hex digest of a byte stream."""
+    import hashlib
+
+    sha256 = hashlib.sha256()
+    for chunk in chunks:
+        sha256.update(chunk)
+    return sha256.hexdigest()
+
+
 def ga1_fourteenth_solution(query=None):
     """
     Process files in a ZIP archive, replacing all instances of "IITM" with "IIT Madras".
@@ -2252,10 +4207,6 @@ def ga1_fourteenth_solution(query=None):
     """
     import re
     import os
-    import zipfile
-    import hashlib
-    import tempfile
-    import shutil
     
     print("Processing ZIP file to replace text across files...")
     
@@ -2295,62 +4246,125 @@ def ga1_fourteenth_solution(query=None):
     
     print(f"Opening ZIP file: {zip_file_path}")
     
-    # Create a temporary directory for extraction
-    extract_folder = tempfile.mkdtemp(prefix="replace_text_")
-    
     try:
-        # Extract zip file
-        with zipfile.ZipFile(zip_file_path, 'r') as z:
-            z.extractall(extract_folder)
-        print(f"Extracted ZIP file to temporary directory")
-        
-        # Compile regex pattern for case-insensitive 'iitm'
-        pattern = re.compile(b'iitm', re.IGNORECASE)
-        replacement = b'IIT Madras'
-        
-        # Replace text in all files
-        modified_count = 0
-        for name in sorted(os.listdir(extract_folder)):
-            file_path = os.path.join(extract_folder, name)
-            if os.path.isfile(file_path):
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                
-                new_content = pattern.sub(replacement, content)
-                
-                if content != new_content:
-                    modified_count += 1
-                    with open(file_path, 'wb') as f:
-                        f.write(new_content)
-        
-        print(f"Modified {modified_count} files")
-        
-        # Calculate SHA-256 hash of all files in sorted order
-        # This is equivalent to running "cat * | sha256sum" in bash
-        sha256 = hashlib.sha256()
-        file_count = 0
-        for name in sorted(os.listdir(extract_folder)):
-            file_path = os.path.join(extract_folder, name)
-            if os.path.isfile(file_path):
-                file_count += 1
-                with open(file_path, 'rb') as f:
-                    sha256.update(f.read())
+        # sed -i 's/IITM/IIT Madras/gI' * && cat * | sha256sum, without extracting
+        with ZipVirtualFS(zip_file_path) as fs:
+            fs = fs.substitute(re.compile(b'iitm', re.IGNORECASE), b'IIT Madras')
+            files = fs.glob('*')
+            hash_result = sha256sum(cat_files(fs, files))
         
-        hash_result = sha256.hexdigest()
-        print(f"Processed {file_count} files and calculated SHA-256 hash")
+        print(f"Processed {len(files)} files and calculated SHA-256 hash")
         
         return f"The SHA-256 hash is: {hash_result}"
         
     except Exception as e:
         return f"Error processing ZIP file: {str(e)}"
-    
-    finally:
-        # Clean up temporary directory
-        try:
-            shutil.rmtree(extract_folder)
-            print("Cleaned up temporary directory")
-        except:
-            pass
+
+
+# Metadata-only queries over ZIP central directories (used by ga1_fifteenth_solution)
+_ZIP_DIRECTORY_CACHE = {}
+
+
+def _ist_timezone():
+    import datetime
+
+    return datetime.timezone(datetime.timedelta(hours=5, minutes=30), 'IST')
+
+
+class ZipDirectory:
+    """
+    Parsed central directory of a ZIP archive: name, size and modification
+    time of every file, without extracting anything.
+
+    A ZIP entry's DOS date_time has no timezone. It is read as
+    `archive_tz`, which defaults to IST, the zone the course archives are
+    built and extracted in. When an entry carries an extended-timestamp
+    extra field (0x5455, as written by Info-ZIP), its exact UTC mtime is
+    used instead, as `unzip` would. Modification times are stored as epoch
+    seconds, so filters are plain comparisons.
+    """
+
+    def __init__(self, zip_path, archive_tz=None):
+        import datetime
+        import struct
+        import zipfile
+
+        archive_tz = archive_tz or _ist_timezone()
+        self.entries = []  # (name, size, mtime epoch seconds)
+        with zipfile.ZipFile(zip_path, 'r') as z:
+            for info in z.infolist():
+                if info.is_dir():
+                    continue
+                mtime = None
+                extra = info.extra
+                while len(extra) >= 4:
+                    field_id, field_size = struct.unpack('<HH', extra[:4])
+                    data = extra[4:4 + field_size]
+                    if field_id == 0x5455 and len(data) >= 5 and data[0] & 1:
+                        mtime = struct.unpack('<i', data[1:5])[0]
+                        break
+                    extra = extra[4 + field_size:]
+                if mtime is None:
+                    mtime = datetime.datetime(*info.date_time, tzinfo=archive_tz).timestamp()
+                self.entries.append((info.filename, info.file_size, mtime))
+
+    @classmethod
+    def for_archive(cls, zip_path):
+        """Load (or reuse) the directory of an archive, cached by content hash."""
+        content_hash = file_manager.content_hash(zip_path)
+        if content_hash not in _ZIP_DIRECTORY_CACHE:
+            _ZIP_DIRECTORY_CACHE[content_hash] = cls(zip_path)
+        return _ZIP_DIRECTORY_CACHE[content_hash]
+
+    def query(self, min_size=None, max_size=None, modified_after=None, modified_before=None,
+              name_pattern=None, recursive=False):
+        """
+        Filter files by metadata, like `ls -l` on the extracted folder.
+
+        Args:
+            min_size (int, optional): Minimum size in bytes (inclusive)
+            max_size (int, optional): Maximum size in bytes (inclusive)
+            modified_after (datetime, optional): Aware datetime; files modified
+                at or after it match (a naive datetime is taken as IST)
+            modified_before (datetime, optional): Exclusive upper bound
+            name_pattern (str, optional): Shell glob matched against the file name
+            recursive (bool): Include files in subdirectories (default: top level only)
+
+        Returns:
+            list: (name, size, mtime epoch seconds) tuples sorted by name
+        """
+        import fnmatch
+
+        def to_epoch(moment):
+            if moment is None:
+                return None
+            if moment.tzinfo is None:
+                moment = moment.replace(tzinfo=_ist_timezone())
+            return moment.timestamp()
+
+        after, before = to_epoch(modified_after), to_epoch(modified_before)
+        matches = []
+        for name, size, mtime in self.entries:
+            if not recursive and '/' in name:
+                continue
+            if min_size is not None and size < min_size:
+                continue
+            if max_size is not None and size > max_size:
+                continue
+            if after is not None and mtime < after:
+                continue
+            if before is not None and mtime >= before:
+                continue
+            if name_pattern and not fnmatch.fnmatchcase(name.rsplit('/', 1)[-1], name_pattern):
+                continue
+            matches.append((name, size, mtime))
+        return sorted(matches)
+
+    def total_size(self, **filters):
+        """Sum of the sizes of the files matching query(**filters)."""
+        return sum(size for _, size, _ in self.query(**filters))
+
+
 def ga1_fifteenth_solution(query=None):
     """
     Process a ZIP file with file attributes and calculate total size of files matching criteria.
@@ -2363,11 +4377,7 @@ def ga1_fifteenth_solution(query=None):
     """
     import os
     import re
-    import zipfile
     import datetime
-    import time
-    import tempfile
-    import shutil
     
     print("Processing ZIP file to calculate file sizes...")
     
@@ -2415,99 +4425,39 @@ def ga1_fifteenth_solution(query=None):
     
     print(f"Opening ZIP file: {zip_file_path}")
     
-    def extract_zip_preserving_timestamps(zip_path):
-        """Extract a zip file while preserving file timestamps"""
-        # Create temporary directory for extraction
-        extract_dir = tempfile.mkdtemp(prefix="file_attributes_")
-        
-        try:
-            print(f"Extracting to temporary directory: {extract_dir}")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-                
-                # Set timestamps from zip info
-                for info in zip_ref.infolist():
-                    if info.filename[-1] == '/':  # Skip directories
-                        continue
-                        
-                    # Get file path in extraction directory
-                    file_path = os.path.join(extract_dir, info.filename)
-                    
-                    # Convert DOS timestamp to Unix timestamp
-                    date_time = info.date_time
-                    timestamp = time.mktime((
-                        date_time[0], date_time[1], date_time[2],
-                        date_time[3], date_time[4], date_time[5],
-                        0, 0, -1
-                    ))
-                    
-                    # Set file modification time
-                    os.utime(file_path, (timestamp, timestamp))
-            
-            return extract_dir
-        except Exception as e:
-            print(f"Error extracting ZIP: {str(e)}")
-            shutil.rmtree(extract_dir, ignore_errors=True)
-            raise
+    # Size and date filters stated in the query override the defaults
+    if query:
+        size_match = re.search(r'at\s+least\s+(\d+)\s+bytes', query, re.IGNORECASE)
+        if size_match:
+            min_size = int(size_match.group(1))
+            print(f"Using minimum size from query: {min_size} bytes")
+        date_match = re.search(r'on\s+or\s+after\s+(.+?\d{1,2}:\d{2}\s*[ap]m)\s*IST', query, re.IGNORECASE)
+        if date_match:
+            date_str = f"{date_match.group(1).strip()} IST"
+    
+    def parse_ist_date(text):
+        """Parse dates such as "Sun, 31 Oct, 2010, 9:43 am IST" as IST"""
+        text = re.sub(r'\s*IST$', '', text.strip())
+        for date_format in ("%a, %d %b, %Y, %I:%M %p", "%a, %d %b %Y, %I:%M %p", "%d %b, %Y, %I:%M %p", "%d %b %Y, %I:%M %p"):
+            try:
+                return datetime.datetime.strptime(text, date_format).replace(tzinfo=_ist_timezone())
+            except ValueError:
+                continue
+        raise ValueError(f"Unrecognised date: {text}")
     
-    def list_files_with_attributes(directory):
-        """List all files with their sizes and timestamps"""
-        files_info = []
-        
-        for filename in os.listdir(directory):
-            file_path = os.path.join(directory, filename)
-            
-            if os.path.isfile(file_path):
-                file_size = os.path.getsize(file_path)
-                mod_time = datetime.datetime.fromtimestamp(os.path.getmtime(file_path))
-                
-                files_info.append({
-                    'name': filename,
-                    'size': file_size,
-                    'modified': mod_time,
-                    'path': file_path
-                })
-        
-        # Sort files by name
-        files_info.sort(key=lambda x: x['name'])
-        return files_info
-    
-    def calculate_total_size_filtered(files_info, min_file_size, min_date):
-        """Calculate total size of files meeting criteria"""
-        total_size = 0
-        matching_files = []
-        
-        for file_info in files_info:
-            if file_info['size'] >= min_file_size and file_info['modified'] >= min_date:
-                total_size += file_info['size']
-                matching_files.append(file_info)
-                print(f"Matched file: {file_info['name']} - {file_info['size']} bytes - {file_info['modified']}")
-        
-        return total_size, matching_files
-    
-    # Process the ZIP file
-    temp_dir = None
     try:
-        # Extract files to temporary directory
-        temp_dir = extract_zip_preserving_timestamps(zip_file_path)
+        # Sizes and timestamps come straight from the ZIP central directory
+        directory = ZipDirectory.for_archive(zip_file_path)
+        print(f"Found {len(directory.entries)} files in ZIP")
         
-        # List all files with attributes
-        files_info = list_files_with_attributes(temp_dir)
-        print(f"Found {len(files_info)} files in ZIP")
-        
-        # Set the minimum date (Oct 31, 2010, 9:43 AM IST)
-        # Convert to local time zone
-        ist_offset = 5.5 * 3600  # IST is UTC+5:30
-        local_tz_offset = -time.timezone  # Local timezone offset in seconds
-        adjustment = ist_offset - local_tz_offset
-        
-        min_timestamp = datetime.datetime(2010, 10, 31, 9, 43, 0)
-        min_timestamp = min_timestamp - datetime.timedelta(seconds=adjustment)
+        min_timestamp = parse_ist_date(date_str)
         print(f"Using minimum date: {min_timestamp}")
         
-        # Calculate total size of files meeting criteria
-        total_size, matching_files = calculate_total_size_filtered(
-            files_info, min_size, min_timestamp)
+        matching_files = directory.query(min_size=min_size, modified_after=min_timestamp)
+        for name, size, mtime in matching_files:
+            modified = datetime.datetime.fromtimestamp(mtime, _ist_timezone())
+            print(f"Matched file: {name} - {size} bytes - {modified}")
+        total_size = sum(size for _, size, _ in matching_files)
         
         print(f"Found {len(matching_files)} matching files")
         print(f"Total size of matching files: {total_size} bytes")
@@ -2516,15 +4466,6 @@ def ga1_fifteenth_solution(query=None):
         
     except Exception as e:
         return f"Error processing ZIP file: {str(e)}"
-    
-    finally:
-        # Clean up temporary directory
-        if temp_dir and os.path.exists(temp_dir):
-            try:
-                shutil.rmtree(temp_dir)
-                print("Cleaned up temporary directory")
-            except:
-                print("Warning: Failed to clean up temporary directory")
 
 def ga1_sixteenth_solution(query=None):
     """
@@ -2538,11 +4479,6 @@ def ga1_sixteenth_solution(query=None):
     """
     import re
     import os
-    import zipfile
-    import hashlib
-    import tempfile
-    import shutil
-    from pathlib import Path
     
     print("Processing ZIP file to move and rename files...")
     
@@ -2582,91 +4518,14 @@ def ga1_sixteenth_solution(query=None):
     
     print(f"Opening ZIP file: {zip_file_path}")
     
-    # Create a temporary directory for extraction
-    extract_dir = tempfile.mkdtemp(prefix="move_rename_")
-    
     try:
-        # Extract zip file
-        with zipfile.ZipFile(zip_file_path, 'r') as z:
-            z.extractall(extract_dir)
-        print(f"Extracted ZIP file to temporary directory")
-        
-        # Create a flat directory for all files
-        flat_dir = os.path.join(extract_dir, "flat_files")
-        os.makedirs(flat_dir, exist_ok=True)
-        
-        # Move all files to flat directory
-        moved_files = 0
-        for root, dirs, files in os.walk(extract_dir):
-            # Skip the flat_dir itself
-            if os.path.abspath(root) == os.path.abspath(flat_dir):
-                continue
-            
-            for file in files:
-                source_path = os.path.join(root, file)
-                dest_path = os.path.join(flat_dir, file)
-                
-                # If the destination file already exists, generate a unique name
-                if os.path.exists(dest_path):
-                    base, ext = os.path.splitext(file)
-                    dest_path = os.path.join(flat_dir, f"{base}_from_{os.path.basename(root)}{ext}")
-                
-                # Move the file
-                shutil.copy2(source_path, dest_path)  # Use copy2 to preserve metadata
-                moved_files += 1
+        # mv */* . && rename digits +1 && grep . * | LC_ALL=C sort | sha256sum, without extracting
+        with ZipVirtualFS(zip_file_path) as fs:
+            fs = fs.flatten().rename(shift_digits)
+            files = fs.glob('*')
+            print(f"Moved {len(files)} files to flat directory and renamed digits")
+            hash_result = sha256sum(c_sort(grep_lines(fs, files)))
         
-        print(f"Moved {moved_files} files to flat directory")
-        
-        # Rename files by replacing digits with the next digit
-        renamed_files = 0
-        for filename in os.listdir(flat_dir):
-            file_path = os.path.join(flat_dir, filename)
-            
-            if os.path.isfile(file_path):
-                # Create new filename by replacing digits
-                new_filename = ""
-                for char in filename:
-                    if char.isdigit():
-                        # Replace digit with the next one (9->0)
-                        new_digit = str((int(char) + 1) % 10)
-                        new_filename += new_digit
-                    else:
-                        new_filename += char
-                
-                # Rename the file if the name has changed
-                if new_filename != filename:
-                    new_path = os.path.join(flat_dir, new_filename)
-                    os.rename(file_path, new_path)
-                    renamed_files += 1
-        
-        print(f"Renamed {renamed_files} files")
-        
-        # Calculate SHA-256 hash equivalent to: grep . * | LC_ALL=C sort | sha256sum
-        files = sorted(os.listdir(flat_dir))
-        all_lines = []
-        
-        for filename in files:
-            filepath = os.path.join(flat_dir, filename)
-            if os.path.isfile(filepath):
-                try:
-                    with open(filepath, 'r', errors='replace') as f:
-                        for line_num, line in enumerate(f, 1):
-                            if line.strip():  # Skip empty lines
-                                # Format similar to grep output: filename:line
-                                formatted_line = f"{filename}:{line}"
-                                all_lines.append(formatted_line)
-                except Exception as e:
-                    print(f"Error reading file {filename}: {e}")
-        
-        # Sort lines (LC_ALL=C ensures byte-by-byte sorting)
-        sorted_lines = sorted(all_lines)
-        
-        # Calculate hash
-        sha256 = hashlib.sha256()
-        for line in sorted_lines:
-            sha256.update(line.encode('utf-8'))
-        
-        hash_result = sha256.hexdigest()
         print(f"Calculated SHA-256 hash of sorted grep output")
         
         return f"The SHA-256 hash is: {hash_result}"
@@ -2676,14 +4535,283 @@ def ga1_sixteenth_solution(query=None):
         print(f"Error processing ZIP file: {str(e)}")
         print(traceback.format_exc())
         return f"Error processing ZIP file: {str(e)}"
-    
-    finally:
-        # Clean up temporary directory
-        try:
-            shutil.rmtree(extract_dir)
-            print("Cleaned up temporary directory")
-        except:
-            print("Warning: Failed to clean up temporary directory")
+
+
+# Streaming line comparison (used by ga1_seventeenth_solution)
+_NO_FINAL_NEWLINE = b'\x00<no newline at end of file>'
+# LCS mode gives up beyond this many deleted plus inserted lines
+_LCS_MAX_DISTANCE = 20000
+
+
+def iter_line_blocks(stream, block_size=8 * 1024 * 1024):
+    """
+    Read a binary stream in large blocks and yield lists of complete lines.
+
+    Lines end at b'\\r\\n', b'\\n' or a lone b'\\r', as in text mode with
+    universal newlines, and are yielded without their terminator. An
+    unterminated last line gets a marker appended, so it never equals the
+    same text followed by a newline.
+    """
+    pending = b''
+    for block in iter(lambda: stream.read(block_size), b''):
+        data = pending + block
+        # A trailing b'\r' may be the first half of a b'\r\n' split across blocks
+        carry = b'\r' if data.endswith(b'\r') else b''
+        if carry:
+            data = data[:-1]
+        lines = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n').split(b'\n')
+        pending = lines.pop() + carry
+        if lines:
+            yield lines
+    if pending.endswith(b'\r'):
+        yield [pending[:-1]]
+    elif pending:
+        yield [pending + _NO_FINAL_NEWLINE]
+
+
+def count_positional_differences(stream_a, stream_b, block_size=8 * 1024 * 1024):
+    """
+    Compare two streams line by line at the same positions, in one pass.
+
+    Both streams are read in lockstep, one block at a time. Each stretch
+    of lines available on both sides is compared with map(operator.ne),
+    a C-level loop, and identical stretches (the common case) exit early
+    through one list comparison. Memory holds at most a block per side.
+
+    Returns:
+        dict: lines_a, lines_b and different (differing line pairs; extra
+        lines in the longer stream are not counted)
+    """
+    import operator
+
+    blocks_a = iter_line_blocks(stream_a, block_size)
+    blocks_b = iter_line_blocks(stream_b, block_size)
+    lines_a, lines_b = [], []
+    count_a = count_b = different = 0
+
+    while True:
+        if not lines_a:
+            lines_a = next(blocks_a, None)
+            if lines_a is None:
+                break
+            count_a += len(lines_a)
+        if not lines_b:
+            lines_b = next(blocks_b, None)
+            if lines_b is None:
+                break
+            count_b += len(lines_b)
+
+        paired = min(len(lines_a), len(lines_b))
+        chunk_a, chunk_b = lines_a[:paired], lines_b[:paired]
+        if chunk_a != chunk_b:
+            different += sum(map(operator.ne, chunk_a, chunk_b))
+        lines_a, lines_b = lines_a[paired:], lines_b[paired:]
+
+    # Count whatever is left of the longer stream
+    count_a += sum(len(lines) for lines in blocks_a)
+    count_b += sum(len(lines) for lines in blocks_b)
+    return {"lines_a": count_a, "lines_b": count_b, "different": different}
+
+
+def myers_edit_distance(a, b, max_distance=None):
+    """
+    Number of deletions plus insertions in a shortest edit script from a to b
+    (Myers' O((N+M)D) greedy algorithm).
+
+    Only the furthest-reaching diagonal array is kept, so memory is linear in
+    the distance searched: max_distance if given, otherwise N + M.
+
+    Raises:
+        ValueError: If the distance is larger than max_distance
+    """
+    n, m = len(a), len(b)
+    limit = n + m if max_distance is None else min(n + m, max_distance)
+    if n + m == 0:
+        return 0
+    offset = limit + 1
+    furthest = [0] * (2 * limit + 3)
+    for distance in range(limit + 1):
+        for k in range(-distance, distance + 1, 2):
+            if k == -distance or (k != distance and furthest[offset + k - 1] < furthest[offset + k + 1]):
+                x = furthest[offset + k + 1]  # insertion
+            else:
+                x = furthest[offset + k - 1] + 1  # deletion
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            furthest[offset + k] = x
+            if x >= n and y >= m:
+                return distance
+    raise ValueError(f"Edit distance is larger than {max_distance}")
+
+
+def _unique_common_anchors(a, b):
+    """
+    Patience diff anchors: lines occurring exactly once in a and once in b,
+    as the longest chain of (i, j) pairs increasing on both sides.
+
+    Args:
+        a, b (numpy.ndarray): Line hashes
+    """
+    import bisect
+    import numpy as np
+
+    def unique_positions(hashes):
+        values, positions, counts = np.unique(hashes, return_index=True, return_counts=True)
+        once = counts == 1
+        return values[once], positions[once]
+
+    values_a, positions_a = unique_positions(a)
+    values_b, positions_b = unique_positions(b)
+    _, index_a, index_b = np.intersect1d(values_a, values_b, assume_unique=True, return_indices=True)
+    order = np.argsort(positions_a[index_a])
+    pairs_a = positions_a[index_a][order].tolist()
+    pairs_b = positions_b[index_b][order].tolist()
+
+    # Longest increasing subsequence of the b positions, by patience sorting
+    tails, tail_index, previous = [], [], [-1] * len(pairs_b)
+    for index, j in enumerate(pairs_b):
+        slot = bisect.bisect_left(tails, j)
+        if slot:
+            previous[index] = tail_index[slot - 1]
+        if slot == len(tails):
+            tails.append(j)
+            tail_index.append(index)
+        else:
+            tails[slot] = j
+            tail_index[slot] = index
+    chain = []
+    index = tail_index[-1] if tail_index else -1
+    while index >= 0:
+        chain.append((pairs_a[index], pairs_b[index]))
+        index = previous[index]
+    return chain[::-1]
+
+
+def patience_edit_distance(a, b, max_distance=_LCS_MAX_DISTANCE):
+    """
+    Deletions plus insertions between two arrays of line hashes, diffed the
+    way `git diff --patience` does.
+
+    Each window (initially the whole input) has its common prefix and suffix
+    trimmed and is split at the lines unique to both sides; windows without
+    such anchors are diffed exactly with myers_edit_distance. Myers therefore
+    only sees the regions between anchors, and its cost is bounded by
+    max_distance. The result is minimal except where the anchors themselves
+    are not on a longest common subsequence, which is rare in practice.
+
+    Args:
+        a, b (array.array): 64-bit line hashes ('q')
+        max_distance (int): Largest distance searched
+
+    Raises:
+        ValueError: If the distance is larger than max_distance
+    """
+    import numpy as np
+
+    hashes_a = np.frombuffer(a, dtype=np.int64)
+    hashes_b = np.frombuffer(b, dtype=np.int64)
+    distance = 0
+    windows = [(0, len(a), 0, len(b))]
+    while windows:
+        start_a, end_a, start_b, end_b = windows.pop()
+        # Small windows (most gaps between anchors) go straight to Myers
+        if (end_a - start_a) + (end_b - start_b) > 64:
+            paired = min(end_a - start_a, end_b - start_b)
+            mismatch = np.flatnonzero(hashes_a[start_a:start_a + paired] != hashes_b[start_b:start_b + paired])
+            prefix = int(mismatch[0]) if len(mismatch) else paired
+            start_a, start_b = start_a + prefix, start_b + prefix
+            paired -= prefix
+            mismatch = np.flatnonzero(hashes_a[end_a - paired:end_a][::-1] != hashes_b[end_b - paired:end_b][::-1])
+            suffix = int(mismatch[0]) if len(mismatch) else paired
+            end_a, end_b = end_a - suffix, end_b - suffix
+
+            if start_a < end_a and start_b < end_b:
+                anchors = _unique_common_anchors(hashes_a[start_a:end_a], hashes_b[start_b:end_b])
+                if anchors:
+                    # The anchors match; diff the gaps between them as windows of their own
+                    previous_a, previous_b = start_a, start_b
+                    for i, j in anchors:
+                        if start_a + i > previous_a or start_b + j > previous_b:
+                            windows.append((previous_a, start_a + i, previous_b, start_b + j))
+                        previous_a, previous_b = start_a + i + 1, start_b + j + 1
+                    windows.append((previous_a, end_a, previous_b, end_b))
+                    continue
+
+        if start_a == end_a or start_b == end_b:
+            distance += (end_a - start_a) + (end_b - start_b)
+        else:
+            try:
+                distance += myers_edit_distance(a[start_a:end_a], b[start_b:end_b], max_distance - distance)
+            except ValueError:
+                distance = max_distance + 1
+        if distance > max_distance:
+            raise ValueError(f"Edit distance is larger than {max_distance}")
+    return distance
+
+
+def count_lcs_differences(stream_a, stream_b, block_size=8 * 1024 * 1024, max_distance=_LCS_MAX_DISTANCE):
+    """
+    Compare two streams as `diff` does: lines deleted from a and inserted in b
+    along a common subsequence (patience_edit_distance).
+
+    Lines are read block-wise and reduced to 64-bit hashes. Memory is not
+    bounded: it is 8 bytes per line of each stream, plus a few times that in
+    temporaries while anchors are found, so a file of 100 million short lines
+    needs a few GB. Time is O((N+M) log(N+M)) for the anchoring plus Myers on
+    the windows between anchors, capped by max_distance.
+
+    Returns:
+        dict: lines_a, lines_b, deleted, inserted and different (deleted + inserted)
+
+    Raises:
+        ValueError: If more than max_distance lines are deleted or inserted
+    """
+    from array import array
+
+    hashes = []
+    for stream in (stream_a, stream_b):
+        line_hashes = array('q')
+        for lines in iter_line_blocks(stream, block_size):
+            line_hashes.extend(map(hash, lines))
+        hashes.append(line_hashes)
+    a, b = hashes
+
+    distance = patience_edit_distance(a, b, max_distance)
+    common = (len(a) + len(b) - distance) // 2
+    deleted = len(a) - common
+    inserted = len(b) - common
+    return {"lines_a": len(a), "lines_b": len(b), "deleted": deleted,
+            "inserted": inserted, "different": deleted + inserted}
+
+
+def compare_zip_members(zip_path, member_a, member_b, mode="positional", block_size=8 * 1024 * 1024):
+    """
+    Compare two text members of a ZIP archive without extracting them.
+
+    Args:
+        zip_path (str): Path to the ZIP archive
+        member_a (str): First member name
+        member_b (str): Second member name
+        mode (str): "positional" (line i vs line i) or "lcs" (diff-style)
+        block_size (int): Bytes read per block from each member
+
+    Returns:
+        dict: Counts from count_positional_differences or count_lcs_differences
+
+    Raises:
+        KeyError: If a member is missing from the archive
+        ValueError: If LCS mode finds more than _LCS_MAX_DISTANCE changed lines
+    """
+    import zipfile
+
+    compare = count_lcs_differences if mode == "lcs" else count_positional_differences
+    with zipfile.ZipFile(zip_path, 'r') as z:
+        with z.open(member_a) as stream_a, z.open(member_b) as stream_b:
+            return compare(stream_a, stream_b, block_size)
+
+
 def ga1_seventeenth_solution(query=None):
     """
     Process a ZIP file containing two files and count the number of different lines.
@@ -2697,9 +4825,6 @@ def ga1_seventeenth_solution(query=None):
     import re
     import os
     import zipfile
-    import tempfile
-    import shutil
-    from pathlib import Path
     
     print("Processing ZIP file to compare text files...")
     
@@ -2739,67 +4864,41 @@ def ga1_seventeenth_solution(query=None):
     
     print(f"Opening ZIP file: {zip_file_path}")
     
-    # Create a temporary directory for extraction
-    extract_dir = tempfile.mkdtemp(prefix="compare_files_")
+    # Line i vs line i by default; diff-style (LCS) counts for insert/delete variants
+    mode = "positional"
+    if query and re.search(r'\b(lcs|myers|diff\s+output|inserted|deleted|added|removed)\b', query, re.IGNORECASE):
+        mode = "lcs"
     
     try:
-        # Extract the zip file
+        # Stream both files straight from the archive
         with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
-        print(f"Extracted ZIP file to temporary directory")
-        
-        # Paths to the two files
-        file1_path = os.path.join(extract_dir, "a.txt")
-        file2_path = os.path.join(extract_dir, "b.txt")
-        
-        # Check if both files exist
-        if not os.path.exists(file1_path):
+            names = set(zip_ref.namelist())
+        if "a.txt" not in names:
             return "Error: File 'a.txt' not found in the ZIP archive"
-        if not os.path.exists(file2_path):
+        if "b.txt" not in names:
             return "Error: File 'b.txt' not found in the ZIP archive"
         
-        # Count lines in each file to verify they have the same length
-        with open(file1_path, 'r', encoding='utf-8', errors='replace') as f:
-            line_count_1 = sum(1 for _ in f)
-        with open(file2_path, 'r', encoding='utf-8', errors='replace') as f:
-            line_count_2 = sum(1 for _ in f)
+        result = compare_zip_members(zip_file_path, "a.txt", "b.txt", mode=mode)
         
-        print(f"a.txt has {line_count_1} lines")
-        print(f"b.txt has {line_count_2} lines")
+        print(f"a.txt has {result['lines_a']} lines")
+        print(f"b.txt has {result['lines_b']} lines")
         
-        if line_count_1 != line_count_2:
-            print(f"Warning: Files have different line counts: a.txt ({line_count_1}) vs b.txt ({line_count_2})")
+        if result['lines_a'] != result['lines_b']:
+            print(f"Warning: Files have different line counts: a.txt ({result['lines_a']}) vs b.txt ({result['lines_b']})")
         
-        # Count lines that differ
-        different_lines = 0
-        with open(file1_path, 'r', encoding='utf-8', errors='replace') as f1, open(file2_path, 'r', encoding='utf-8', errors='replace') as f2:
-            for line_num, (line1, line2) in enumerate(zip(f1, f2), 1):
-                if line1 != line2:
-                    different_lines += 1
-                    # For debugging - show a few sample differences
-                    if different_lines <= 3:
-                        print(f"Line {line_num} differs:")
-                        print(f"  a.txt: {line1[:50].rstrip()}..." if len(line1) > 50 else f"  a.txt: {line1.rstrip()}")
-                        print(f"  b.txt: {line2[:50].rstrip()}..." if len(line2) > 50 else f"  b.txt: {line2.rstrip()}")
-        
-        print(f"Found {different_lines} differing lines out of {min(line_count_1, line_count_2)} total lines")
+        if mode == "lcs":
+            print(f"diff: {result['deleted']} lines deleted, {result['inserted']} lines inserted")
+        else:
+            print(f"Found {result['different']} differing lines out of {min(result['lines_a'], result['lines_b'])} total lines")
         
         # Return just the number of differences
-        return f"{different_lines}"
+        return f"{result['different']}"
     
     except Exception as e:
         import traceback
         print(f"Error processing ZIP file: {str(e)}")
         print(traceback.format_exc())
         return f"Error processing ZIP file: {str(e)}"
-    
-    finally:
-        # Clean up temporary directory
-        try:
-            shutil.rmtree(extract_dir)
-            print("Cleaned up temporary directory")
-        except:
-            print("Warning: Failed to clean up temporary directory")
 
 def ga1_eighteenth_solution(query=None):
     """
@@ -2957,6 +5056,160 @@ The analysis followed these steps:
         # print("\nGenerated Markdown content:")
         # print("-" * 50)?
         print(generate_step_count_markdown())
+# Parallel in-memory compression search (used by ga2_second_solution)
+_COMPRESSION_POOL = None
+
+
+def _encode_compression_candidate(task):
+    """
+    Process-pool worker: encode one candidate fully in memory.
+
+    Args:
+        task (tuple): (mode, size, raw pixel bytes or an ImageStore.share()
+            descriptor, candidate spec dict)
+
+    Returns:
+        tuple: (spec, encoded bytes)
+    """
+    from PIL import Image
+
+    mode, size, raw, spec = task
+    if isinstance(raw, dict):
+        block, pixels = ImageStore.attach(raw)
+        try:
+            img = Image.fromarray(pixels).copy()
+        finally:
+            del pixels
+            block.close()
+    else:
+        img = Image.frombytes(mode, size, raw)
+
+    transform = spec.get("transform")
+    if transform == "rgb":
+        img = img.convert("RGB")
+    elif transform == "gray":
+        img = img.convert("L")
+    elif transform == "palette":
+        # Exact palette: the image has at most `colors` distinct colours
+        img = img.convert("RGB").quantize(colors=spec["colors"], method=Image.Quantize.MAXCOVERAGE, dither=Image.Dither.NONE)
+    elif transform == "quantize":
+        img = img.convert("RGB").convert("P", palette=Image.ADAPTIVE, colors=spec["colors"])
+    if spec.get("scale"):
+        width, height = img.size
+        img = img.resize((max(1, int(width * spec["scale"])), max(1, int(height * spec["scale"]))), Image.LANCZOS)
+
+    buffer = io.BytesIO()
+    if spec["format"] == "WEBP":
+        img.save(buffer, format="WEBP", lossless=True, quality=100, method=6)
+    else:
+        img.save(buffer, format="PNG", optimize=True, compress_level=9)
+    return spec, buffer.getvalue()
+
+
+def _is_lossless_encoding(original, encoded):
+    """Check that encoded bytes decode to exactly the original RGBA pixels."""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(encoded)) as decoded:
+        return (decoded.size == original.size and
+                decoded.convert("RGBA").tobytes() == original.convert("RGBA").tobytes())
+
+
+def search_image_compression(img, max_bytes, allow_lossy=True, processes=None, timeout=30, shared_pixels=None):
+    """
+    Find an encoding of an image that fits in max_bytes.
+
+    Lossless candidates (PNG at the strongest level, exact palettes, grayscale,
+    alpha removal, WebP lossless) are encoded in memory in parallel and the
+    first one that fits the budget and decodes to identical pixels wins.
+    Weaker PNG compress levels are never tried since they cannot be smaller.
+    Only if nothing lossless fits, and allow_lossy is set, palette sizes and
+    resize scales are binary-searched for the best quality that fits, relying
+    on encoded size shrinking monotonically along each axis.
+
+    Args:
+        img (PIL.Image.Image): Source image
+        max_bytes (int): Byte budget
+        allow_lossy (bool): Fall back to palette reduction and resizing
+        processes (int, optional): Worker processes (1 encodes inline)
+        timeout (float): Upper bound in seconds for the lossless stage
+        shared_pixels (dict, optional): ImageStore.share() descriptor of img;
+            workers then attach to it instead of receiving pickled pixels
+
+    Returns:
+        tuple: (spec dict, encoded bytes, is_lossless) or (None, None, False)
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+
+    global _COMPRESSION_POOL
+
+    # Workers rebuild the image from raw bytes, so palette modes are expanded
+    if img.mode not in ("RGB", "RGBA", "L"):
+        img = img.convert("RGBA")
+    rgba = img.convert("RGBA")
+    colors = rgba.getcolors(maxcolors=256)
+    opaque = rgba.getextrema()[3][0] == 255
+
+    candidates = [{"format": "PNG"}, {"format": "WEBP"}]
+    if opaque and img.mode not in ("RGB", "L"):
+        candidates.append({"format": "PNG", "transform": "rgb"})
+    if opaque and colors and all(r == g == b for _, (r, g, b, a) in colors):
+        candidates.append({"format": "PNG", "transform": "gray"})
+    if opaque and colors:
+        candidates.append({"format": "PNG", "transform": "palette", "colors": len(colors)})
+
+    if shared_pixels is not None and shared_pixels["mode"] == img.mode:
+        pixel_source = shared_pixels
+    else:
+        pixel_source = img.tobytes()
+
+    def make_task(spec):
+        return (img.mode, img.size, pixel_source, spec)
+
+    # Stage 1: lossless candidates in parallel, first fit wins
+    tasks = [make_task(spec) for spec in candidates]
+    if processes == 1:
+        results = (_encode_compression_candidate(task) for task in tasks)
+    else:
+        if _COMPRESSION_POOL is None:
+            _COMPRESSION_POOL = ProcessPoolExecutor(max_workers=processes)
+        futures = [_COMPRESSION_POOL.submit(_encode_compression_candidate, task) for task in tasks]
+        results = (future.result() for future in as_completed(futures, timeout=timeout))
+
+    try:
+        for spec, encoded in results:
+            print(f"Candidate {spec}: {len(encoded)} bytes")
+            if len(encoded) <= max_bytes and _is_lossless_encoding(rgba, encoded):
+                return spec, encoded, True
+    except FuturesTimeout:
+        print(f"Lossless search timed out after {timeout} seconds")
+
+    if not allow_lossy:
+        return None, None, False
+
+    # Stage 2/3: binary search along monotonic quality axes
+    def largest_fitting(values, make_spec):
+        best = None
+        low, high = 0, len(values) - 1
+        while low <= high:
+            middle = (low + high) // 2
+            spec, encoded = _encode_compression_candidate(make_task(make_spec(values[middle])))
+            print(f"Candidate {spec}: {len(encoded)} bytes")
+            if len(encoded) <= max_bytes:
+                best = (spec, encoded, False)
+                low = middle + 1
+            else:
+                high = middle - 1
+        return best
+
+    palette_sizes = [2, 4, 8, 16, 32, 64, 128, 256]
+    best = largest_fitting(palette_sizes, lambda n: {"format": "PNG", "transform": "quantize", "colors": n})
+    if best is None:
+        scales = [0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
+        best = largest_fitting(scales, lambda s: {"format": "PNG", "scale": s})
+    return best or (None, None, False)
+
+
 def ga2_second_solution(query=None):
     """
     Compress an image losslessly to be under 1,500 bytes.
@@ -2982,8 +5235,8 @@ def ga2_second_solution(query=None):
     max_bytes = 1500  # Max file size in bytes
     default_image_path = "E:\\data science tool\\GA2\\iit_madras.png" 
     # Default path
-    image_path = file_manager.get_file(default_image_path, query, "image")
-    image_info = image_info["path"]
+    image_info = file_manager.get_file(default_image_path, query, "image")
+    image_path = image_info["path"]
     print(f"Processing image: {image_path}")
     input_image_path = image_path
     print(f"Input image path: {input_image_path}")
@@ -3050,57 +5303,26 @@ Dimensions: {original_width}x{original_height}
 
 No compression needed. You can download the original image."""
     
-    # Define compression functions
-    def compress_with_png_optimization(img, output_path):
-        """Try different PNG compression levels"""
-        for compression in range(9, -1, -1):
-            img.save(output_path, format="PNG", optimize=True, compress_level=compression)
-            if os.path.getsize(output_path) <= max_bytes:
-                return True
-        return False
-    
-    def compress_with_color_reduction(img, output_path):
-        """Reduce number of colors"""
-        for colors in [256, 128, 64, 32, 16, 8, 4, 2]:
-            palette_img = img.convert('P', palette=Image.ADAPTIVE, colors=colors)
-            palette_img.save(output_path, format="PNG", optimize=True)
-            if os.path.getsize(output_path) <= max_bytes:
-                return True
-        return False
-    
-    def compress_with_resize(img, output_path):
-        """Resize the image while preserving aspect ratio"""
-        width, height = img.size
-        aspect_ratio = height / width
-        
-        for scale in [0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2]:
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            resized_img = img.resize((new_width, new_height), Image.LANCZOS)
-            resized_img.save(output_path, format="PNG", optimize=True)
-            if os.path.getsize(output_path) <= max_bytes:
-                return True
-        return False
-    
-    # Execute compression strategies
+    # Execute the compression search
     try:
-        original_img = Image.open(input_image_path)
-        output_filename = f"compressed_{os.path.basename(input_image_path)}"
-        if not output_filename.lower().endswith('.png'):
-            output_filename = os.path.splitext(output_filename)[0] + '.png'
-        
-        output_path = os.path.join(output_dir, output_filename)
+        image_store = ImageStore.shared()
+        original_img = image_store.get_image(input_image_path)
+        spec, encoded, is_lossless = search_image_compression(
+            original_img, max_bytes, shared_pixels=image_store.share(input_image_path)
+        )
         
-        # Try compression strategies in order
-        print("Trying PNG optimization...")
-        if compress_with_png_optimization(original_img, output_path):
-            print("Compression successful using PNG optimization")
-        elif compress_with_color_reduction(original_img, output_path):
-            print("Compression successful using color reduction")
-        elif compress_with_resize(original_img, output_path):
-            print("Compression successful using image resizing")
-        else:
+        if encoded is None:
             return f"Failed to compress image below {max_bytes} bytes while maintaining lossless quality"
+        if is_lossless:
+            print(f"Lossless compression successful using {spec}")
+        else:
+            print(f"Warning: no lossless candidate fit; using lossy fallback {spec}")
+        
+        extension = '.webp' if spec["format"] == "WEBP" else '.png'
+        output_filename = f"compressed_{os.path.splitext(os.path.basename(input_image_path))[0]}{extension}"
+        output_path = os.path.join(output_dir, output_filename)
+        with open(output_path, 'wb') as f:
+            f.write(encoded)
         
         # Get compressed image details
         compressed_size = os.path.getsize(output_path)
@@ -3115,7 +5337,7 @@ No compression needed. You can download the original image."""
         # Generate Base64 version for embedding in HTML/Markdown
         with open(output_path, "rb") as img_file:
             img_data = base64.b64encode(img_file.read()).decode('utf-8')
-            img_base64 = f"data:image/png;base64,{img_data}"
+            img_base64 = f"data:image/{extension.lstrip('.')};base64,{img_data}"
             
             # Only use a small preview of the base64 string to avoid overwhelming output
             img_base64_preview = img_base64[:50] + "..." if len(img_base64) > 50 else img_base64
@@ -3396,50 +5618,192 @@ def ga2_fourth_solution(query=None):
     Calculate the hash equivalent to running the authentication code in Google Colab.
     
     Args:
-        query (str, optional): Query potentially containing an email address
-        
+        query (str, optional): Query potentially containing an email address
+        
+    Returns:
+        str: Last 5 characters of the hash
+    """
+    import hashlib
+    import datetime
+    import re
+    
+    print("Calculating Google Colab authentication hash equivalent...")
+    
+    # Default email from the problem statement
+    default_email = "24f2006438@ds.study.iitm.ac.in"
+    email = default_email
+    
+    # Try to extract email from query if provided
+    if query:
+        # Look for email pattern
+        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+        email_match = re.search(email_pattern, query)
+        if email_match:
+            email = email_match.group(0)
+            print(f"Using custom email from query: {email}")
+        else:
+            print(f"No email found in query, using default: {default_email}")
+    
+    # Get current year (which will likely be the token_expiry year in Google Colab)
+    current_year = datetime.datetime.now().year
+    
+    try:
+        # Create hash from email and year (same format as the Colab code)
+        hash_input = f"{email} {current_year}"
+        print(f"Calculating hash for: '{hash_input}'")
+        hash_value = hashlib.sha256(hash_input.encode()).hexdigest()
+        
+        # Get last 5 characters (same as the Colab code)
+        result = hash_value[-5:]
+        print(f"Generated 5-character hash: {result}")
+        
+        return result
+    
+    except Exception as e:
+        print(f"Error calculating hash: {str(e)}")
+        return f"Error: {str(e)}"
+# Vectorized colour-space conversion (used by ga2_fifth_solution)
+def _rgb_hue_array(rgb, maxc, minc):
+    """Hue channel shared by HLS and HSV, using colorsys' branch order."""
+    import numpy as np
+
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    rangec = maxc - minc
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+        h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+        h = np.remainder(h / 6.0, 1.0)
+    return np.where(minc == maxc, 0.0, h)
+
+
+def rgb_to_hls_array(rgb):
+    """
+    Vectorized colorsys.rgb_to_hls over an (..., 3) array of floats in [0, 1].
+
+    Performs the same float operations in the same order as colorsys, so the
+    results are bit-for-bit identical to calling it per pixel.
+
+    Returns:
+        tuple: (h, l, s) arrays with the shape of rgb[..., 0]
+    """
+    import numpy as np
+
+    rgb = np.asarray(rgb, dtype=np.float64)
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+    s = np.where(minc == maxc, 0.0, s)
+    return _rgb_hue_array(rgb, maxc, minc), l, s
+
+
+def rgb_to_hsv_array(rgb):
+    """
+    Vectorized colorsys.rgb_to_hsv over an (..., 3) array of floats in [0, 1].
+
+    Returns:
+        tuple: (h, s, v) arrays with the shape of rgb[..., 0]
+    """
+    import numpy as np
+
+    rgb = np.asarray(rgb, dtype=np.float64)
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(minc == maxc, 0.0, (maxc - minc) / maxc)
+    return _rgb_hue_array(rgb, maxc, minc), s, maxc
+
+
+def rgb_to_lab_array(rgb):
+    """
+    Convert an (..., 3) array of sRGB floats in [0, 1] to CIE L*a*b* (D65).
+
+    Returns:
+        tuple: (L, a, b) arrays with the shape of rgb[..., 0]
+    """
+    import numpy as np
+
+    rgb = np.asarray(rgb, dtype=np.float64)
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    xyz = linear @ np.array([
+        [0.4124564, 0.2126729, 0.0193339],
+        [0.3575761, 0.7151522, 0.1191920],
+        [0.1804375, 0.0721750, 0.9503041]
+    ])
+    xyz /= np.array([0.95047, 1.0, 1.08883])
+    delta = 6.0 / 29.0
+    f = np.where(xyz > delta ** 3, np.cbrt(xyz), xyz / (3 * delta ** 2) + 4.0 / 29.0)
+    return 116.0 * f[..., 1] - 16.0, 500.0 * (f[..., 0] - f[..., 1]), 200.0 * (f[..., 1] - f[..., 2])
+
+
+def image_to_rgb_array(image):
+    """
+    Convert a PIL image or a uint8 pixel array to an (h, w, 3) float array in [0, 1].
+
+    Grayscale is replicated to three channels and alpha is dropped, as the
+    per-pixel solutions did; other PIL modes go through PIL's RGB conversion.
+    """
+    import numpy as np
+
+    if not isinstance(image, np.ndarray):
+        if image.mode not in ('RGB', 'RGBA', 'L'):
+            image = image.convert('RGB')
+        image = np.asarray(image)
+    rgb = image / 255.0
+    if rgb.ndim == 2:
+        rgb = np.stack([rgb, rgb, rgb], axis=2)
+    return rgb[:, :, :3]
+
+
+_COLOR_CHANNELS = {
+    'hue': (rgb_to_hls_array, 0),
+    'lightness': (rgb_to_hls_array, 1),
+    'saturation': (rgb_to_hls_array, 2),
+    'hsv_saturation': (rgb_to_hsv_array, 1),
+    'value': (rgb_to_hsv_array, 2),
+    'lab_l': (rgb_to_lab_array, 0),
+    'lab_a': (rgb_to_lab_array, 1),
+    'lab_b': (rgb_to_lab_array, 2)
+}
+
+
+def count_pixels_above(image, threshold, channel='lightness', tile_rows=None):
+    """
+    Count pixels whose colour channel value is strictly above a threshold.
+
+    Args:
+        image: PIL image or uint8 pixel array (e.g. from ImageStore.get_array)
+        threshold (float): Exclusive lower bound for the channel value
+        channel (str): One of the keys of _COLOR_CHANNELS
+        tile_rows (int, optional): Process the image in horizontal strips of
+            this many rows so float buffers stay bounded on huge images
+
     Returns:
-        str: Last 5 characters of the hash
+        int: Number of matching pixels
     """
-    import hashlib
-    import datetime
-    import re
-    
-    print("Calculating Google Colab authentication hash equivalent...")
-    
-    # Default email from the problem statement
-    default_email = "24f2006438@ds.study.iitm.ac.in"
-    email = default_email
-    
-    # Try to extract email from query if provided
-    if query:
-        # Look for email pattern
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        email_match = re.search(email_pattern, query)
-        if email_match:
-            email = email_match.group(0)
-            print(f"Using custom email from query: {email}")
-        else:
-            print(f"No email found in query, using default: {default_email}")
-    
-    # Get current year (which will likely be the token_expiry year in Google Colab)
-    current_year = datetime.datetime.now().year
-    
-    try:
-        # Create hash from email and year (same format as the Colab code)
-        hash_input = f"{email} {current_year}"
-        print(f"Calculating hash for: '{hash_input}'")
-        hash_value = hashlib.sha256(hash_input.encode()).hexdigest()
-        
-        # Get last 5 characters (same as the Colab code)
-        result = hash_value[-5:]
-        print(f"Generated 5-character hash: {result}")
-        
-        return result
-    
-    except Exception as e:
-        print(f"Error calculating hash: {str(e)}")
-        return f"Error: {str(e)}"
+    import numpy as np
+
+    convert, index = _COLOR_CHANNELS[channel]
+    if not isinstance(image, np.ndarray):
+        if image.mode not in ('RGB', 'RGBA', 'L'):
+            image = image.convert('RGB')
+        image = np.asarray(image)
+    height = image.shape[0]
+    tile_rows = tile_rows or height
+
+    count = 0
+    for top in range(0, height, tile_rows):
+        # Row slices of the uint8 array are views; only the strip is converted
+        values = convert(image_to_rgb_array(image[top:top + tile_rows]))[index]
+        count += int(np.count_nonzero(values > threshold))
+    return count
+
+
 def ga2_fifth_solution(query=None):
     """
     Count the number of pixels in an image with lightness > 0.718.
@@ -3452,9 +5816,6 @@ def ga2_fifth_solution(query=None):
     """
     import re
     import os
-    import numpy as np
-    from PIL import Image
-    import colorsys
     
     print("Counting pixels with lightness > 0.718...")
     
@@ -3513,29 +5874,16 @@ def ga2_fifth_solution(query=None):
         print("Corrected code would be: list(files.upload().keys())[0]")
         print("The '.keys' needed parentheses to call the method.")
         
-        # Load the image
-        image = Image.open(image_path)
-        print(f"Image loaded: {image.format}, {image.size}x{image.mode}")
-        
-        # Convert to numpy array and normalize to 0-1 range
-        rgb = np.array(image) / 255.0
-        
-        # Handle different image formats
-        if len(rgb.shape) == 2:
-            # Grayscale image - replicate to 3 channels
-            print("Converting grayscale image to RGB")
-            rgb = np.stack([rgb, rgb, rgb], axis=2)
-        elif rgb.shape[2] == 4:
-            # Image with alpha channel - use only RGB
-            print("Removing alpha channel from RGBA image")
-            rgb = rgb[:, :, :3]
-        
-        # Apply colorsys.rgb_to_hls to each pixel and extract lightness (index 1)
-        print("Calculating lightness values using RGB to HLS conversion...")
-        lightness = np.apply_along_axis(lambda x: colorsys.rgb_to_hls(*x)[1], 2, rgb)
-        
-        # Count pixels with lightness > 0.718
-        light_pixels = int(np.sum(lightness > 0.718))
+        # Load the image (decoded once and cached by content hash)
+        pixels, mode = ImageStore.shared().get_array(image_path)
+        print(f"Image loaded: {pixels.shape[1]}x{pixels.shape[0]} {mode}")
+        
+        # Lightness for the whole image in one vectorized pass; very large
+        # images are processed in strips to bound memory
+        print("Calculating lightness values using vectorized RGB to HLS conversion...")
+        tile_rows = 2048 if pixels.shape[0] * pixels.shape[1] > 16_000_000 else None
+        light_pixels = count_pixels_above(pixels, 0.718, 'lightness', tile_rows=tile_rows)
+        
         print(f"Found {light_pixels} pixels with lightness > 0.718")
         
         # For typical Lenna image, the expected result is around 16558
@@ -5490,6 +7838,263 @@ The server is running in the background and will continue until you close this p
 """
 
 #GA4
+# Concurrent cached page fetching (used by ga4_first/second_solution)
+_PAGE_CACHE_TTL = 6 * 60 * 60
+_BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+
+class HostRateLimiter:
+    """Space out requests to the same host by at least min_interval seconds."""
+
+    def __init__(self, min_interval=0.25):
+        import threading
+
+        self.min_interval = min_interval
+        self.next_slot = {}  # host -> earliest time the next request may start
+        self.lock = threading.Lock()
+
+    def wait(self, url):
+        """Block until a request to url's host may be sent."""
+        from urllib.parse import urlsplit
+
+        host = urlsplit(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class PageFetcher:
+    """
+    Fetch many pages concurrently over HTTP, with a disk cache.
+
+    URLs are fetched by a bounded thread pool with one requests.Session per
+    thread, and a HostRateLimiter keeps a polite gap between requests to the
+    same host. Responses are cached on disk under "pages" for `ttl` seconds,
+    so repeated questions are answered without network access. When HTTP
+    fails (e.g. the site blocks non-browser clients), an optional fallback
+    such as BrowserPool.fetch_html renders the page instead. An optional
+    accept(html) check treats a page without the expected content (a bot
+    challenge served with status 200) as a failure, and only accepted
+    pages are cached.
+    """
+
+    def __init__(self, max_workers=8, per_host_interval=0.25, ttl=_PAGE_CACHE_TTL,
+                 headers=None, timeout=20, fallback=None, accept=None):
+        """
+        Args:
+            max_workers (int): Maximum concurrent requests
+            per_host_interval (float): Minimum seconds between requests to one host
+            ttl (int): Seconds a cached page stays fresh (0 disables the cache)
+            headers (dict, optional): Extra request headers
+            timeout (int): Seconds per HTTP request
+            fallback (callable, optional): fallback(url) -> HTML, used when HTTP fails
+            accept (callable, optional): accept(html) -> bool, whether a page
+                has the expected content (by default every page is accepted)
+        """
+        import threading
+
+        self.max_workers = max_workers
+        self.rate_limiter = HostRateLimiter(per_host_interval)
+        self.ttl = ttl
+        self.headers = {"User-Agent": _BROWSER_USER_AGENT, "Accept-Language": "en-US,en;q=0.9"}
+        self.headers.update(headers or {})
+        self.timeout = timeout
+        self.fallback = fallback
+        self.accept = accept or (lambda html: True)
+        self.local = threading.local()
+
+    def _cache_file(self, cache_key):
+        import hashlib
+
+        return file_manager.cache_path("pages", hashlib.sha256(cache_key.encode('utf-8')).hexdigest(), ".html")
+
+    def cached(self, url, cache_key=None):
+        """Return the cached HTML for url if it is younger than the TTL, else None."""
+        if not self.ttl:
+            return None
+        path = self._cache_file(cache_key or url)
+        try:
+            if time.time() - os.path.getmtime(path) < self.ttl:
+                # newline='' returns the page byte-for-byte as it was served
+                with open(path, 'r', encoding='utf-8', newline='') as f:
+                    return f.read()
+        except OSError:
+            pass
+        return None
+
+    def store(self, url, html, cache_key=None):
+        """Write html to the disk cache (atomically, so readers never see half a page)."""
+        if not self.ttl:
+            return
+        path = self._cache_file(cache_key or url)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(html)
+        os.replace(temp_path, path)
+
+    def _session(self):
+        import requests
+
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+            self.local.session.headers.update(self.headers)
+        return self.local.session
+
+    def fetch(self, url, cache_key=None):
+        """
+        Return the HTML of one page, from the cache, HTTP or the fallback.
+
+        Args:
+            url (str): Page URL
+            cache_key (str, optional): Cache key to use instead of the URL
+
+        Returns:
+            str: The HTML; if even the fallback's page is not accepted, it is
+            returned uncached
+
+        Raises:
+            Exception: The HTTP error, if there is no fallback or it fails too
+        """
+        html = self.cached(url, cache_key)
+        if html is not None and self.accept(html):
+            return html
+        try:
+            self.rate_limiter.wait(url)
+            response = self._session().get(url, timeout=self.timeout)
+            response.raise_for_status()
+            html = response.text
+            if not self.accept(html):
+                raise ValueError("page does not have the expected content")
+        except Exception as e:
+            if self.fallback is None:
+                raise
+            print(f"HTTP fetch failed for {url} ({e}); rendering it instead")
+            html = self.fallback(url)
+        if self.accept(html):
+            self.store(url, html, cache_key)
+        return html
+
+    def fetch_all(self, urls):
+        """
+        Fetch pages concurrently.
+
+        Returns:
+            list: One entry per URL, in order: the HTML, or the exception
+            that fetching it raised
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def fetch_or_error(url):
+            try:
+                return self.fetch(url)
+            except Exception as e:
+                return e
+
+        if len(urls) <= 1:
+            return [fetch_or_error(url) for url in urls]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+            return list(executor.map(fetch_or_error, urls))
+
+
+# Cricinfo batting-stats parsing (used by ga4_first_solution)
+_CRICINFO_DUCKS_CACHE = {}
+
+
+def count_ducks_in_stats_html(html):
+    """
+    Sum the ducks column (header "0") of the engineTable tables in a
+    Cricinfo stats page.
+
+    Args:
+        html (str): Page HTML (rendered or as served)
+
+    Returns:
+        dict: tables (number of engineTable tables), found (whether a duck
+        column was found) and ducks (the total)
+    """
+    import lxml.html
+
+    document = lxml.html.fromstring(html)
+    tables = document.xpath('//table[contains(concat(" ", normalize-space(@class), " "), " engineTable ")]')
+    result = {"tables": len(tables), "found": False, "ducks": 0}
+    for table in tables:
+        header_texts = [th.text_content().strip() for th in table.xpath('.//th')]
+        if not header_texts:
+            continue
+        print(f"Analyzing table with {len(header_texts)} columns")
+        
+        # Look for the duck column (header '0')
+        if '0' not in header_texts:
+            continue
+        duck_col_idx = header_texts.index('0')
+        result["found"] = True
+        print(f"Found duck column at index {duck_col_idx}")
+        
+        # Count ducks in this table, skipping the header row
+        for row in table.xpath('.//tr')[1:]:
+            cells = row.xpath('./td')
+            if len(cells) > duck_col_idx:
+                duck_text = cells[duck_col_idx].text_content().strip()
+                if duck_text and duck_text.isdigit():
+                    result["ducks"] += int(duck_text)
+    return result
+
+
+def cricinfo_duck_counts(page_number):
+    """
+    Count the ducks on one page of Cricinfo's ODI batting stats.
+
+    The stats engine serves its tables in the static HTML, so a plain HTTP
+    fetch parsed with lxml is tried first; the page is rendered in the
+    shared BrowserPool only when no duck column is found there. Parsed
+    counts are cached in memory and on disk per (page, date), so repeated
+    questions about a page on the same day never refetch it.
+
+    Args:
+        page_number (int): Stats page to read
+
+    Returns:
+        dict: The count_ducks_in_stats_html result plus "source"
+        ("cache", "http" or "browser")
+    """
+    import datetime
+
+    cache_key = f"page{page_number}-{datetime.date.today().isoformat()}"
+    if cache_key in _CRICINFO_DUCKS_CACHE:
+        return dict(_CRICINFO_DUCKS_CACHE[cache_key], source="cache")
+    cache_file = file_manager.cache_path("cricinfo_ducks", cache_key, ".json")
+    if os.path.exists(cache_file):
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            _CRICINFO_DUCKS_CACHE[cache_key] = json.load(f)
+        return dict(_CRICINFO_DUCKS_CACHE[cache_key], source="cache")
+
+    url = _CRICINFO_STATS_URL.format(page=page_number)
+    counts = None
+    try:
+        # The parsed counts are what is cached, so skip the raw page cache
+        counts = count_ducks_in_stats_html(PageFetcher(ttl=0).fetch(url))
+        counts["source"] = "http"
+    except Exception as e:
+        print(f"Static fetch of page {page_number} failed: {e}")
+    if counts is None or not counts["found"]:
+        print(f"Duck column not in the static HTML of page {page_number}; rendering it")
+        html = BrowserPool.shared().fetch_html(url, wait_for="table.engineTable")
+        counts = count_ducks_in_stats_html(html)
+        counts["source"] = "browser"
+
+    if counts["found"]:
+        _CRICINFO_DUCKS_CACHE[cache_key] = {key: value for key, value in counts.items() if key != "source"}
+        # Write atomically, so a concurrent reader never loads half a file
+        temp_path = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(_CRICINFO_DUCKS_CACHE[cache_key], f)
+        os.replace(temp_path, cache_file)
+    return counts
+
+
 def ga4_first_solution(query=None):
     """
     Count the number of ducks on a specified page of ESPN Cricinfo's ODI batting stats.
@@ -5500,13 +8105,6 @@ def ga4_first_solution(query=None):
     Returns:
         str: The total number of ducks found on the specified page
     """
-    from selenium import webdriver
-    from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.common.by import By
-    from webdriver_manager.chrome import ChromeDriverManager
-    import time
-    
     # Extract page number from query or use default
     page_number = 22  # Default page number
     # if query and "page" in query.lower():
@@ -5541,82 +8139,102 @@ def ga4_first_solution(query=None):
     
     print(f"Counting ducks on ESPN Cricinfo ODI batting stats page {page_number}...")
     
-    # URL for ESPN Cricinfo ODI batting stats with dynamic page number
-    url = f"https://stats.espncricinfo.com/ci/engine/stats/index.html?class=2;page={page_number};template=results;type=batting"
-    
-    # Set up headless Chrome browser
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    
     try:
-        # Initialize the Chrome driver
-        print("Setting up Chrome Driver...")
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-        
-        # Navigate to the page
+        # Plain HTTP + lxml first; the pooled browser only if the table needs rendering
         print(f"Accessing ESPN Cricinfo page {page_number}...")
-        driver.get(url)
-        time.sleep(3)  # Wait for page to load
+        counts = cricinfo_duck_counts(page_number)
+        print(f"Duck counts for page {page_number} came from: {counts['source']}")
         
-        # Find all tables with class "engineTable"
-        tables = driver.find_elements(By.CLASS_NAME, "engineTable")
-        
-        if not tables:
+        if not counts["tables"]:
             print("No tables found on the page.")
             return f"Error: No tables found on page {page_number}"
         
-        # Find the table with batting stats and count ducks
-        total_ducks = 0
-        found_duck_column = False
-        
-        for table in tables:
-            headers = table.find_elements(By.TAG_NAME, "th")
-            header_texts = [h.text.strip() for h in headers]
-            
-            if not header_texts:
-                continue
-                
-            print(f"Analyzing table with {len(header_texts)} columns")
-            
-            # Look for the duck column (header '0')
-            duck_col_idx = None
-            for i, header in enumerate(header_texts):
-                if header == '0':
-                    duck_col_idx = i
-                    found_duck_column = True
-                    print(f"Found duck column at index {i}")
-                    break
-            
-            if duck_col_idx is not None:
-                # Count ducks in this table
-                rows = table.find_elements(By.TAG_NAME, "tr")
-                
-                # Skip header row
-                data_rows = rows[1:]
-                
-                for row in data_rows:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    if len(cells) > duck_col_idx:
-                        duck_text = cells[duck_col_idx].text.strip()
-                        if duck_text and duck_text.isdigit():
-                            total_ducks += int(duck_text)
-        
-        if not found_duck_column:
+        if not counts["found"]:
             return f"Error: Could not find the duck column (header '0') on page {page_number}"
         
+        total_ducks = counts["ducks"]
         print(f"Finished counting. Total ducks on page {page_number}: {total_ducks}")
         return f"The total number of ducks across players on page {page_number} of ESPN Cricinfo's ODI batting stats is: {total_ducks}"
     
     except Exception as e:
         print(f"Error during web scraping: {str(e)}")
         return f"Error: Failed to retrieve or process data from page {page_number}: {str(e)}"
-    
-    finally:
-        if 'driver' in locals():
-            driver.quit()
-            print("Chrome driver closed.")
+
+
+# IMDb search parsing (used by ga4_second_solution)
+def parse_imdb_search_html(html):
+    """
+    Extract the titles listed on an IMDb advanced-search page.
+
+    The page embeds its results as JSON in the __NEXT_DATA__ script, which
+    is read first; server-rendered list items are parsed with lxml as a
+    fallback.
+
+    Returns:
+        list: {'id', 'title', 'year', 'rating'} dicts (strings) in page order;
+        entries without a rating or year are skipped
+    """
+    movies = []
+    next_data = re.search(r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', html, re.DOTALL)
+    if next_data:
+        try:
+            items = []
+            stack = [json.loads(next_data.group(1))]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, dict):
+                    if 'titleId' in node and 'ratingSummary' in node:
+                        items.append(node)
+                        continue
+                    stack.extend(reversed(list(node.values())))
+                elif isinstance(node, list):
+                    stack.extend(reversed(node))
+            for item in items:
+                title = item.get('titleText')
+                if isinstance(title, dict):
+                    title = title.get('text')
+                year = item.get('releaseYear')
+                if isinstance(year, dict):
+                    year = year.get('year')
+                rating = (item.get('ratingSummary') or {}).get('aggregateRating')
+                if title and year and rating is not None:
+                    movies.append({'id': item['titleId'], 'title': title, 'year': str(year),
+                                   'rating': f"{float(rating):.1f}"})
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"Could not read __NEXT_DATA__: {e}")
+            movies = []
+    if movies:
+        return movies
+
+    import lxml.html
+
+    document = lxml.html.fromstring(html)
+    for item in document.xpath('//li[contains(@class, "ipc-metadata-list-summary-item")] | '
+                               '//div[contains(@class, "lister-item")]'):
+        links = item.xpath('.//a[contains(@href, "/title/tt")]')
+        if not links:
+            continue
+        id_match = re.search(r'/title/(tt\d+)', links[0].get('href', ''))
+        headings = item.xpath('.//h3')
+        title = (headings[0] if headings else links[0]).text_content().strip()
+        title = re.sub(r'^\d+\.\s*', '', title)  # Remove rank numbers
+
+        rating = None
+        for rating_el in item.xpath('.//*[contains(@class, "ipc-rating-star")] | .//*[contains(@class, "ratings-imdb-rating")]'):
+            rating_match = re.search(r'(\d+(?:\.\d+)?)', rating_el.get('aria-label') or rating_el.text_content())
+            if rating_match:
+                rating = rating_match.group(1)
+                break
+        # text_content() runs adjacent spans together ("20081h 32m"), so
+        # read the metadata spans, or the text pieces joined by spaces
+        metadata = item.xpath('.//*[contains(@class, "dli-title-metadata-item")]')
+        year_text = ' '.join(span.text_content() for span in metadata) or ' '.join(item.itertext())
+        year_match = re.search(r'\b(19\d{2}|20\d{2})\b', year_text)
+        if id_match and title and rating and year_match:
+            movies.append({'id': id_match.group(1), 'title': title, 'year': year_match.group(1), 'rating': rating})
+    return movies
+
+
 def ga4_second_solution(query=None):
     """
     Extract movie data from IMDb within a specified rating range.
@@ -5628,15 +8246,7 @@ def ga4_second_solution(query=None):
         str: JSON data with extracted movie information
     """
     import json
-    import time
     import re
-    from selenium import webdriver
-    from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from webdriver_manager.chrome import ChromeDriverManager
     
     # Parse rating range from query (default: 5-7)
     min_rating = 5.0
@@ -5662,277 +8272,49 @@ def ga4_second_solution(query=None):
                     pass
     
     print(f"Extracting movies with ratings between {min_rating} and {max_rating}...")
-    
-    def extract_imdb_movies(min_rating, max_rating):
-        """Extract movies within the specified rating range from IMDb"""
-        movies = []
-        
-        # Configure Chrome options for headless browsing
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        try:
-            print("Initializing Chrome WebDriver...")
-            driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-            
-            # Split the range into manageable chunks for IMDb's search
-            all_movies = []
-            range_chunks = []
-            
-            # Create URL chunks based on the rating range (IMDb allows 1-point ranges max)
-            current = min_rating
-            while current < max_rating:
-                next_point = min(current + 1.0, max_rating)
-                range_chunks.append((current, next_point))
-                current = next_point
-            
-            for lower, upper in range_chunks:
-                # IMDb URL with user_rating parameter
-                url = f"https://www.imdb.com/search/title/?title_type=feature&user_rating={lower},{upper}&sort=user_rating,desc"
-                
-                print(f"Navigating to URL: {url}")
-                driver.get(url)
-                
-                # Wait for page to load
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".ipc-page-content-container"))
-                )
-                time.sleep(3)
-                
-                # Extract movies using a multi-strategy approach
-                page_movies = []
-                
-                # Strategy 1: Using JS-inspired selectors
-                js_movies = extract_movies_using_js_pattern(driver, min_rating, max_rating)
-                page_movies.extend(js_movies)
-                
-                # Strategy 2: Fallback to simpler selectors if needed
-                if len(js_movies) < 10:
-                    fallback_movies = extract_movies_from_page(driver, min_rating, max_rating)
-                    
-                    # Add only new movies
-                    existing_ids = {m['id'] for m in page_movies}
-                    for movie in fallback_movies:
-                        if movie['id'] not in existing_ids:
-                            page_movies.append(movie)
-                            existing_ids.add(movie['id'])
-                
-                # Add to our overall collection
-                all_movies.extend(page_movies)
-                
-                # Take only up to 25 movies
-                if len(all_movies) >= 25:
-                    break
-            
-            # Ensure we have only unique movies and limit to 25
-            unique_movies = []
-            seen_ids = set()
-            for movie in all_movies:
-                if movie['id'] not in seen_ids and len(unique_movies) < 25:
-                    unique_movies.append(movie)
-                    seen_ids.add(movie['id'])
-            
-            return unique_movies
-            
-        except Exception as e:
-            print(f"Error extracting movies: {e}")
-            return []
-            
-        finally:
-            if 'driver' in locals():
-                driver.quit()
-                print("WebDriver closed")
-    
-    def extract_movies_using_js_pattern(driver, min_rating, max_rating):
-        """Extract movies using the pattern from the JavaScript snippet"""
-        movies = []
-        
-        try:
-            # Find rating elements
-            rating_elements = driver.find_elements(By.CSS_SELECTOR, 'span[class*="ipc-rating-star"]')
-            print(f"Found {len(rating_elements)} rating elements")
-            
-            for rating_el in rating_elements:
-                try:
-                    # Get the rating
-                    rating_text = rating_el.text.strip()
-                    
-                    # Check if it's a valid rating format
-                    if not re.match(r'^\d+\.?\d*$', rating_text):
-                        continue
-                    
-                    rating = rating_text
-                    rating_float = float(rating)
-                    
-                    # Only include ratings in our range
-                    if rating_float < min_rating or rating_float > max_rating:
-                        continue
-                    
-                    # Find container element (list item or div)
-                    containers = []
-                    for selector in ["./ancestor::li", "./ancestor::div[contains(@class, 'ipc-metadata-list-summary-item')]", 
-                                   "./ancestor::div[contains(@class, 'lister-item')]"]:
-                        try:
-                            container = rating_el.find_element(By.XPATH, selector)
-                            containers.append(container)
-                            break
-                        except:
-                            continue
-                    
-                    if not containers:
-                        continue
-                    
-                    container = containers[0]
-                    
-                    # Find title link
-                    title_link = None
-                    for selector in ["a.ipc-title-link-wrapper", "a[href*='/title/tt']"]:
-                        try:
-                            title_link = container.find_element(By.CSS_SELECTOR, selector)
-                            break
-                        except:
-                            continue
-                    
-                    if not title_link:
-                        continue
-                    
-                    # Get title and URL
-                    title = title_link.text.strip()
-                    title = re.sub(r'^\d+\.\s*', '', title)  # Remove rank numbers
-                    
-                    film_url = title_link.get_attribute("href")
-                    
-                    # Extract movie ID
-                    id_match = re.search(r'/title/(tt\d+)/', film_url)
-                    if not id_match:
-                        continue
-                    
-                    movie_id = id_match.group(1)
-                    
-                    # Find year
-                    item_text = container.text
-                    year_match = re.search(r'\b(19\d{2}|20\d{2})\b', item_text)
-                    year = year_match.group(1) if year_match else ""
-                    
-                    if not year:
-                        continue
-                    
-                    # Add the movie to our list
-                    movie_data = {
-                        'id': movie_id,
-                        'title': title,
-                        'year': year,
-                        'rating': rating
-                    }
-                    
-                    movies.append(movie_data)
-                    print(f"Extracted: {title} ({year}) - Rating: {rating}")
-                    
-                except Exception as e:
-                    print(f"Error processing element: {e}")
-                    continue
-            
-            return movies
-            
-        except Exception as e:
-            print(f"Error in extraction: {e}")
-            return []
-    
-    def extract_movies_from_page(driver, min_rating, max_rating):
-        """Extract movie data using standard selectors"""
-        movies = []
-        
-        try:
-            # Find all movie list items
-            movie_items = []
-            for selector in [".ipc-metadata-list-summary-item", ".lister-item"]:
-                items = driver.find_elements(By.CSS_SELECTOR, selector)
-                if items:
-                    movie_items = items
-                    break
-                    
-            if not movie_items:
-                return []
-                
-            print(f"Found {len(movie_items)} items on page")
-            
-            for item in movie_items:
-                try:
-                    # Extract link and ID
-                    link = item.find_element(By.CSS_SELECTOR, "a[href*='/title/tt']")
-                    href = link.get_attribute("href")
-                    id_match = re.search(r'/title/(tt\d+)/', href)
-                    movie_id = id_match.group(1) if id_match else "unknown"
-                    
-                    # Extract title
-                    title = link.text.strip()
-                    if not title or re.match(r'^\d+\.?\s*$', title):
-                        try:
-                            heading = item.find_element(By.CSS_SELECTOR, "h3")
-                            title = heading.text.strip()
-                        except:
-                            pass
-                    
-                    # Clean up title
-                    title = re.sub(r'^\d+\.\s*', '', title)
-                    
-                    # Find year
-                    item_text = item.text
-                    year_match = re.search(r'\b(19\d{2}|20\d{2})\b', item_text)
-                    year = year_match.group(1) if year_match else ""
-                    
-                    # Find rating using multiple patterns
-                    rating = None
-                    
-                    # Try to find specific rating span
-                    try:
-                        rating_span = item.find_element(By.CSS_SELECTOR, "span[class*='rating']")
-                        rating_text = rating_span.text.strip()
-                        rating_match = re.search(r'(\d+\.?\d*)', rating_text)
-                        if rating_match:
-                            rating = rating_match.group(1)
-                    except:
-                        # Try to extract from text
-                        rating_pattern = r'(?:^|\s)(\d+\.?\d*)\s*/\s*10'
-                        rating_match = re.search(rating_pattern, item_text)
-                        if rating_match:
-                            rating = rating_match.group(1)
-                        else:
-                            # Try alternate pattern for standalone ratings
-                            rating_match = re.search(r'(?:^|\s)(\d+\.?\d*)(?:\s|$)', item_text)
-                            if rating_match:
-                                rating = rating_match.group(1)
-                    
-                    if rating:
-                        rating_float = float(rating)
-                        if rating_float < min_rating or rating_float > max_rating:
-                            continue
-                    else:
-                        continue
-                    
-                    # Add movie if we have all required data
-                    if title and movie_id and year and rating:
-                        movies.append({
-                            'id': movie_id,
-                            'title': title,
-                            'year': year,
-                            'rating': rating
-                        })
-                        print(f"Extracted: {title} ({year}) - Rating: {rating}")
-                
-                except Exception as e:
-                    print(f"Error extracting data from item: {e}")
+    
+    def extract_imdb_movies(min_rating, max_rating):
+        """Extract movies within the specified rating range from IMDb"""
+        # Compute every rating-band URL up front (IMDb allows 1-point ranges max)
+        range_chunks = []
+        current = min_rating
+        while current < max_rating:
+            next_point = min(current + 1.0, max_rating)
+            range_chunks.append((current, next_point))
+            current = next_point
+        urls = [_IMDB_SEARCH_URL.format(lower=lower, upper=upper) for lower, upper in range_chunks]
+        
+        # Fetch all bands concurrently; pages IMDb refuses over HTTP are rendered in a pooled browser
+        pool = BrowserPool.shared(user_agent=_BROWSER_USER_AGENT)
+        fetcher = PageFetcher(
+            max_workers=4,
+            fallback=lambda url: pool.fetch_html(url, wait_for=".ipc-metadata-list-summary-item, .lister-item"),
+            accept=lambda html: bool(parse_imdb_search_html(html))
+        )
+        print(f"Fetching {len(urls)} IMDb page(s) concurrently...")
+        pages = fetcher.fetch_all(urls)
+        
+        # Ensure we have only unique movies in range and limit to 25
+        unique_movies = []
+        seen_ids = set()
+        for url, html in zip(urls, pages):
+            if isinstance(html, Exception):
+                print(f"Error fetching {url}: {html}")
+                continue
+            try:
+                page_movies = parse_imdb_search_html(html)
+            except Exception as e:
+                print(f"Error parsing {url}: {e}")
+                continue
+            for movie in page_movies:
+                if not min_rating <= float(movie['rating']) <= max_rating:
                     continue
-                    
-            return movies
+                if movie['id'] not in seen_ids and len(unique_movies) < 25:
+                    unique_movies.append(movie)
+                    seen_ids.add(movie['id'])
+                    print(f"Extracted: {movie['title']} ({movie['year']}) - Rating: {movie['rating']}")
         
-        except Exception as e:
-            print(f"Error in extraction: {e}")
-            return []
+        return unique_movies
     
     # Try to get live data
     movies = extract_imdb_movies(min_rating, max_rating)
@@ -7356,57 +9738,291 @@ jobs:
         if hasattr(e, 'response'):
             print(f"Response: {e.response.text}")
         return f"Error: {str(e)}"
-def ga4_ninth_solution(query=None):
+# Page-parallel PDF table extraction (used by ga4_ninth_solution)
+_PDF_EXTRACTION_POOL = None
+_PDF_BACKEND_CACHE = {}
+_MARKS_TABLE_CACHE = {}
+_MARKS_SUBJECTS = ['Maths', 'Physics', 'English', 'Economics', 'Biology']
+
+
+def _pdf_page_count(pdf_path):
+    """Return the number of pages in a PDF, or None if no reader is available."""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        try:
+            from PyPDF2 import PdfReader
+        except ImportError:
+            return None
+    try:
+        return len(PdfReader(pdf_path).pages)
+    except Exception as e:
+        print(f"Could not count PDF pages: {str(e)}")
+        return None
+
+
+def _extract_pdf_page_range(task):
     """
-    Extract and analyze student marks data from a PDF file with flexible parameters.
-    
+    Process-pool worker: extract the tables of one page range.
+
+    Workers are long-lived, so tabula's JVM (in-process via jpype when it is
+    installed) is started once per worker rather than once per request.
+
     Args:
-        query (str, optional): Query containing custom parameters like subject, 
-                              criteria, groups, comparison operator, and file path
-        
+        task (tuple): (pdf_path, pages such as "1-4" or "all", backend)
+
     Returns:
-        str: Analysis result showing total marks for qualifying students
+        list: DataFrames in page order
+    """
+    pdf_path, pages, backend = task
+    if backend == "tabula":
+        import tabula
+        return tabula.read_pdf(pdf_path, pages=pages, multiple_tables=True)
+
+    import camelot
+    return [table.df for table in camelot.read_pdf(pdf_path, pages=pages)]
+
+
+def _available_pdf_backends():
+    """Installed table-extraction backends, in order of preference."""
+    available = []
+    for backend in ("tabula", "camelot"):
+        try:
+            __import__(backend)
+            available.append(backend)
+        except ImportError:
+            pass
+    return available
+
+
+def probe_pdf_backend(pdf_path):
+    """
+    Choose a single extraction backend for a document.
+
+    When both tabula and camelot are installed, tabula is tried on the first
+    page only; camelot is used if that yields no marks-shaped table. The
+    choice is cached by the PDF's content hash.
+
+    Returns:
+        str: "tabula", "camelot", or None when neither is installed
+    """
+    available = _available_pdf_backends()
+    if len(available) < 2:
+        return available[0] if available else None
+
+    content_hash = file_manager.content_hash(pdf_path)
+    if content_hash in _PDF_BACKEND_CACHE:
+        return _PDF_BACKEND_CACHE[content_hash]
+
+    backend = "camelot"
+    try:
+        probe_tables = _extract_pdf_page_range((pdf_path, "1", "tabula"))
+        if any(not table.empty and len(table.columns) >= len(_MARKS_SUBJECTS) for table in probe_tables):
+            backend = "tabula"
+    except Exception as e:
+        print(f"Tabula probe failed: {str(e)}")
+
+    print(f"Selected {backend} for {pdf_path}")
+    _PDF_BACKEND_CACHE[content_hash] = backend
+    return backend
+
+
+def extract_pdf_tables(pdf_path, pages_per_task=4, processes=None):
+    """
+    Extract all tables from a PDF, splitting the pages across a process pool.
+
+    Args:
+        pdf_path (str): Path to the PDF
+        pages_per_task (int): Pages handled by one worker call
+        processes (int, optional): Worker processes (defaults to CPU count)
+
+    Returns:
+        list: DataFrames in document order
+    """
+    backend = probe_pdf_backend(pdf_path)
+    if backend is None:
+        print("No PDF extraction libraries found.")
+        return []
+
+    # The probed backend goes first; if it fails, the other one still gets a chance
+    candidates = [backend] + [other for other in _available_pdf_backends() if other != backend]
+    for candidate in candidates:
+        try:
+            return _extract_pdf_tables_with(pdf_path, candidate, pages_per_task, processes)
+        except Exception as e:
+            print(f"Error extracting with {candidate}: {e}")
+    return []
+
+
+def _extract_pdf_tables_with(pdf_path, backend, pages_per_task, processes):
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    global _PDF_EXTRACTION_POOL
+
+    page_count = _pdf_page_count(pdf_path)
+    if not page_count or page_count <= pages_per_task:
+        tables = _extract_pdf_page_range((pdf_path, "all", backend))
+        print(f"Extracted {len(tables)} tables with {backend}")
+        return tables
+
+    tasks = [
+        (pdf_path, f"{start}-{min(start + pages_per_task - 1, page_count)}", backend)
+        for start in range(1, page_count + 1, pages_per_task)
+    ]
+    if _PDF_EXTRACTION_POOL is None:
+        _PDF_EXTRACTION_POOL = ProcessPoolExecutor(max_workers=processes)
+
+    tables = []
+    try:
+        for range_tables in _PDF_EXTRACTION_POOL.map(_extract_pdf_page_range, tasks):
+            tables.extend(range_tables)
+    except BrokenProcessPool:
+        # A crashed worker poisons the pool; start a fresh one next time
+        _PDF_EXTRACTION_POOL = None
+        raise
+    print(f"Extracted {len(tables)} tables from {page_count} pages with {backend} ({len(tasks)} page ranges)")
+    return tables
+
+
+def process_marks_tables(tables):
+    """
+    Combine extracted tables into one student-marks frame with a Group column.
+
+    Group numbers come from "Student Marks - Group N" headers where present
+    and otherwise continue from the previous table.
     """
-    import os
-    import re
     import pandas as pd
-    import numpy as np
-    import tempfile
-    import requests
-    from pathlib import Path
-    
-    # Default parameters
+
+    all_data = []
+    current_group = 1
+
+    for i, table in enumerate(tables):
+        if table.empty:
+            continue
+
+        # Check if table contains "Student Marks-Group X" header
+        group_in_table = False
+        for col in table.columns:
+            cell_text = str(col).lower()
+            if 'group' in cell_text:
+                group_match = re.search(r'group\s*(\d+)', cell_text, re.IGNORECASE)
+                if group_match:
+                    current_group = int(group_match.group(1))
+                    group_in_table = True
+                    break
+
+        # If no group header in columns, check first few rows
+        if not group_in_table:
+            for row in range(min(3, len(table))):
+                row_text = ' '.join(str(val) for val in table.iloc[row].values)
+                if 'group' in row_text.lower():
+                    group_match = re.search(r'group\s*(\d+)', row_text, re.IGNORECASE)
+                    if group_match:
+                        current_group = int(group_match.group(1))
+                        # Skip this row as it's a header
+                        table = table.iloc[row+1:].reset_index(drop=True)
+                        group_in_table = True
+                        break
+
+        # Check if this looks like a subject header row
+        for idx, row in table.iterrows():
+            row_values = [str(val).strip().lower() for val in row.values]
+            if 'maths' in row_values and 'physics' in row_values and 'english' in row_values:
+                # Rename columns using this header row, then drop it
+                table.columns = [str(val).strip() for val in row.values]
+                table = table.iloc[idx+1:].reset_index(drop=True)
+                break
+
+        # If we have subject columns, process the table
+        has_subject_columns = any(col in table.columns for col in _MARKS_SUBJECTS)
+
+        if not has_subject_columns and len(table.columns) >= 5:
+            # If columns don't have proper names, rename them
+            table.columns = _MARKS_SUBJECTS[:len(table.columns)]
+
+        # Convert data to numeric
+        for col in table.columns:
+            if col in _MARKS_SUBJECTS:
+                table[col] = pd.to_numeric(table[col], errors='coerce')
+
+        table['Group'] = current_group
+        all_data.append(table)
+
+        # Increment group for next table if not explicitly set
+        if not group_in_table:
+            current_group += 1
+
+    if all_data:
+        return pd.concat(all_data, ignore_index=True)
+    return pd.DataFrame()
+
+
+def load_marks_table(pdf_path):
+    """
+    Get the combined student-marks table for a PDF, extracting it only once.
+
+    The table is kept in memory and persisted as Parquet keyed by the PDF's
+    content hash.
+
+    Returns:
+        DataFrame: Subject columns plus Group (empty if extraction failed)
+    """
+    import pandas as pd
+
+    content_hash = file_manager.content_hash(pdf_path)
+    if content_hash in _MARKS_TABLE_CACHE:
+        print("Using cached marks table")
+        return _MARKS_TABLE_CACHE[content_hash]
+
+    parquet_path = None
+    if content_hash:
+        parquet_path = file_manager.cache_path("pdf_marks", content_hash, ".parquet")
+        if os.path.exists(parquet_path):
+            try:
+                marks = pd.read_parquet(parquet_path)
+                print(f"Loaded marks table from {parquet_path}")
+                _MARKS_TABLE_CACHE[content_hash] = marks
+                return marks
+            except Exception as e:
+                print(f"Warning: Could not read cached Parquet file: {str(e)}")
+
+    marks = process_marks_tables(extract_pdf_tables(pdf_path))
+    if content_hash and not marks.empty:
+        # Keep only the typed columns so the frame round-trips through Parquet
+        marks = marks[[col for col in _MARKS_SUBJECTS + ['Group'] if col in marks.columns]]
+        _MARKS_TABLE_CACHE[content_hash] = marks
+        try:
+            marks.to_parquet(parquet_path, index=False)
+        except Exception as e:
+            print(f"Warning: Could not cache marks table as Parquet: {str(e)}")
+    return marks
+
+
+# Compiled marks questions over a typed, group-indexed table (used by ga4_ninth_solution)
+_MARKS_DATASET_CACHE = {}
+
+
+def parse_marks_question(query):
+    """
+    Parse a "total <subject> marks of students who scored ... in <subject> in
+    groups A-B" question into filter parameters.
+
+    Args:
+        query (str, optional): Question text
+
+    Returns:
+        dict: target_subject, filter_subject, comparison_operator, min_marks,
+        min_group and max_group (defaults to the Physics/Maths >= 69, groups
+        1-25 variant)
+    """
     target_subject = "Physics"  # Default subject to sum
     filter_subject = "Maths"    # Default subject for criteria
     min_marks = 69             # Default minimum marks
     min_group = 1              # Default minimum group
     max_group = 25             # Default maximum group
     comparison_operator = ">="  # Default comparison (greater than or equal)
-    default_pdf_path = "E:/data science tool/GA4/q-extract-tables-from-pdf.pdf"  # Default path
-    pdf_path = file_manager.resolve_file_path(default_pdf_path, query, "document")
-    
-    print(f"Processing PDF: {pdf_path}")
-    
-    # Extract PDF file path from query if provided
-    # if query:
-        # Check for file path in query using the centralized detection function
-        # try:
-        #     file_info = detect_file_from_query(query) if 'detect_file_from_query' in globals() else None
-        #     if file_info and file_info.get("path") and file_info.get("exists"):
-        #         pdf_path = file_info["path"]
-        #         print(f"Using PDF path from query: {pdf_path}")
-        # except Exception as e:
-        #     print(f"Error detecting file path: {str(e)}")
-        
-        # # Try to extract the path directly if detection function failed
-        # if "E:" in query and ".pdf" in query:
-        #     pdf_match = re.search(r'([a-zA-Z]:\\(?:[^\\/:*?"<>|\r\n]+\\)*[^\\/:*?"<>|\r\n]+\.pdf)', query)
-        #     if pdf_match:
-        #         potential_path = pdf_match.group(1)
-        #         if os.path.exists(potential_path):
-                    # pdf_path = potential_path
-                    # print(f"Using PDF path from direct match: {pdf_path}")
-    pdf_path=default_pdf_path
+
     if query:  
         # Extract target subject (what to sum)
         subject_patterns = [
@@ -7484,6 +10100,136 @@ def ga4_ninth_solution(query=None):
                 except (ValueError, IndexError):
                     pass
     
+    return {
+        "target_subject": target_subject,
+        "filter_subject": filter_subject,
+        "comparison_operator": comparison_operator,
+        "min_marks": min_marks,
+        "min_group": min_group,
+        "max_group": max_group
+    }
+
+
+class MarksDataset:
+    """
+    Student marks stored column-wise as NumPy arrays sorted by group.
+
+    A group range maps to a contiguous slice found by binary search, so any
+    parsed marks question compiles to one slice, one comparison and one
+    masked sum. Instances are cached per PDF content hash.
+    """
+
+    _OPERATORS = {
+        ">=": "greater_equal",
+        ">": "greater",
+        "<=": "less_equal",
+        "<": "less",
+        "==": "equal"
+    }
+
+    def __init__(self, marks_df):
+        import numpy as np
+
+        marks_df = marks_df.sort_values('Group', kind='stable')
+        self.groups = marks_df['Group'].to_numpy(dtype=np.int64)
+        self.columns = {
+            subject: marks_df[subject].to_numpy(dtype=np.float64)
+            for subject in _MARKS_SUBJECTS if subject in marks_df.columns
+        }
+
+    @classmethod
+    def for_pdf(cls, pdf_path):
+        """Return the dataset for a PDF, extracting it only on first use."""
+        content_hash = file_manager.content_hash(pdf_path)
+        if content_hash in _MARKS_DATASET_CACHE:
+            return _MARKS_DATASET_CACHE[content_hash]
+
+        marks_df = load_marks_table(pdf_path)
+        if marks_df.empty:
+            return None
+        dataset = cls(marks_df)
+        if content_hash:
+            _MARKS_DATASET_CACHE[content_hash] = dataset
+        return dataset
+
+    def __len__(self):
+        return len(self.groups)
+
+    def total(self, target_subject, filter_subject, comparison_operator, min_marks, min_group, max_group):
+        """
+        Sum target_subject over students in groups min_group..max_group
+        (inclusive) whose filter_subject mark satisfies the comparison.
+
+        Returns:
+            tuple: (total marks, number of matching students)
+        """
+        import numpy as np
+
+        start = np.searchsorted(self.groups, min_group, side='left')
+        end = np.searchsorted(self.groups, max_group, side='right')
+        compare = getattr(np, self._OPERATORS.get(comparison_operator, "greater_equal"))
+        mask = compare(self.columns[filter_subject][start:end], min_marks)
+        selected = self.columns[target_subject][start:end][mask]
+        return float(np.nansum(selected)), int(mask.sum())
+
+    def answer(self, question):
+        """Evaluate a dict produced by parse_marks_question."""
+        return self.total(
+            question["target_subject"], question["filter_subject"], question["comparison_operator"],
+            question["min_marks"], question["min_group"], question["max_group"]
+        )
+
+
+def ga4_ninth_solution(query=None):
+    """
+    Extract and analyze student marks data from a PDF file with flexible parameters.
+    
+    Args:
+        query (str, optional): Query containing custom parameters like subject, 
+                              criteria, groups, comparison operator, and file path
+        
+    Returns:
+        str: Analysis result showing total marks for qualifying students
+    """
+    import os
+    import re
+    import pandas as pd
+    import numpy as np
+    
+    # Parse the question (defaults: Physics total for Maths >= 69 in groups 1-25)
+    question = parse_marks_question(query)
+    target_subject = question["target_subject"]
+    filter_subject = question["filter_subject"]
+    min_marks = question["min_marks"]
+    min_group = question["min_group"]
+    max_group = question["max_group"]
+    comparison_operator = question["comparison_operator"]
+    default_pdf_path = "E:/data science tool/GA4/q-extract-tables-from-pdf.pdf"  # Default path
+    pdf_path = file_manager.resolve_file_path(default_pdf_path, query, "document")
+    
+    print(f"Processing PDF: {pdf_path}")
+    
+    # Extract PDF file path from query if provided
+    # if query:
+        # Check for file path in query using the centralized detection function
+        # try:
+        #     file_info = detect_file_from_query(query) if 'detect_file_from_query' in globals() else None
+        #     if file_info and file_info.get("path") and file_info.get("exists"):
+        #         pdf_path = file_info["path"]
+        #         print(f"Using PDF path from query: {pdf_path}")
+        # except Exception as e:
+        #     print(f"Error detecting file path: {str(e)}")
+        
+        # # Try to extract the path directly if detection function failed
+        # if "E:" in query and ".pdf" in query:
+        #     pdf_match = re.search(r'([a-zA-Z]:\\(?:[^\\/:*?"<>|\r\n]+\\)*[^\\/:*?"<>|\r\n]+\.pdf)', query)
+        #     if pdf_match:
+        #         potential_path = pdf_match.group(1)
+        #         if os.path.exists(potential_path):
+                    # pdf_path = potential_path
+                    # print(f"Using PDF path from direct match: {pdf_path}")
+    pdf_path=default_pdf_path
+    
     # Try to resolve file path using the unified file resolution system if available
     if 'resolve_file_path' in globals():
         try:
@@ -7503,156 +10249,29 @@ def ga4_ninth_solution(query=None):
             os.path.join(os.getcwd(), "q-extract-tables-from-pdf.pdf"),
             os.path.join(os.getcwd(), "GA4", "q-extract-tables-from-pdf.pdf"),
             "E:/data science tool/GA4/q-extract-tables-from-pdf.pdf",
-            "/tmp/q-extract-tables-from-pdf.pdf"  # For Linux/Mac environments
-        ]
-        
-        for alt_path in alternative_paths:
-            if os.path.exists(alt_path):
-                pdf_path = alt_path
-                print(f"Found PDF at: {pdf_path}")
-                break
-    
-    print(f"Processing PDF: {pdf_path}")
-    
-    try:
-        # Try to import PDF extraction libraries
-        try:
-            import tabula
-            import camelot
-            extract_library = "mixed"
-            print("Using both tabula and camelot for extraction")
-        except ImportError:
-            try:
-                import tabula
-                extract_library = "tabula"
-                print("Using tabula for extraction")
-            except ImportError:
-                try:
-                    import camelot
-                    extract_library = "camelot"
-                    print("Using camelot for extraction")
-                except ImportError:
-                    extract_library = None
-                    print("No PDF extraction libraries found. Using sample data.")
-        
-        # Function to extract tables based on available libraries
-        def extract_tables_from_pdf(pdf_file):
-            tables = []
-            
-            if extract_library in ["tabula", "mixed"]:
-                try:
-                    tabula_tables = tabula.read_pdf(pdf_file, pages='all', multiple_tables=True)
-                    print(f"Extracted {len(tabula_tables)} tables with tabula")
-                    tables.extend(tabula_tables)
-                except Exception as e:
-                    print(f"Error extracting with tabula: {e}")
-            
-            if extract_library in ["camelot", "mixed"]:
-                try:
-                    camelot_tables = camelot.read_pdf(pdf_file, pages='all')
-                    camelot_dfs = [table.df for table in camelot_tables]
-                    print(f"Extracted {len(camelot_dfs)} tables with camelot")
-                    tables.extend(camelot_dfs)
-                except Exception as e:
-                    print(f"Error extracting with camelot: {e}")
-            
-            return tables
-        
-        # Process extracted tables
-        def process_tables(tables):
-            all_data = []
-            current_group = 1
-            
-            for i, table in enumerate(tables):
-                if table.empty:
-                    continue
-                
-                # Check if table contains "Student Marks-Group X" header
-                group_in_table = False
-                for col in table.columns:
-                    cell_text = str(col).lower()
-                    if 'group' in cell_text:
-                        group_match = re.search(r'group\s*(\d+)', cell_text, re.IGNORECASE)
-                        if group_match:
-                            current_group = int(group_match.group(1))
-                            group_in_table = True
-                            break
-                
-                # If no group header in columns, check first few rows
-                if not group_in_table:
-                    for row in range(min(3, len(table))):
-                        row_text = ' '.join(str(val) for val in table.iloc[row].values)
-                        if 'group' in row_text.lower():
-                            group_match = re.search(r'group\s*(\d+)', row_text, re.IGNORECASE)
-                            if group_match:
-                                current_group = int(group_match.group(1))
-                                # Skip this row as it's a header
-                                table = table.iloc[row+1:].reset_index(drop=True)
-                                group_in_table = True
-                                break
-                
-                # Check if this looks like a subject header row
-                is_subject_header = False
-                for idx, row in table.iterrows():
-                    row_values = [str(val).strip().lower() for val in row.values]
-                    if 'maths' in row_values and 'physics' in row_values and 'english' in row_values:
-                        # This is likely a header row with subjects
-                        is_subject_header = True
-                        # Rename columns using this row
-                        new_headers = [str(val).strip() for val in row.values]
-                        table.columns = new_headers
-                        # Remove header row
-                        table = table.iloc[idx+1:].reset_index(drop=True)
-                        break
-                
-                # If we have subject columns, process the table
-                subject_columns = ['Maths', 'Physics', 'English', 'Economics', 'Biology']
-                has_subject_columns = any(col in table.columns for col in subject_columns)
-                
-                if not has_subject_columns and len(table.columns) >= 5:
-                    # If columns don't have proper names, rename them
-                    table.columns = subject_columns[:len(table.columns)]
-                
-                # Convert data to numeric
-                for col in table.columns:
-                    if col in subject_columns:
-                        table[col] = pd.to_numeric(table[col], errors='coerce')
-                
-                # Add group column
-                table['Group'] = current_group
-                
-                # Add to combined data
-                all_data.append(table)
-                
-                # Increment group for next table if not explicitly set
-                if not group_in_table:
-                    current_group += 1
-            
-            # Combine all tables
-            if all_data:
-                combined_df = pd.concat(all_data, ignore_index=True)
-                return combined_df
-            else:
-                return pd.DataFrame()
+            "/tmp/q-extract-tables-from-pdf.pdf"  # For Linux/Mac environments
+        ]
         
-        # Extract and process tables
-        if extract_library and os.path.exists(pdf_path):
-            print("Extracting tables from PDF...")
-            extracted_tables = extract_tables_from_pdf(pdf_path)
-            combined_data = process_tables(extracted_tables)
-            
-            if combined_data.empty:
+        for alt_path in alternative_paths:
+            if os.path.exists(alt_path):
+                pdf_path = alt_path
+                print(f"Found PDF at: {pdf_path}")
+                break
+    
+    print(f"Processing PDF: {pdf_path}")
+    
+    try:
+        # Typed marks table for this PDF: extracted once, then served from cache
+        dataset = None
+        if os.path.exists(pdf_path):
+            dataset = MarksDataset.for_pdf(pdf_path)
+            if dataset is None:
                 print("Failed to extract usable data from PDF")
-                # Fall back to sample data for testing
-                use_sample_data = True
-            else:
-                use_sample_data = False
         else:
             print("No extraction libraries available or file not found")
-            use_sample_data = True
         
         # Generate sample data for testing or when extraction fails
-        if use_sample_data:
+        if dataset is None:
             print("Generating sample data...")
             np.random.seed(42)  # For reproducibility
             
@@ -7677,63 +10296,16 @@ def ga4_ninth_solution(query=None):
                         'Group': group
                     })
             
-            combined_data = pd.DataFrame(sample_data)
+            dataset = MarksDataset(pd.DataFrame(sample_data))
         
-        # Perform the analysis with selected comparison operator
-        # After subject pattern detection
         print(f"Detected target subject to sum: {target_subject}")
         print(f"Analyzing data: {target_subject} total for {filter_subject} {comparison_operator} {min_marks} in groups {min_group}-{max_group}")
         
-        # Apply the appropriate filter based on the comparison operator
-        if comparison_operator == ">=":
-            filtered_df = combined_data[
-                (combined_data[filter_subject] >= min_marks) & 
-                (combined_data['Group'] >= min_group) & 
-                (combined_data['Group'] <= max_group)
-            ]
-        elif comparison_operator == ">":
-            filtered_df = combined_data[
-                (combined_data[filter_subject] > min_marks) & 
-                (combined_data['Group'] >= min_group) & 
-                (combined_data['Group'] <= max_group)
-            ]
-        elif comparison_operator == "<=":
-            filtered_df = combined_data[
-                (combined_data[filter_subject] <= min_marks) & 
-                (combined_data['Group'] >= min_group) & 
-                (combined_data['Group'] <= max_group)
-            ]
-        elif comparison_operator == "<":
-            filtered_df = combined_data[
-                (combined_data[filter_subject] < min_marks) & 
-                (combined_data['Group'] >= min_group) & 
-                (combined_data['Group'] <= max_group)
-            ]
-        elif comparison_operator == "==":
-            filtered_df = combined_data[
-                (combined_data[filter_subject] == min_marks) & 
-                (combined_data['Group'] >= min_group) & 
-                (combined_data['Group'] <= max_group)
-            ]
-        else:
-            # Default to >= if operator is unknown
-            filtered_df = combined_data[
-                (combined_data[filter_subject] >= min_marks) & 
-                (combined_data['Group'] >= min_group) & 
-                (combined_data['Group'] <= max_group)
-            ]
-        
-        # Calculate total marks
-        total_marks = filtered_df[target_subject].sum()
-        student_count = len(filtered_df)
+        # Compiled filter-sum over the group-sorted columns
+        total_marks, student_count = dataset.answer(question)
         
         print(f"Found {student_count} students matching criteria")
         print(f"Total {target_subject} marks: {total_marks}")
-        
-        # Create temporary CSV for reference
-        temp_dir = tempfile.gettempdir()
-        csv_path = os.path.join(temp_dir, "student_marks_analysis.csv")
-        filtered_df.to_csv(csv_path, index=False)
           
         # Format the output for better display
         return f"""ANSWER: The total {target_subject} marks of students who scored {min_marks} {comparison_operator} in {filter_subject} in groups {min_group}-{max_group} is {total_marks:.2f}"""
@@ -7747,15 +10319,515 @@ def ga4_ninth_solution(query=None):
         return f"""Error analyzing PDF data: {str(e)}
 
 FALLBACK ANSWER: The total {target_subject} marks of students who scored {min_marks} {comparison_operator} in {filter_subject} in groups {min_group}-{max_group} is approximately 14306.00"""# Map file paths to solution functions
+# In-process PDF to Markdown conversion (used by ga4_tenth_solution)
+_PDF_MARKDOWN_CACHE = {}
+
+_MD_FENCE = re.compile(r'^( {0,3})(`{3,}|~{3,})(.*)$')
+_MD_ATX_HEADING = re.compile(r'^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$')
+_MD_SETEXT_UNDERLINE = re.compile(r'^ {0,3}(=+|-+)[ \t]*$')
+_MD_THEMATIC_BREAK = re.compile(r'^ {0,3}(?:(?:\*[ \t]*){3,}|(?:-[ \t]*){3,}|(?:_[ \t]*){3,})$')
+_MD_LIST_ITEM = re.compile(r'^( {0,3})([-*+]|\d{1,9}[.)])(?:([ \t]+)(.*))?$')
+_MD_TABLE_DELIMITER = re.compile(r'^ {0,3}\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*$')
+_MD_BLOCKQUOTE = re.compile(r'^ {0,3}> ?(.*)$')
+_MD_CODE_SPAN = re.compile(r'(`+)(.+?)\1')
+_MD_EMPHASIS = re.compile(r'(?<![*\w\\])\*(?![\s*])([^*\n]+?)(?<![\s\\])\*(?![*\w])')
+_MD_STRONG = re.compile(r'(?<![_\w\\])__(?![\s_])([^_\n]+?)(?<![\s\\])__(?![_\w])')
+_MD_LONE_ASTERISKS = re.compile(r'(?<=\S )\*+(?= |$)')
+
+
+def _extract_pdf_text_range(task):
+    """
+    Process-pool worker: extract the text of pages [start, stop).
+
+    Args:
+        task (tuple): (pdf_path, start, stop) with 0-based page indices
+
+    Returns:
+        list: One text string per page
+    """
+    pdf_path, start, stop = task
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        try:
+            from PyPDF2 import PdfReader
+        except ImportError:
+            PdfReader = None
+
+    if PdfReader is not None:
+        reader = PdfReader(pdf_path)
+        stop = min(stop, len(reader.pages))
+        return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+    from pdfminer.high_level import extract_text
+    return [extract_text(pdf_path, page_numbers=[i]) for i in range(start, stop)]
+
+
+def extract_pdf_text(pdf_path, pages_per_task=8, processes=None):
+    """
+    Extract the text of every page, splitting the pages across a process pool.
+
+    Short documents are read in-process; longer ones reuse the long-lived
+    PDF extraction pool.
+
+    Args:
+        pdf_path (str): Path to the PDF
+        pages_per_task (int): Pages handled by one worker call
+        processes (int, optional): Worker processes (defaults to CPU count)
+
+    Returns:
+        list: One text string per page, in page order
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    global _PDF_EXTRACTION_POOL
+
+    page_count = _pdf_page_count(pdf_path)
+    if not page_count or page_count <= pages_per_task:
+        if page_count is None:
+            # No page-level reader: pdfminer extracts the whole document at once
+            from pdfminer.high_level import extract_text
+            return [extract_text(pdf_path)]
+        return _extract_pdf_text_range((pdf_path, 0, page_count))
+
+    tasks = [(pdf_path, start, start + pages_per_task) for start in range(0, page_count, pages_per_task)]
+    if _PDF_EXTRACTION_POOL is None:
+        _PDF_EXTRACTION_POOL = ProcessPoolExecutor(max_workers=processes)
+
+    pages = []
+    for range_pages in _PDF_EXTRACTION_POOL.map(_extract_pdf_text_range, tasks):
+        pages.extend(range_pages)
+    print(f"Extracted text from {page_count} pages ({len(tasks)} page ranges)")
+    return pages
+
+
+def pdf_text_to_markdown(pages):
+    """
+    Turn extracted page text into Markdown.
+
+    Short all-caps lines become headings and "•" bullets become list items;
+    everything else is kept as paragraph text.
+    """
+    formatted_lines = []
+    for page_text in pages:
+        for line in page_text.split('\n'):
+            line = line.strip()
+            if not line:
+                formatted_lines.append('')
+            elif line.isupper() and len(line) < 60:
+                # Likely a heading
+                formatted_lines.append(f"# {line}")
+            elif line.startswith('•'):
+                formatted_lines.append(f"- {line[1:].strip()}")
+            else:
+                formatted_lines.append(line)
+        formatted_lines.append('')
+    return '\n'.join(formatted_lines)
+
+
+def _markdown_text_width(text):
+    """Display width of a table cell, counting wide East Asian characters twice."""
+    import unicodedata
+
+    width = 0
+    for char in text:
+        if unicodedata.combining(char):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+    return width
+
+
+def _format_markdown_inline(text):
+    """Apply prettier's inline rules (single spaces, _emphasis_, **strong**) outside code spans."""
+    def format_prose(prose):
+        prose = re.sub(r'[ \t]+', ' ', prose)
+        # A "*" between spaces can't be emphasis; prettier escapes it
+        prose = _MD_LONE_ASTERISKS.sub(lambda match: match.group(0).replace('*', '\\*'), prose)
+        return _MD_STRONG.sub(r'**\1**', _MD_EMPHASIS.sub(r'_\1_', prose))
+
+    parts = []
+    position = 0
+    for match in _MD_CODE_SPAN.finditer(text):
+        parts.append(format_prose(text[position:match.start()]))
+        parts.append(match.group(0))
+        position = match.end()
+    parts.append(format_prose(text[position:]))
+    return ''.join(parts)
+
+
+def _split_markdown_table_row(line):
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    return [cell.strip() for cell in re.split(r'(?<!\\)\|', line)]
+
+
+def _format_markdown_table(lines):
+    """
+    Format a pipe table the way prettier does: every column is padded to its
+    widest cell (at least 3), however wide the table gets (prettier only
+    compacts tables under proseWrap "never").
+    """
+    header = _split_markdown_table_row(lines[0])
+    aligns = []
+    for spec in _split_markdown_table_row(lines[1]):
+        if spec.startswith(':') and spec.endswith(':'):
+            aligns.append('center')
+        elif spec.endswith(':'):
+            aligns.append('right')
+        elif spec.startswith(':'):
+            aligns.append('left')
+        else:
+            aligns.append(None)
+
+    rows = [header] + [_split_markdown_table_row(line) for line in lines[2:]]
+    column_count = len(aligns)
+    rows = [(row + [''] * column_count)[:column_count] for row in rows]
+    rows = [[_format_markdown_inline(cell) for cell in row] for row in rows]
+    widths = [max(3, *(_markdown_text_width(row[i]) for row in rows)) for i in range(column_count)]
+
+    def delimiter(align, width):
+        if align == 'center':
+            return ':' + '-' * (width - 2) + ':'
+        if align == 'right':
+            return '-' * (width - 1) + ':'
+        if align == 'left':
+            return ':' + '-' * (width - 1)
+        return '-' * width
+
+    def aligned_cell(text, align, width):
+        padding = width - _markdown_text_width(text)
+        if align == 'right':
+            return ' ' * padding + text
+        if align == 'center':
+            return ' ' * (padding // 2) + text + ' ' * (padding - padding // 2)
+        return text + ' ' * padding
+
+    aligned = [
+        '| ' + ' | '.join(aligned_cell(row[i], aligns[i], widths[i]) for i in range(column_count)) + ' |'
+        for row in rows
+    ]
+    aligned.insert(1, '| ' + ' | '.join(delimiter(aligns[i], widths[i]) for i in range(column_count)) + ' |')
+    return aligned
+
+
+def _leading_spaces(line):
+    return len(line) - len(line.lstrip(' '))
+
+
+def _markdown_block_start(line):
+    """True when a line would interrupt a paragraph."""
+    return bool(_MD_FENCE.match(line) or _MD_ATX_HEADING.match(line) or
+                _MD_THEMATIC_BREAK.match(line) or _MD_BLOCKQUOTE.match(line) or
+                (_MD_LIST_ITEM.match(line) and _MD_LIST_ITEM.match(line).group(4)))
+
+
+def _normalize_markdown_blocks(lines):
+    """
+    Normalize a sequence of Markdown lines into printed blocks.
+
+    Returns:
+        list: Blocks, each a list of output lines; blocks are separated by a
+        blank line when printed
+    """
+    blocks = []
+    previous_list = None  # (ordered, sibling index) of the directly preceding list
+    i = 0
+    while i < len(lines):
+        line = lines[i].replace('\t', '    ')
+        if not line.strip():
+            i += 1
+            continue
+
+        list_block = None
+
+        fence = _MD_FENCE.match(line)
+        if fence:
+            indent, marker, info = fence.groups()
+            block = []
+            i += 1
+            while i < len(lines):
+                closing = _MD_FENCE.match(lines[i])
+                if closing and closing.group(2)[0] == marker[0] and len(closing.group(2)) >= len(marker) and not closing.group(3).strip():
+                    i += 1
+                    break
+                code_line = lines[i]
+                block.append(code_line[min(len(indent), _leading_spaces(code_line)):])
+                i += 1
+            # prettier always fences with backticks, one more than the longest
+            # run inside the code, and prints the info string as "lang meta"
+            longest = max((len(run) for run in re.findall(r'`+', '\n'.join(block))), default=0)
+            fence_text = '`' * max(3, longest + 1)
+            info = ' '.join(info.strip().split(None, 1))
+            blocks.append([fence_text + info] + block + [fence_text])
+
+        elif _leading_spaces(line) >= 4:
+            # Indented code block: kept verbatim, trailing blank lines dropped.
+            # Right after a list it would be re-read as item content once the
+            # marker is normalized, so it is separated by an HTML comment
+            if previous_list:
+                blocks.append(['<!-- -->'])
+            block = []
+            while i < len(lines) and (not lines[i].strip() or _leading_spaces(lines[i].replace('\t', '    ')) >= 4):
+                block.append(lines[i].rstrip())
+                i += 1
+            while block and not block[-1]:
+                block.pop()
+            blocks.append(block)
+
+        elif _MD_ATX_HEADING.match(line):
+            level, content = _MD_ATX_HEADING.match(line).groups()
+            content = (content or '').strip()
+            blocks.append([level + (' ' + _format_markdown_inline(content) if content else '')])
+            i += 1
+
+        elif _MD_THEMATIC_BREAK.match(line):
+            blocks.append(['---'])
+            i += 1
+
+        elif _MD_BLOCKQUOTE.match(line):
+            quoted = []
+            while i < len(lines) and lines[i].strip():
+                quote = _MD_BLOCKQUOTE.match(lines[i])
+                quoted.append(quote.group(1) if quote else lines[i])
+                i += 1
+            inner = _print_markdown_blocks(_normalize_markdown_blocks(quoted))
+            blocks.append([('> ' + text) if text else '>' for text in inner] or ['>'])
+
+        elif ('|' in line and i + 1 < len(lines) and _MD_TABLE_DELIMITER.match(lines[i + 1]) and '-' in lines[i + 1]
+              and len(_split_markdown_table_row(line)) == len(_split_markdown_table_row(lines[i + 1]))):
+            # GFM only starts a table when header and delimiter have the same cell count
+            table = [line, lines[i + 1]]
+            i += 2
+            while i < len(lines) and lines[i].strip() and '|' in lines[i]:
+                table.append(lines[i])
+                i += 1
+            blocks.append(_format_markdown_table(table))
+
+        elif _MD_LIST_ITEM.match(line):
+            block, i, list_block = _normalize_markdown_list(lines, i, previous_list)
+            blocks.append(block)
+
+        else:
+            # Paragraph, possibly closed by a setext underline
+            paragraph = []
+            while i < len(lines) and lines[i].strip():
+                if paragraph and _MD_SETEXT_UNDERLINE.match(lines[i]):
+                    break
+                if paragraph and _markdown_block_start(lines[i]):
+                    break
+                paragraph.append(lines[i])
+                i += 1
+
+            underline = _MD_SETEXT_UNDERLINE.match(lines[i]) if i < len(lines) and paragraph else None
+            if underline:
+                i += 1
+                level = '#' if underline.group(1)[0] == '=' else '##'
+                blocks.append([level + ' ' + _format_markdown_inline(' '.join(text.strip() for text in paragraph))])
+            else:
+                printed = []
+                for index, text in enumerate(paragraph):
+                    hard_break = text.endswith('  ') and index < len(paragraph) - 1
+                    printed.append(_format_markdown_inline(text.strip()) + ('  ' if hard_break else ''))
+                blocks.append(printed)
+
+        previous_list = list_block
+    return blocks
+
+
+def _normalize_markdown_list(lines, i, previous_list):
+    """
+    Normalize one list starting at lines[i].
+
+    Bullets become "-" ("*" for a list directly following another bullet
+    list), ordered lists are renumbered from their start number (or keep
+    repeating "1." when written that way), and item content is re-indented
+    to the new marker width. A list with any blank line between its items
+    is printed loose; blocks inside the items of a tight list are not
+    separated by blank lines.
+
+    Returns:
+        tuple: (output lines, index of the next unread line, (ordered, sibling index))
+    """
+    first = _MD_LIST_ITEM.match(lines[i].replace('\t', '    '))
+    ordered = first.group(2)[0].isdigit()
+    delimiter = first.group(2)[-1]
+
+    items = []  # (number, content lines)
+    loose = False
+    pending_blank = False
+    content_offset = 0
+    while i < len(lines):
+        line = lines[i].replace('\t', '    ')
+        if not line.strip():
+            pending_blank = True
+            items[-1][1].append('')
+            i += 1
+            continue
+
+        item = _MD_LIST_ITEM.match(line)
+        indent = _leading_spaces(line)
+        if item and indent < content_offset or (item and not items):
+            same_list = item.group(2)[0].isdigit() == ordered and item.group(2)[-1] == delimiter
+            if not same_list:
+                break
+            if items and pending_blank:
+                loose = True
+            spacing = item.group(3) or ' '
+            text = item.group(4) or ''
+            if len(spacing) > 4:
+                # Content indented 5+ columns is an indented code block inside the item
+                spacing, text = ' ', spacing[1:] + text
+            content_offset = indent + len(item.group(2)) + len(spacing)
+            number = int(item.group(2)[:-1]) if ordered else None
+            items.append((number, [text] if text else []))
+            pending_blank = False
+        elif indent >= content_offset:
+            items[-1][1].append(line[content_offset:])
+            if pending_blank and any(text for text in items[-1][1][:-1]):
+                loose = True
+            pending_blank = False
+        elif (not pending_blank and items[-1][1] and items[-1][1][-1] and not _markdown_block_start(line)
+              and not _MD_SETEXT_UNDERLINE.match(line)):
+            # Lazy paragraph continuation (an empty item has no paragraph to
+            # continue, and an underline would turn the item into a heading)
+            items[-1][1].append(line.strip())
+        else:
+            break
+        i += 1
+
+    # Blank lines after the last item belong to the surrounding document
+    while items[-1][1] and not items[-1][1][-1]:
+        items[-1][1].pop()
+
+    sibling_index = previous_list[1] + 1 if previous_list and previous_list[0] == ordered else 0
+    if ordered:
+        # prettier keeps "1. 1. 1." style lists (second item numbered 1) as written
+        start = items[0][0]
+        second = items[1][0] if len(items) > 1 else None
+        if start == 0 and len(items) > 2:
+            repeat = second == 1 and items[2][0] == 1
+        else:
+            repeat = second == 1
+        delimiter_text = '.' if sibling_index % 2 == 0 else ')'
+    else:
+        bullet = '-' if sibling_index % 2 == 0 else '*'
+
+    output = []
+    for index, (number, content) in enumerate(items):
+        if ordered:
+            if index == 0:
+                value = start
+            else:
+                value = 1 if repeat else start + index
+            marker = f"{value}{delimiter_text} "
+        else:
+            marker = bullet + ' '
+
+        body = _print_markdown_blocks(_normalize_markdown_blocks(content), separate=loose)
+        if index and loose:
+            output.append('')
+        if not body:
+            output.append(marker.rstrip())
+            continue
+        output.append(marker + body[0])
+        output.extend((' ' * len(marker) + text) if text else '' for text in body[1:])
+    return output, i, (ordered, sibling_index)
+
+
+def _print_markdown_blocks(blocks, separate=True):
+    lines = []
+    for block in blocks:
+        if lines and separate:
+            lines.append('')
+        lines.extend(block)
+    return lines
+
+
+def normalize_markdown(text):
+    """
+    Format Markdown following prettier's Markdown rules (proseWrap "preserve").
+
+    Covers the constructs the converters here produce: ATX/setext headings,
+    paragraphs, bullet and ordered lists (including nesting), pipe tables,
+    block quotes, fenced and indented code, thematic breaks, and
+    emphasis/strong markers. Blocks are separated by exactly one blank line,
+    trailing whitespace is removed and the output ends with one newline.
+
+    Args:
+        text (str): Markdown source
+
+    Returns:
+        str: Normalized Markdown
+    """
+    lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    printed = _print_markdown_blocks(_normalize_markdown_blocks(lines))
+    return '\n'.join(printed) + '\n' if printed else ''
+
+
+def convert_pdf_to_markdown(pdf_path, formatter="auto"):
+    """
+    Convert a PDF to formatted Markdown, caching the result by PDF hash.
+
+    Args:
+        pdf_path (str): Path to the PDF
+        formatter (str): "python" for normalize_markdown, "prettier" for the
+            persistent prettier daemon, or "auto" to use the daemon only when
+            prettier is already installed and fall back to normalize_markdown
+
+    Returns:
+        str: Markdown text, or None when no PDF text extractor is installed
+    """
+    if formatter == "auto":
+        formatter = "prettier" if PrettierDaemon.shared().is_installed() else "python"
+
+    # Without a content hash (unreadable PDF) there is no safe cache key
+    content_hash = file_manager.content_hash(pdf_path)
+    cache_key = (content_hash, formatter)
+    if content_hash and cache_key in _PDF_MARKDOWN_CACHE:
+        return _PDF_MARKDOWN_CACHE[cache_key]
+
+    cache_file = file_manager.cache_path("pdf_markdown", f"{content_hash}-{formatter}", ".md")
+    if content_hash and os.path.exists(cache_file):
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            markdown = f.read()
+        _PDF_MARKDOWN_CACHE[cache_key] = markdown
+        return markdown
+
+    try:
+        pages = extract_pdf_text(pdf_path)
+    except ImportError:
+        print("No PDF text extraction library found (pypdf, PyPDF2 or pdfminer).")
+        return None
+
+    markdown = pdf_text_to_markdown(pages)
+    if formatter == "prettier":
+        try:
+            markdown = PrettierDaemon.shared().format(markdown, "output.md")
+        except Exception as e:
+            print(f"prettier daemon unavailable, using the built-in formatter: {str(e)}")
+            formatter = "python"
+    if formatter == "python":
+        markdown = normalize_markdown(markdown)
+
+    if content_hash:
+        with open(file_manager.cache_path("pdf_markdown", f"{content_hash}-{formatter}", ".md"), 'w', encoding='utf-8') as f:
+            f.write(markdown)
+        _PDF_MARKDOWN_CACHE[(content_hash, formatter)] = markdown
+    return markdown
+
+
 def ga4_tenth_solution(query=None):
     """
-    Convert a PDF file to Markdown and format with Prettier.
+    Convert a PDF file to Markdown and format it following Prettier's rules.
     
     Args:
         query (str, optional): Query potentially containing custom PDF file path
         
     Returns:
-        str: Markdown content formatted with Prettier
+        str: Markdown content formatted like Prettier output
     """
     import os
     import re
@@ -7914,193 +10986,14 @@ def ga4_tenth_solution(query=None):
     
     # Convert PDF to Markdown
     try:
-        # Create a temporary directory for output
-        output_dir = tempfile.mkdtemp()
-        markdown_path = os.path.join(output_dir, "output.md")
-        
-        # Try to import PDF extraction libraries
-        pdf_extraction_successful = False
-        
-        # 1. Try PyPDF2 extraction first
-        try:
-            from PyPDF2 import PdfReader
-            
-            print("Extracting text using PyPDF2...")
-            text_content = []
-            
-            with open(pdf_path, 'rb') as file:
-                reader = PdfReader(file)
-                num_pages = len(reader.pages)
-                
-                for i in range(num_pages):
-                    page = reader.pages[i]
-                    text = page.extract_text()
-                    text_content.append(text)
-            
-            # Convert extracted text to markdown
-            markdown_content = "\n\n".join(text_content)
-            
-            # Apply some basic markdown formatting
-            lines = markdown_content.split('\n')
-            formatted_lines = []
-            
-            for line in lines:
-                line = line.rstrip()
-                
-                # Skip empty lines
-                if not line.strip():
-                    formatted_lines.append('')
-                    continue
-                
-                # Try to detect headings based on formatting
-                if line.strip().isupper() and len(line.strip()) < 60:
-                    # Likely a heading - make it a markdown heading
-                    formatted_lines.append(f"# {line.strip()}")
-                elif re.match(r'^\d+\.\s', line):
-                    # Numbered list
-                    formatted_lines.append(line)
-                elif line.strip().startswith('•') or line.strip().startswith('*'):
-                    # Bullet points
-                    formatted_lines.append(line)
-                else:
-                    formatted_lines.append(line)
-            
-            markdown_content = '\n'.join(formatted_lines)
-            
-            # Write to file with explicit encoding
-            with open(markdown_path, 'w', encoding='utf-8', errors='replace') as f:
-                f.write(markdown_content)
-                
-            pdf_extraction_successful = True
-            print("PDF text extraction successful with PyPDF2")
-            
-        except ImportError:
-            print("PyPDF2 not available, trying alternative method...")
-        except Exception as e:
-            print(f"Error extracting with PyPDF2: {str(e)}")
-        
-        # 2. Try with pypandoc if PyPDF2 failed
-        if not pdf_extraction_successful:
-            try:
-                import pypandoc
-                
-                print("Converting with pypandoc...")
-                output = pypandoc.convert_file(pdf_path, 'markdown', outputfile=markdown_path)
-                pdf_extraction_successful = True
-                print("PDF conversion successful with pypandoc")
-                
-            except ImportError:
-                print("pypandoc not available, trying another method...")
-            except Exception as e:
-                print(f"Error converting with pypandoc: {str(e)}")
-        
-        # 3. Try with pdfminer if previous methods failed
-        if not pdf_extraction_successful:
-            try:
-                from pdfminer.high_level import extract_text
-                
-                print("Extracting text using pdfminer...")
-                text = extract_text(pdf_path)
-                
-                with open(markdown_path, 'w', encoding='utf-8', errors='replace') as f:
-                    f.write(text)
-                    
-                pdf_extraction_successful = True
-                print("PDF text extraction successful with pdfminer")
-                
-            except ImportError:
-                print("pdfminer not available...")
-            except Exception as e:
-                print(f"Error extracting with pdfminer: {str(e)}")
-        
-        # If all extraction methods failed
-        if not pdf_extraction_successful:
+        final_markdown = convert_pdf_to_markdown(pdf_path)
+        if final_markdown is None:
             print("All PDF extraction methods failed, using fallback content")
-            with open(markdown_path, 'w', encoding='utf-8', errors='replace') as f:
-                f.write("# Sample Document\n\nUnable to extract content from the PDF.")
-        
-        # Format the markdown with prettier
-        prettier_formatted = False
-        try:
-            print("Formatting markdown with Prettier 3.4.2...")
-            
-            # Create temporary package.json for isolated prettier installation
-            pkg_dir = tempfile.mkdtemp()
-            pkg_json_path = os.path.join(pkg_dir, "package.json")
-            
-            with open(pkg_json_path, 'w', encoding='utf-8') as f:
-                f.write("""
-                {
-                  "name": "pdf-to-markdown",
-                  "version": "1.0.0",
-                  "private": true,
-                  "dependencies": {
-                    "prettier": "3.4.2"
-                  }
-                }
-                """)
-            
-            # Install prettier locally to avoid global conflicts
-            try:
-                subprocess.run(
-                    ['npm', 'install'], 
-                    cwd=pkg_dir,
-                    stdout=subprocess.PIPE, 
-                    stderr=subprocess.PIPE,
-                    encoding='utf-8',
-                    errors='replace'
-                )
-            except subprocess.SubprocessError as e:
-                print(f"Warning: Could not install Prettier: {e}")
-            
-            # Run prettier on the markdown file with explicit encoding
-            try:
-                print("Running Prettier on the markdown file...")
-                result = subprocess.run(
-                    ['npx', '--yes', 'prettier@3.4.2', '--write', markdown_path],
-                    cwd=pkg_dir,
-                    stdout=subprocess.PIPE, 
-                    stderr=subprocess.PIPE,
-                    encoding='utf-8',
-                    errors='replace'
-                )
-                if result.returncode == 0:
-                    prettier_formatted = True
-                    print("Markdown formatted with Prettier")
-                else:
-                    print(f"Prettier warning: {result.stderr}")
-            except Exception as e:
-                print(f"Error running Prettier: {str(e)}")
-            
-            # Clean up package directory
-            try:
-                shutil.rmtree(pkg_dir, ignore_errors=True)
-            except Exception:
-                pass
-            
-        except Exception as e:
-            print(f"Error with Prettier setup: {str(e)}")
-            print("Using unformatted markdown")
-        
-        # Read the final markdown content with robust encoding handling
-        try:
-            with open(markdown_path, 'r', encoding='utf-8', errors='replace') as f:
-                final_markdown = f.read()
-        except Exception as e:
-            print(f"Error reading markdown: {str(e)}")
-            final_markdown = "# Error Reading Markdown\n\nThere was an error reading the generated markdown file."
-        
-        # Clean up temporary files
-        try:
-            if is_remote and 'temp_dir' in locals():
-                shutil.rmtree(temp_dir, ignore_errors=True)
-            shutil.rmtree(output_dir, ignore_errors=True)
-        except Exception as e:
-            print(f"Warning: Could not clean up temporary files: {str(e)}")
-        
+            final_markdown = "# Sample Document\n\nUnable to extract content from the PDF.\n"
+
         # Return the formatted markdown content
         return final_markdown
-        
+
     except Exception as e:
         print(f"Error processing PDF: {str(e)}")
         print(traceback.format_exc())
@@ -8115,6 +11008,145 @@ This is a fallback markdown document created because the PDF conversion failed.
 There was an error processing the PDF file. Please check the console output for details.
 """   # Check for file path in query using the centralized detection function
 #GA5
+# Vectorized sales workbook cleaning (used by ga5_first_solution)
+_CLEAN_SALES_CACHE = {}
+_SALES_COUNTRY_ALIASES = {
+    'USA': 'US',
+    'U.S.A': 'US',
+    'U.S.A.': 'US',
+    'UNITED STATES': 'US',
+    'UNITED STATES OF AMERICA': 'US',
+    'INDIA': 'IN',
+    'BRASIL': 'BR',
+    'BRAZIL': 'BR',
+    'UK': 'GB',
+    'U.K.': 'GB',
+    'UNITED KINGDOM': 'GB',
+    'GREAT BRITAIN': 'GB',
+    'ENGLAND': 'GB',
+    'CANADA': 'CA',
+    'GERMANY': 'DE',
+    'DEUTSCHLAND': 'DE',
+    'FRANCE': 'FR',
+    'JAPAN': 'JP'
+}
+# (regex the raw value must match, strftime format) tried in order; anything
+# left over is parsed value by value with pandas' generic parser
+_SALES_DATE_FORMATS = [
+    (r'^\d{2}-\d{2}-\d{4}', '%m-%d-%Y'),
+    (r'^\d{4}/\d{2}/\d{2}', '%Y/%m/%d')
+]
+
+
+def clean_sales_dataframe(df):
+    """
+    Clean a raw sales sheet with column-wise operations only.
+
+    Args:
+        df (DataFrame): Raw sheet with Customer Name, Country, Date,
+            Product/Code, Sales and Cost columns
+
+    Returns:
+        DataFrame: Copy with standardized Country, parsed Date, a Product
+        column and numeric Sales/Cost (missing Cost filled with 50% of Sales)
+    """
+    import pandas as pd
+    import numpy as np
+
+    df = df.copy()
+
+    # 1. Clean and normalize strings
+    df['Customer Name'] = df['Customer Name'].str.strip()
+    country = df['Country'].astype(str).str.strip().str.upper()
+    df['Country'] = country.map(_SALES_COUNTRY_ALIASES).fillna(country)
+
+    # 2. Standardize date formats - one bulk to_datetime call per format
+    raw_dates = df['Date'].where(df['Date'].notna()).astype(str).str.strip()
+    parsed_dates = pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+    remaining = df['Date'].notna()
+    for pattern, date_format in _SALES_DATE_FORMATS:
+        mask = remaining & raw_dates.str.match(pattern)
+        if mask.any():
+            parsed_dates[mask] = pd.to_datetime(raw_dates[mask], format=date_format, errors='coerce')
+        remaining &= ~mask
+    if remaining.any():
+        # A bulk to_datetime would infer one format from the first value and turn
+        # every other format into NaT, so parse each distinct leftover on its own
+        def parse_leftover(date_str):
+            try:
+                return pd.Timestamp(pd.to_datetime(date_str))
+            except (ValueError, TypeError, OverflowError):
+                return pd.NaT
+
+        leftovers = raw_dates[remaining]
+        parsed_leftovers = {value: parse_leftover(value) for value in leftovers.unique()}
+        parsed_dates[remaining] = leftovers.map(parsed_leftovers)
+    unparsed = df['Date'].notna() & parsed_dates.isna()
+    if unparsed.any():
+        print(f"Warning: Could not parse {int(unparsed.sum())} dates")
+    df['Date'] = parsed_dates
+
+    # 3. Extract product name
+    product_code = df['Product/Code'].where(df['Product/Code'].notna(), '').astype(str)
+    df['Product'] = product_code.str.split('/', n=1).str[0].str.strip()
+
+    # 4. Clean and convert Sales and Cost
+    for column in ('Sales', 'Cost'):
+        digits = df[column].where(df[column].notna()).astype(str).str.replace(r'[^\d.]', '', regex=True)
+        df[column] = pd.to_numeric(digits.replace('', np.nan), errors='coerce')
+
+    # Handle missing Cost values (50% of Sales)
+    df['Cost'] = np.where(df['Cost'].isna(), df['Sales'] * 0.5, df['Cost'])
+
+    return df
+
+
+def load_clean_sales_data(excel_path):
+    """
+    Load the cleaned sales frame for a workbook, parsing Excel only once.
+
+    The cleaned frame is cached in memory and as Parquet keyed on the
+    workbook's content hash, so later queries with other filters skip both
+    read_excel and the cleaning step.
+
+    Args:
+        excel_path (str): Path to the sales workbook
+
+    Returns:
+        DataFrame: Output of clean_sales_dataframe
+    """
+    import pandas as pd
+
+    content_hash = file_manager.content_hash(excel_path)
+    if content_hash in _CLEAN_SALES_CACHE:
+        print("Using cached cleaned sales data")
+        return _CLEAN_SALES_CACHE[content_hash]
+
+    parquet_path = None
+    if content_hash:
+        parquet_path = file_manager.cache_path("clean_sales", content_hash, ".parquet")
+        if os.path.exists(parquet_path):
+            try:
+                df = pd.read_parquet(parquet_path)
+                print(f"Loaded cleaned sales data from {parquet_path}")
+                _CLEAN_SALES_CACHE[content_hash] = df
+                return df
+            except Exception as e:
+                print(f"Warning: Could not read cached Parquet file: {str(e)}")
+
+    df = clean_sales_dataframe(pd.read_excel(excel_path))
+    print(f"Excel file loaded and cleaned with {len(df)} rows")
+
+    if content_hash:
+        _CLEAN_SALES_CACHE[content_hash] = df
+        try:
+            df.to_parquet(parquet_path, index=False)
+        except Exception as e:
+            print(f"Warning: Could not cache cleaned data as Parquet: {str(e)}")
+
+    return df
+
+
 def ga5_first_solution(query=None):
     """
     Clean Excel sales data and calculate total margin based on specific filters.
@@ -8223,104 +11255,26 @@ def ga5_first_solution(query=None):
         else:
             # If no timezone in the input, assume it's in the local timezone
             local_tz = pytz.timezone('Asia/Kolkata')  # Default to IST
-            cutoff_date = local_tz.localize(cutoff_date).astimezone(pytz.UTC)
-            
-    except Exception as e:
-        print(f"Error parsing date: {str(e)}")
-        print(f"Using default cutoff date: {default_date_str}")
-        # Default to January 3, 2022 05:23:44 IST
-        cutoff_date = datetime(2022, 1, 3, 5, 23, 44, tzinfo=pytz.timezone('Asia/Kolkata')).astimezone(pytz.UTC)
-    
-    print(f"Final cutoff date (UTC): {cutoff_date}")
-    
-    # Function to standardize country codes
-    def standardize_country(country):
-        country = str(country).strip().upper()
-        # Map of common variations to standard codes
-        country_map = {
-            'USA': 'US',
-            'U.S.A': 'US',
-            'U.S.A.': 'US',
-            'UNITED STATES': 'US',
-            'UNITED STATES OF AMERICA': 'US',
-            'INDIA': 'IN',
-            'BRASIL': 'BR',
-            'BRAZIL': 'BR',
-            'UK': 'GB',
-            'U.K.': 'GB',
-            'UNITED KINGDOM': 'GB',
-            'GREAT BRITAIN': 'GB',
-            'ENGLAND': 'GB',
-            'CANADA': 'CA',
-            'GERMANY': 'DE',
-            'DEUTSCHLAND': 'DE',
-            'FRANCE': 'FR',
-            'JAPAN': 'JP'
-        }
-        return country_map.get(country, country)
-    
-    # Function to extract product name from Product/Code field
-    def extract_product(product_code):
-        if pd.isna(product_code):
-            return ''
-        product_code = str(product_code)
-        parts = product_code.split('/')
-        return parts[0].strip() if parts else ''
-    
-    # Function to clean monetary values
-    def clean_monetary(value):
-        if pd.isna(value):
-            return np.nan
-        # Remove non-numeric characters except decimal point
-        value = str(value)
-        numeric_string = re.sub(r'[^\d.]', '', value)
-        return float(numeric_string) if numeric_string else np.nan
-    
-    # Load the Excel file
-    try:
-        df = pd.read_excel(excel_path)
-        print(f"Excel file loaded with {len(df)} rows")
-        
-        # 1. Clean and normalize strings
-        df['Customer Name'] = df['Customer Name'].str.strip()
-        df['Country'] = df['Country'].apply(standardize_country)
-        
-        # 2. Standardize date formats
-        def parse_date(date_str):
-            if pd.isna(date_str):
-                return None
-                
-            date_str = str(date_str).strip()
-            
-            try:
-                # Try MM-DD-YYYY format
-                if re.match(r'\d{2}-\d{2}-\d{4}', date_str):
-                    return pd.to_datetime(date_str, format='%m-%d-%Y')
-                # Try YYYY/MM/DD format
-                elif re.match(r'\d{4}/\d{2}/\d{2}', date_str):
-                    return pd.to_datetime(date_str, format='%Y/%m/%d')
-                # Try Excel's automatic date format
-                else:
-                    return pd.to_datetime(date_str)
-            except:
-                print(f"Warning: Could not parse date: {date_str}")
-                return None
-        
-        df['Date'] = df['Date'].apply(parse_date)
-        
-        # 3. Extract product name
-        df['Product'] = df['Product/Code'].apply(extract_product)
-        
-        # 4. Clean and convert Sales and Cost
-        df['Sales'] = df['Sales'].apply(clean_monetary)
-        df['Cost'] = df['Cost'].apply(clean_monetary)
+            cutoff_date = local_tz.localize(cutoff_date).astimezone(pytz.UTC)
+            
+    except Exception as e:
+        print(f"Error parsing date: {str(e)}")
+        print(f"Using default cutoff date: {default_date_str}")
+        # Default to January 3, 2022 05:23:44 IST
+        cutoff_date = datetime(2022, 1, 3, 5, 23, 44, tzinfo=pytz.timezone('Asia/Kolkata')).astimezone(pytz.UTC)
+    
+    print(f"Final cutoff date (UTC): {cutoff_date}")
+    
+    # Load the cleaned sales data (cached by workbook hash)
+    try:
+        df = load_clean_sales_data(excel_path)
         
-        # Handle missing Cost values (50% of Sales)
-        df['Cost'] = df.apply(lambda row: row['Sales'] * 0.5 if pd.isna(row['Cost']) else row['Cost'], axis=1)
+        # Dates in the sheet carry no timezone, so compare in local (IST) time
+        cutoff_local = cutoff_date.astimezone(pytz.timezone('Asia/Kolkata')).replace(tzinfo=None)
         
         # 5. Apply filters
         filtered_df = df[
-            (df['Date'] <= cutoff_date) & 
+            (df['Date'] <= cutoff_local) & 
             (df['Product'] == target_product) & 
             (df['Country'] == target_country)
         ]
@@ -8353,6 +11307,174 @@ def ga5_first_solution(query=None):
         traceback.print_exc()
         return f"Error: {str(e)}"
     
+# Streaming unique student ID counting (used by ga5_second_solution)
+# First "-ID::" on each line, matching the per-line re.search of the text path
+_STUDENT_ID_PATTERN = re.compile(rb'^[^\n]*?-([A-Z0-9]+)::', re.MULTILINE)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog cardinality sketch with 2**precision one-byte registers.
+
+    With the default precision of 14 the sketch uses 16 KiB and has a
+    standard error of about 0.8%. Sketches built over different blocks are
+    combined with merge(), so counting parallelizes without sharing state.
+    """
+
+    def __init__(self, precision=14, registers=None):
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(registers) if registers is not None else bytearray(self.size)
+
+    def add(self, value):
+        import hashlib
+
+        hashed = int.from_bytes(hashlib.blake2b(value, digest_size=8).digest(), 'big')
+        index = hashed >> (64 - self.precision)
+        remainder_bits = 64 - self.precision
+        remainder = hashed & ((1 << remainder_bits) - 1)
+        rank = remainder_bits - remainder.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        for index, rank in enumerate(other.registers):
+            if rank > self.registers[index]:
+                self.registers[index] = rank
+
+    def count(self):
+        import math
+
+        alpha = 0.7213 / (1 + 1.079 / self.size)
+        estimate = alpha * self.size * self.size / sum(2.0 ** -rank for rank in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.size and zeros:
+            # Small-range correction (linear counting)
+            estimate = self.size * math.log(self.size / zeros)
+        return int(round(estimate))
+
+
+def _split_line_blocks(file_path, block_size):
+    """Split a file into (start, end) byte ranges that end on line boundaries."""
+    import mmap
+
+    file_size = os.path.getsize(file_path)
+    if file_size == 0:
+        return []
+
+    blocks = []
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < file_size:
+            end = mm.find(b'\n', min(start + block_size, file_size) - 1)
+            end = file_size if end == -1 else end + 1
+            blocks.append((start, end))
+            start = end
+    return blocks
+
+
+def _scan_student_id_block(task):
+    """
+    Process-pool worker: extract student IDs from one memory-mapped block.
+
+    Args:
+        task (tuple): (file_path, start, end, mode, spill_dir)
+
+    Returns:
+        set of ID bytes ("exact"), HyperLogLog registers ("approximate") or
+        the path of a sorted run file of unique IDs ("external")
+    """
+    import mmap
+
+    file_path, start, end, mode, spill_dir = task
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        matches = _STUDENT_ID_PATTERN.finditer(mm, start, end)
+
+        if mode == "approximate":
+            sketch = HyperLogLog()
+            for match in matches:
+                sketch.add(match.group(1))
+            return bytes(sketch.registers)
+
+        ids = {match.group(1) for match in matches}
+
+    if mode == "external":
+        run_path = os.path.join(spill_dir, f"run_{start}.txt")
+        with open(run_path, 'wb') as run_file:
+            run_file.writelines(student_id + b'\n' for student_id in sorted(ids))
+        return run_path
+
+    return ids
+
+
+def count_unique_student_ids(file_path, mode="auto", processes=None,
+                             block_size=64 * 1024 * 1024, memory_budget=512 * 1024 * 1024):
+    """
+    Count unique student IDs in a roster dump without reading it line by line.
+
+    The file is split into line-aligned blocks that are scanned with a
+    precompiled byte regex over a memory map, in parallel when there is more
+    than one block.
+
+    Args:
+        file_path (str): Path to the roster text file
+        mode (str): "exact" (merged in-memory sets), "approximate"
+            (HyperLogLog), "external" (sorted runs spilled to disk and merged)
+            or "auto" (exact, or external when the file exceeds memory_budget)
+        processes (int, optional): Worker processes (defaults to CPU count)
+        block_size (int): Target bytes per block
+        memory_budget (int): File size above which "auto" spills to disk
+
+    Returns:
+        int: Number of unique IDs (an estimate in approximate mode)
+    """
+    import heapq
+    import shutil
+    from concurrent.futures import ProcessPoolExecutor
+
+    if mode == "auto":
+        mode = "external" if os.path.getsize(file_path) > memory_budget else "exact"
+    print(f"Counting unique student IDs in {mode} mode")
+
+    spill_dir = tempfile.mkdtemp() if mode == "external" else None
+    tasks = [(file_path, start, end, mode, spill_dir) for start, end in _split_line_blocks(file_path, block_size)]
+
+    try:
+        if len(tasks) > 1 and processes != 1:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                results = list(executor.map(_scan_student_id_block, tasks))
+        else:
+            results = [_scan_student_id_block(task) for task in tasks]
+
+        if mode == "approximate":
+            sketch = HyperLogLog()
+            for registers in results:
+                sketch.merge(HyperLogLog(registers=registers))
+            return sketch.count()
+
+        if mode == "external":
+            run_files = [open(run_path, 'rb') for run_path in results]
+            try:
+                unique_count = 0
+                previous = None
+                for student_id in heapq.merge(*run_files):
+                    if student_id != previous:
+                        unique_count += 1
+                        previous = student_id
+                return unique_count
+            finally:
+                for run_file in run_files:
+                    run_file.close()
+
+        unique_ids = set()
+        for ids in results:
+            unique_ids.update(ids)
+        return len(unique_ids)
+    finally:
+        if spill_dir:
+            shutil.rmtree(spill_dir, ignore_errors=True)
+
+
 def ga5_second_solution(query=None):
     """
     Extract and count unique students from a text file based on student IDs.
@@ -8386,7 +11508,19 @@ def ga5_second_solution(query=None):
             count_type = "total_students"
             print("Query requests count of all student records (including duplicates)")
     
+    # Unique counts go through the block-parallel scanner; "approximate" or
+    # "estimate" in the query switches to the HyperLogLog sketch
+    count_mode = "auto"
+    if query and re.search(r'\b(approximate|approx|estimate)\b', query, re.IGNORECASE):
+        count_mode = "approximate"
+    
     try:
+        if count_type == "unique_students":
+            unique_students = count_unique_student_ids(file_path, mode=count_mode)
+            qualifier = "approximately " if count_mode == "approximate" else ""
+            print(f"Found {qualifier}{unique_students} unique students")
+            return f"There are {qualifier}{unique_students} unique students in the file."
+        
         # Read and process the file
         student_ids = []
         marks_values = []
@@ -8416,12 +11550,7 @@ def ga5_second_solution(query=None):
                         marks_values.append(0)
         
         # Calculate results based on count type
-        if count_type == "unique_students":
-            unique_students = len(set(student_ids))
-            result = f"There are {unique_students} unique students in the file."
-            print(f"Found {unique_students} unique students out of {len(student_ids)} total records")
-            
-        elif count_type == "total_marks":
+        if count_type == "total_marks":
             total_marks = sum(marks_values)
             result = f"The total of all student marks is {total_marks}."
             print(f"Calculated total marks: {total_marks}")
@@ -8778,6 +11907,146 @@ def ga5_fourth_solution(query=None):
         print(f"Error processing log file: {str(e)}")
         traceback.print_exc()
         return f"Error: {str(e)}"
+# Phonetic city index over sales records (used by ga5_fifth_solution)
+_CITY_INDEX_CACHE = {}
+
+
+class PhoneticCityIndex:
+    """
+    Phonetic index over the cities in a sales dataset.
+
+    Built once per dataset: Soundex/Metaphone codes are computed per distinct
+    spelling (not per row), every spelling is mapped to the most frequent
+    spelling in its Soundex cluster, and units are pre-aggregated per
+    (canonical city, product) as sorted values with prefix sums so threshold
+    queries are a binary search.
+    """
+
+    def __init__(self, sales_data):
+        import jellyfish
+        from collections import defaultdict
+
+        self.skipped_records = 0
+        variant_counts = defaultdict(int)
+        variant_sales = defaultdict(list)  # (city spelling, product) -> units
+
+        for entry in sales_data:
+            if 'city' not in entry or 'product' not in entry or 'sales' not in entry:
+                self.skipped_records += 1
+                continue
+            entry_city = entry['city'].strip() if entry['city'] else ""
+            entry_product = entry['product'].strip() if entry['product'] else ""
+            if not entry_city or not entry_product:
+                continue
+            variant_counts[entry_city] += 1
+            variant_sales[(entry_city, entry_product.lower())].append(entry['sales'])
+
+        # Soundex clusters; the most frequent spelling is canonical
+        soundex_buckets = defaultdict(list)
+        for variant in variant_counts:
+            soundex_buckets[jellyfish.soundex(variant)].append(variant)
+
+        self.city_mapping = {}
+        self.soundex_index = {}
+        for code, variants in soundex_buckets.items():
+            canonical = max(variants, key=lambda v: variant_counts[v])
+            self.soundex_index[code] = canonical
+            for variant in variants:
+                self.city_mapping[variant] = canonical
+
+        self.metaphone_index = defaultdict(set)
+        for variant, canonical in self.city_mapping.items():
+            self.metaphone_index[jellyfish.metaphone(variant)].add(canonical)
+        self.lower_mapping = {variant.lower(): canonical for variant, canonical in self.city_mapping.items()}
+
+        # Pre-aggregated (canonical city, product) table
+        grouped = defaultdict(list)
+        for (variant, product), units in variant_sales.items():
+            grouped[(self.city_mapping[variant].lower(), product)].extend(units)
+
+        self.units_table = {}
+        for key, units in grouped.items():
+            units.sort()
+            prefix_sums = [0]
+            for value in units:
+                prefix_sums.append(prefix_sums[-1] + value)
+            self.units_table[key] = (units, prefix_sums)
+
+    @classmethod
+    def for_file(cls, json_file_path):
+        """Load (or reuse) the index for a sales JSON file, cached by content hash."""
+        content_hash = file_manager.content_hash(json_file_path)
+        if content_hash in _CITY_INDEX_CACHE:
+            print("Using cached phonetic city index")
+            return _CITY_INDEX_CACHE[content_hash]
+
+        with open(json_file_path, 'r', encoding='utf-8') as f:
+            sales_data = json.load(f)
+        print(f"Loaded {len(sales_data)} sales records")
+
+        index = cls(sales_data)
+        if content_hash:
+            _CITY_INDEX_CACHE[content_hash] = index
+        return index
+
+    def resolve_city(self, city, threshold=0.7):
+        """
+        Map a city name to its canonical spelling.
+
+        Tries an exact spelling, then the Soundex and Metaphone buckets, and only
+        falls back to a Jaro-Winkler scan of the distinct spellings.
+
+        Returns:
+            tuple: (canonical name or None, how it was matched)
+        """
+        import jellyfish
+
+        target = city.strip()
+        if target.lower() in self.lower_mapping:
+            return self.lower_mapping[target.lower()], "exact"
+
+        soundex_code = jellyfish.soundex(target)
+        if soundex_code in self.soundex_index:
+            return self.soundex_index[soundex_code], "soundex"
+
+        candidates = self.metaphone_index.get(jellyfish.metaphone(target))
+        if candidates and len(candidates) == 1:
+            return next(iter(candidates)), "metaphone"
+
+        best_similarity = -1
+        best_canonical = None
+        for variant, canonical in self.city_mapping.items():
+            similarity = jellyfish.jaro_winkler_similarity(variant.lower(), target.lower())
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_canonical = canonical
+        if best_similarity >= threshold:
+            return best_canonical, "jaro_winkler"
+        return None, "none"
+
+    def units_sold(self, city_canonical, product, operator=">=", threshold=0):
+        """
+        Sum units for a (canonical city, product) pair over transactions whose
+        units satisfy `units <operator> threshold`.
+
+        Returns:
+            tuple: (total units, number of matching transactions)
+        """
+        from bisect import bisect_left, bisect_right
+
+        units, prefix_sums = self.units_table.get((city_canonical.lower(), product.lower()), ([], [0]))
+        low = bisect_left(units, threshold)
+        high = bisect_right(units, threshold)
+        start, end = {
+            ">=": (low, len(units)),
+            ">": (high, len(units)),
+            "<=": (0, high),
+            "<": (0, low),
+            "==": (low, high)
+        }[operator]
+        return prefix_sums[end] - prefix_sums[start], end - start
+
+
 def ga5_fifth_solution(query=None):
     """
     Clean and analyze sales data from JSON file with phonetic city name matching.
@@ -8789,9 +12058,7 @@ def ga5_fifth_solution(query=None):
         str: Total units sold for the specified criteria
     """
     import json
-    from collections import defaultdict
     import re
-    import jellyfish  # For phonetic matching
     
     print("Starting sales data analysis with phonetic clustering...")
     
@@ -8871,98 +12138,23 @@ def ga5_fifth_solution(query=None):
     print(f"Using JSON file: {json_file_path}")
     
     try:
-        # Load the JSON data
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            sales_data = json.load(f)
-        
-        print(f"Loaded {len(sales_data)} sales records")
-        
-        # Group cities by phonetic similarity (using Soundex)
-        city_clusters = defaultdict(list)
-        
-        # First pass: Create phonetic clusters
-        for entry in sales_data:
-            if 'city' in entry and entry['city']:
-                city_name = entry['city'].strip()
-                # Get phonetic code
-                soundex_code = jellyfish.soundex(city_name)
-                city_clusters[soundex_code].append(city_name)
-        
-        # Second pass: Create a mapping from each spelling to canonical name
-        # Use the most frequent spelling as canonical
-        city_mapping = {}
-        for phonetic_code, variants in city_clusters.items():
-            # Count occurrences of each spelling
-            variant_counts = defaultdict(int)
-            for variant in variants:
-                variant_counts[variant] += 1
-            
-            # Use most frequent spelling as canonical
-            canonical = max(variant_counts.items(), key=lambda x: x[1])[0]
-            
-            # Map all variants to canonical
-            for variant in variants:
-                city_mapping[variant] = canonical
-        
-        # Find the best match for our target city
-        target_city_canonical = None
-        best_similarity = -1
-        
-        for original_city, canonical_city in city_mapping.items():
-            # Calculate string similarity between original city and our target
-            similarity = jellyfish.jaro_winkler_similarity(original_city.lower(), city.lower())
-            
-            if similarity > best_similarity:
-                best_similarity = similarity
-                target_city_canonical = canonical_city
-        
-        if best_similarity < 0.7:  # Threshold for a good match
+        # Build (or reuse) the phonetic index for this dataset
+        city_index = PhoneticCityIndex.for_file(json_file_path)
+        if city_index.skipped_records:
+            print(f"Skipped {city_index.skipped_records} invalid entries")
+        
+        # Find the canonical name for our target city
+        target_city_canonical, match_type = city_index.resolve_city(city)
+        if target_city_canonical is None:
             print(f"Warning: No good phonetic match found for '{city}', using exact match")
             target_city_canonical = city
         else:
-            print(f"Mapped '{city}' to canonical city name '{target_city_canonical}'")
-        
-        # Filter and aggregate sales data
-        total_units = 0
-        matching_transactions = 0
+            print(f"Mapped '{city}' to canonical city name '{target_city_canonical}' ({match_type})")
         
-        for entry in sales_data:
-            if 'city' not in entry or 'product' not in entry or 'sales' not in entry:
-                print(f"Skipping invalid entry: {entry}")
-                continue
-                
-            entry_city = entry['city'].strip() if entry['city'] else ""
-            entry_product = entry['product'].strip() if entry['product'] else ""
-            
-            # Skip entries without city or product
-            if not entry_city or not entry_product:
-                continue
-                
-            # Get canonical city name
-            canonical_city = city_mapping.get(entry_city, entry_city)
-            
-            # Check if this entry matches our criteria
-            if (entry_product.lower() == product.lower() and 
-                canonical_city.lower() == target_city_canonical.lower()):
-                
-                # Apply the comparison operator
-                sales_value = entry['sales']
-                
-                if comparison_operator == ">=" and sales_value >= min_units:
-                    total_units += sales_value
-                    matching_transactions += 1
-                elif comparison_operator == ">" and sales_value > min_units:
-                    total_units += sales_value
-                    matching_transactions += 1
-                elif comparison_operator == "<=" and sales_value <= min_units:
-                    total_units += sales_value
-                    matching_transactions += 1
-                elif comparison_operator == "<" and sales_value < min_units:
-                    total_units += sales_value
-                    matching_transactions += 1
-                elif comparison_operator == "==" and sales_value == min_units:
-                    total_units += sales_value
-                    matching_transactions += 1
+        # Look up the pre-aggregated units for this city and product
+        total_units, matching_transactions = city_index.units_sold(
+            target_city_canonical, product, comparison_operator, min_units
+        )
         
         print(f"Found {matching_transactions} matching transactions")
         
@@ -9067,6 +12259,255 @@ def ga5_sixth_solution(query=None):
         import traceback
         traceback.print_exc()
         return f"Error: {str(e)}"
+# Streaming JSON key statistics (used by ga5_seventh_solution)
+_JSON_KEY_STATS_CACHE = {}
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_JSON_NUMBER = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?')
+_JSON_LITERALS = {'true': ('boolean', True), 'false': ('boolean', False), 'null': ('null', None)}
+
+
+def iter_json_tokens(f, chunk_size=64 * 1024):
+    """
+    Tokenize a JSON text stream incrementally without loading it into memory.
+
+    Args:
+        f: Text file object opened for reading
+        chunk_size (int): Number of characters to read per refill
+
+    Yields:
+        tuple: (token_type, value) where token_type is one of
+        '{', '}', '[', ']', ':', ',', 'string', 'number', 'boolean', 'null'
+    """
+    from json.decoder import scanstring
+
+    buf = ''
+    pos = 0
+    eof = False
+
+    while True:
+        pos = _JSON_WHITESPACE.match(buf, pos).end()
+        # Keep a little lookahead so literals and numbers are never split
+        if len(buf) - pos < 64 and not eof:
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buf = buf[pos:] + chunk
+            pos = 0
+            continue
+        if pos >= len(buf):
+            return
+
+        char = buf[pos]
+        if char in '{}[]:,':
+            pos += 1
+            yield (char, None)
+        elif char == '"':
+            try:
+                value, end = scanstring(buf, pos + 1)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # String crosses the chunk boundary - pull in more text
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            pos = end
+            yield ('string', value)
+        elif char == '-' or char.isdigit():
+            match = _JSON_NUMBER.match(buf, pos)
+            if not match:
+                raise json.JSONDecodeError("Invalid number", buf, pos)
+            if match.end() == len(buf) and not eof:
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            text = match.group(0)
+            pos = match.end()
+            if '.' in text or 'e' in text or 'E' in text:
+                yield ('number', float(text))
+            else:
+                yield ('number', int(text))
+        else:
+            for literal, token in _JSON_LITERALS.items():
+                if buf.startswith(literal, pos):
+                    pos += len(literal)
+                    yield token
+                    break
+            else:
+                raise json.JSONDecodeError("Unexpected character", buf, pos)
+
+
+def iter_json_events(f, chunk_size=64 * 1024):
+    """
+    Parse a JSON text stream into ijson-style (prefix, event, value) tuples.
+
+    Uses ijson when it is installed and falls back to iter_json_tokens
+    otherwise. Containers are tracked with an explicit stack, so arbitrarily
+    deep documents never hit the recursion limit.
+
+    Args:
+        f: Text file object opened for reading
+        chunk_size (int): Number of characters to read per refill
+
+    Yields:
+        tuple: (prefix, event, value) with events start_map, map_key, end_map,
+        start_array, end_array, string, number, boolean and null
+    """
+    try:
+        import ijson
+        for prefix, event, value in ijson.parse(f):
+            yield prefix, event, value
+        return
+    except ImportError:
+        pass
+
+    path = []  # Prefix components of the current position
+    stack = []  # Container types: 'map' or 'array'
+    expect_key = False
+
+    for token, value in iter_json_tokens(f, chunk_size):
+        if token == ',':
+            if stack and stack[-1] == 'map':
+                path.pop()
+                expect_key = True
+            continue
+        if token == ':':
+            continue
+
+        if token in ('}', ']'):
+            if token == '}' and path and not expect_key:
+                path.pop()
+            stack.pop()
+            if token == ']':
+                path.pop()
+            expect_key = False
+            yield '.'.join(path), 'end_map' if token == '}' else 'end_array', None
+            continue
+
+        if expect_key:
+            yield '.'.join(path), 'map_key', value
+            path.append(value)
+            expect_key = False
+            continue
+
+        prefix = '.'.join(path)
+        if token == '{':
+            yield prefix, 'start_map', None
+            stack.append('map')
+            expect_key = True
+        elif token == '[':
+            yield prefix, 'start_array', None
+            stack.append('array')
+            path.append('item')
+        else:
+            yield prefix, token, value
+
+
+def scan_json_key_stats(json_file_path, max_path_depth=64):
+    """
+    Collect key, path and value statistics for a JSON file in a single pass.
+
+    The document is streamed event by event, so memory use is bounded by the
+    nesting depth and the number of distinct keys, not by the file size.
+    Results are cached in memory and on disk by the file's content hash.
+
+    Args:
+        json_file_path (str): Path to the JSON file
+        max_path_depth (int): Deepest nesting level recorded in path_counts
+
+    Returns:
+        dict: {
+            "key_counts": {key: occurrences},
+            "path_counts": {dotted.path: occurrences},
+            "value_stats": {key: {"types": {...}, "min", "max", "sum", "numeric"}},
+            "max_depth": int
+        }
+    """
+    content_hash = file_manager.content_hash(json_file_path)
+    if content_hash in _JSON_KEY_STATS_CACHE:
+        print(f"Using cached key statistics for {json_file_path}")
+        return _JSON_KEY_STATS_CACHE[content_hash]
+
+    cache_file = None
+    if content_hash:
+        cache_file = file_manager.cache_path("json_key_stats", content_hash, ".json")
+        if os.path.exists(cache_file):
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+            _JSON_KEY_STATS_CACHE[content_hash] = stats
+            print(f"Loaded key statistics from {cache_file}")
+            return stats
+
+    key_counts = {}
+    path_counts = {}
+    value_stats = {}
+    max_depth = 0
+    depth = 0
+    scalar_events = ('string', 'number', 'boolean', 'null')
+    previous_event, previous_value = None, None
+
+    with open(json_file_path, 'r', encoding='utf-8') as f:
+        for prefix, event, value in iter_json_events(f):
+            if event in ('start_map', 'start_array'):
+                depth += 1
+                max_depth = max(max_depth, depth)
+            elif event in ('end_map', 'end_array'):
+                depth -= 1
+            elif event == 'map_key':
+                key_counts[value] = key_counts.get(value, 0) + 1
+                if depth <= max_path_depth:
+                    key_path = f"{prefix}.{value}" if prefix else value
+                    path_counts[key_path] = path_counts.get(key_path, 0) + 1
+            elif event in scalar_events and previous_event == 'map_key':
+                # Only values that sit directly under a key are attributed to it
+                stats = value_stats.setdefault(
+                    previous_value, {"types": {}, "min": None, "max": None, "sum": 0, "numeric": 0}
+                )
+                stats["types"][event] = stats["types"].get(event, 0) + 1
+                if event == 'number':
+                    number = float(value)
+                    stats["numeric"] += 1
+                    stats["sum"] += number
+                    stats["min"] = number if stats["min"] is None else min(stats["min"], number)
+                    stats["max"] = number if stats["max"] is None else max(stats["max"], number)
+            previous_event, previous_value = event, value
+
+    stats = {
+        "key_counts": key_counts,
+        "path_counts": path_counts,
+        "value_stats": value_stats,
+        "max_depth": max_depth
+    }
+
+    if content_hash:
+        _JSON_KEY_STATS_CACHE[content_hash] = stats
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(stats, f)
+        except OSError as e:
+            print(f"Warning: Could not persist key statistics: {str(e)}")
+
+    return stats
+
+
+def count_json_keys(json_file_path, keys):
+    """
+    Answer several key-occurrence questions from one scan of a JSON file.
+
+    Args:
+        json_file_path (str): Path to the JSON file
+        keys (list): Keys to count
+
+    Returns:
+        dict: {key: occurrences}
+    """
+    key_counts = scan_json_key_stats(json_file_path)["key_counts"]
+    return {key: key_counts.get(key, 0) for key in keys}
+
+
 def ga5_seventh_solution(query=None):
     """
     Count occurrences of a specific key in a nested JSON structure.
@@ -9129,34 +12570,10 @@ def ga5_seventh_solution(query=None):
     json_file_path = file_manager.resolve_file_path(default_json_path, query, "data")
     print(f"Using JSON file: {json_file_path}")
     
-    # Function to recursively count key occurrences in nested JSON
-    def count_key_occurrences(json_data, key):
-        count = 0
-        
-        if isinstance(json_data, dict):
-            # Check keys in this dictionary
-            for k in json_data:
-                if k == key:
-                    count += 1
-                # Recursively check the value
-                count += count_key_occurrences(json_data[k], key)
-                
-        elif isinstance(json_data, list):
-            # Process each item in the list
-            for item in json_data:
-                count += count_key_occurrences(item, key)
-                
-        return count
-    
     try:
-        # Load the JSON data
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            json_data = json.load(f)
-        
-        print(f"JSON file loaded successfully")
-        
-        # Count occurrences of the target key
-        key_count = count_key_occurrences(json_data, target_key)
+        # Stream the document once; statistics for every key are cached by
+        # content hash so follow-up questions about other keys are lookups
+        key_count = count_json_keys(json_file_path, [target_key])[target_key]
         
         print(f"Found {key_count} occurrences of key '{target_key}'")
         
@@ -9172,6 +12589,112 @@ def ga5_seventh_solution(query=None):
         print(f"Error processing JSON file: {str(e)}")
         traceback.print_exc()
         return f"Error: {str(e)}"
+# Shared DuckDB execution engine (used by ga5_eighth_solution)
+_DUCKDB_ENGINE = None
+_DUCKDB_READERS = {
+    '.csv': "read_csv_auto('{path}')",
+    '.parquet': "read_parquet('{path}')",
+    '.json': "read_json_auto('{path}')"
+}
+
+
+class DuckDBEngine:
+    """
+    Persistent in-process DuckDB database shared by the tabular solutions.
+
+    Connections are leased from a pool of cursors on one database, so every
+    lease sees the same tables. Each data file is scanned once into a table
+    named after its content hash; a query only creates cheap per-connection
+    TEMP views that alias those tables under the names the SQL expects.
+    """
+
+    def __init__(self, database=":memory:", pool_size=4):
+        import duckdb
+        import queue
+        import threading
+
+        self.database = duckdb.connect(database)
+        self.pool = queue.Queue()
+        for _ in range(pool_size):
+            self.pool.put(self.database.cursor())
+        self.scanned_tables = {}  # content hash -> table name
+        self.scan_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide engine, creating it on first use."""
+        global _DUCKDB_ENGINE
+        if _DUCKDB_ENGINE is None:
+            _DUCKDB_ENGINE = cls()
+        return _DUCKDB_ENGINE
+
+    def scan_file(self, file_path, connection):
+        """
+        Materialize a CSV/Parquet/JSON file as a table, once per content hash.
+
+        Returns:
+            str: Name of the table holding the file's rows
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext not in _DUCKDB_READERS:
+            raise ValueError(f"Unsupported file type for DuckDB: {ext}")
+
+        content_hash = file_manager.content_hash(file_path)
+        with self.scan_lock:
+            if content_hash not in self.scanned_tables:
+                table_name = f"scan_{content_hash[:16]}"
+                reader = _DUCKDB_READERS[ext].format(path=file_path.replace("'", "''"))
+                connection.execute(f'CREATE TABLE IF NOT EXISTS "{table_name}" AS SELECT * FROM {reader}')
+                self.scanned_tables[content_hash] = table_name
+                print(f"Scanned {file_path} into DuckDB table {table_name}")
+            return self.scanned_tables[content_hash]
+
+    def query(self, sql, files=None):
+        """
+        Run SQL against the given files.
+
+        Args:
+            sql (str): Query to execute
+            files (dict, optional): {table name used in the SQL: file path}
+
+        Returns:
+            tuple: (column names, list of row tuples)
+        """
+        connection = self.pool.get()
+        try:
+            for view_name, file_path in (files or {}).items():
+                table_name = self.scan_file(file_path, connection)
+                connection.execute(f'CREATE OR REPLACE TEMP VIEW "{view_name}" AS SELECT * FROM "{table_name}"')
+            cursor = connection.execute(sql)
+            columns = [column[0] for column in cursor.description]
+            return columns, cursor.fetchall()
+        finally:
+            self.pool.put(connection)
+
+
+def find_data_files_in_query(query, extensions=('.csv', '.parquet', '.json')):
+    """
+    Collect local data files mentioned in a query, keyed by a SQL-safe name
+    derived from the file name (e.g. ".../posts.json" -> "posts").
+
+    Returns:
+        dict: {table name: file path}
+    """
+    files = {}
+    if not query:
+        return files
+
+    ext_pattern = '|'.join(ext.lstrip('.') for ext in extensions)
+    path_pattern = r'([^\s"\'<>|*?]+\.(?:' + ext_pattern + r'))\b'
+    for match in re.finditer(path_pattern, query, re.IGNORECASE):
+        path = match.group(1)
+        if os.path.isfile(path):
+            stem = os.path.splitext(os.path.basename(path))[0]
+            table_name = re.sub(r'\W+', '_', stem).strip('_') or "data"
+            files[table_name] = path
+    return files
+
+
 def ga5_eighth_solution(query=None):
     """
     Generate a flexible DuckDB SQL query based on user requirements.
@@ -9180,7 +12703,8 @@ def ga5_eighth_solution(query=None):
         query (str, optional): Query with specifications for SQL parameters
         
     Returns:
-        str: A DuckDB SQL query meeting the specified requirements
+        str: A DuckDB SQL query meeting the specified requirements, followed by
+        its result when the query references local CSV/Parquet/JSON files
     """
     import re
     
@@ -9286,6 +12810,22 @@ This query:
 3. Returns {target_column} values in {sort_order.lower()}ending order
 """
     
+    # Execution mode: run the query when the data files are available locally
+    data_files = find_data_files_in_query(query)
+    if data_files:
+        print(f"Executing query against: {data_files}")
+        try:
+            columns, rows = DuckDBEngine.shared().query(sql_query, data_files)
+            result += f"""
+Result ({len(rows)} rows):
+{', '.join(columns)}
+""" + "\n".join(", ".join(str(value) for value in row) for row in rows) + "\n"
+        except ImportError:
+            result += "\nDuckDB is not installed; the query was not executed.\n"
+        except Exception as e:
+            print(f"Error executing DuckDB query: {str(e)}")
+            result += f"\nError executing query: {str(e)}\n"
+    
     return result
 def ga5_ninth_solution(query=None):
     """
@@ -9399,6 +12939,62 @@ Later that day, while grabbing coffee, I overheard two people in hushed tones. "
 
 The hair on my neck stood up. Could this be connected to the mysterious text? I decided to investigate the old library across town.
 """
+# Array-based tile reassembly (used by ga5_tenth_solution)
+def tile_view(pixels, grid_size):
+    """
+    View an (H, W[, C]) pixel array as a (rows, cols, h, w[, C]) grid of tiles.
+
+    Splitting axes never needs a copy, so the result is a view of `pixels`.
+    Pixels beyond the last full tile on the right/bottom are left out.
+    """
+    rows, cols = grid_size
+    tile_height = pixels.shape[0] // rows
+    tile_width = pixels.shape[1] // cols
+    trimmed = pixels[:rows * tile_height, :cols * tile_width]
+    tiles = trimmed.reshape((rows, tile_height, cols, tile_width) + pixels.shape[2:])
+    return tiles.swapaxes(1, 2)
+
+
+def reassemble_tiles(pixels, mapping_data, grid_size):
+    """
+    Undo a tile scramble with a single fancy-indexing gather.
+
+    Args:
+        pixels: (H, W[, C]) array of the scrambled image
+        mapping_data (list): (orig_row, orig_col, scrambled_row, scrambled_col)
+        grid_size (tuple): (rows, cols)
+
+    Returns:
+        array: Reconstructed image; tiles missing from the mapping and any
+        leftover edge pixels are zero
+
+    Raises:
+        ValueError: If a mapping entry refers to a tile outside the grid
+    """
+    import numpy as np
+
+    rows, cols = grid_size
+    for entry in mapping_data:
+        if not (0 <= entry[0] < rows and 0 <= entry[2] < rows and 0 <= entry[1] < cols and 0 <= entry[3] < cols):
+            raise ValueError(f"Mapping entry {entry} is outside the {rows}x{cols} grid")
+    tiles = tile_view(pixels, grid_size)
+
+    # Source tile for every destination slot; unmapped slots point at a zero tile
+    source = np.full((rows, cols, 2), -1, dtype=np.intp)
+    for orig_row, orig_col, scrambled_row, scrambled_col in mapping_data:
+        source[orig_row, orig_col] = (scrambled_row, scrambled_col)
+    unmapped = source[..., 0] < 0
+    source[unmapped] = 0
+
+    out = np.zeros_like(pixels)
+    gathered = tiles[source[..., 0], source[..., 1]]
+    if unmapped.any():
+        gathered[unmapped] = 0
+    out_tiles = tile_view(out, grid_size)
+    out_tiles[...] = gathered
+    return out
+
+
 def ga5_tenth_solution(query=None):
     """
     Reconstruct an original image from scrambled pieces using a mapping file.
@@ -9476,41 +13072,24 @@ def ga5_tenth_solution(query=None):
         print(f"Extracted {len(mapping_data)} mapping entries from query")
     
     try:
-        # Load the scrambled image
-        scrambled_img = Image.open(img_path)
-        print(f"Loaded scrambled image: {scrambled_img.format}, {scrambled_img.size}")
-        
-        # Calculate the dimensions of each piece
-        img_width, img_height = scrambled_img.size
-        rows, cols = grid_size
-        piece_width = img_width // cols
-        piece_height = img_height // rows
-        
-        # Create a new image for the reconstructed result
-        reconstructed_img = Image.new(scrambled_img.mode, scrambled_img.size)
-        
-        # Process each mapping entry
-        for orig_row, orig_col, scrambled_row, scrambled_col in mapping_data:
-            # Calculate the coordinates for the scrambled piece
-            x1 = scrambled_col * piece_width
-            y1 = scrambled_row * piece_height
-            x2 = x1 + piece_width
-            y2 = y1 + piece_height
-            
-            # Extract the piece from the scrambled image
-            piece = scrambled_img.crop((x1, y1, x2, y2))
-            
-            # Calculate the coordinates for the original position
-            dest_x = orig_col * piece_width
-            dest_y = orig_row * piece_height
-            
-            # Place the piece in its original position
-            reconstructed_img.paste(piece, (dest_x, dest_y))
+        # Load the scrambled image (decoded once and cached by content hash)
+        pixels, mode = ImageStore.shared().get_array(img_path)
+        print(f"Loaded scrambled image: {pixels.shape[1]}x{pixels.shape[0]} {mode}")
+        
+        # Move every tile with one array gather; a mapping beyond the grid
+        # would silently change the tile size, so it is rejected
+        try:
+            reconstructed = reassemble_tiles(pixels, mapping_data, grid_size)
+        except ValueError as e:
+            print(f"Invalid mapping: {e}")
+            return f"Error: {str(e)}. Check the grid size and the mapping table."
         
         # Create output directory if it doesn't exist
         output_dir = os.path.join(os.path.dirname(img_path), "output")
         os.makedirs(output_dir, exist_ok=True)
         
+        reconstructed_img = Image.fromarray(reconstructed)
+        
         # Save the reconstructed image
         output_path = os.path.join(output_dir, "reconstructed_jigsaw.png")
         reconstructed_img.save(output_path, format="PNG")